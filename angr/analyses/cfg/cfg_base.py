@@ -1,4 +1,5 @@
 
+import bisect
 import logging
 from collections import defaultdict
 
@@ -125,6 +126,11 @@ class CFGBase(Analysis):
         # Get all executable memory regions
         self._exec_mem_regions = self._executable_memory_regions(None, self._force_segment)
         self._exec_mem_region_size = sum([(end - start) for start, end in self._exec_mem_regions])
+        self._exec_mem_region_starts, self._exec_mem_region_ends, self._exec_mem_region_max_ends = \
+            self._index_regions(self._exec_mem_regions)
+        # whether each executable memory region is exactly one section (or lies in an object without sections).
+        # computed on demand by _exec_mem_region_is_section()
+        self._exec_mem_region_section_flags = None
 
         # initialize UnresolvableJumpTarget and UnresolvableCallTarget SimProcedure
         # but we do not want to hook the same symbol multiple times
@@ -621,6 +627,38 @@ class CFGBase(Analysis):
 
         return memory_regions
 
+    @staticmethod
+    def _index_regions(regions):
+        """
+        Build an index over a sorted list of regions for bisect-based lookups. Regions may overlap.
+
+        :param list regions:    A list of tuples (beginning_address, end_address), sorted by their beginning addresses.
+        :return:                A tuple of three lists: the beginning addresses, the end addresses, and the running
+                                maximum of the end addresses.
+        :rtype:                 tuple
+        """
+
+        starts = [ start for start, _ in regions ]
+        ends = [ end for _, end in regions ]
+        max_ends = [ ]
+        max_end = None
+        for end in ends:
+            if max_end is None or end > max_end:
+                max_end = end
+            max_ends.append(max_end)
+        return starts, ends, max_ends
+
+    def _exec_mem_region_index(self, addr):
+        """
+        Get the index of the last executable memory region that begins at or before the address.
+
+        :param int addr:    The address.
+        :return:            The index of the region, or -1 if all regions begin after the address.
+        :rtype:             int
+        """
+
+        return bisect.bisect_right(self._exec_mem_region_starts, addr) - 1
+
     def _addr_in_exec_memory_regions(self, addr):
         """
         Test if the address belongs to an executable memory region.
@@ -630,10 +668,55 @@ class CFGBase(Analysis):
         :rtype: bool
         """
 
-        for start, end in self._exec_mem_regions:
-            if start <= addr < end:
-                return True
-        return False
+        idx = self._exec_mem_region_index(addr)
+        return idx >= 0 and addr < self._exec_mem_region_max_ends[idx]
+
+    def _addrs_in_exec_memory_regions(self, addrs):
+        """
+        Test if each address in a collection belongs to an executable memory region. The addresses are sorted and
+        tested in a single pass over the regions.
+
+        :param addrs:   A collection of addresses to test.
+        :return:        A list of booleans, one for each address, in the same order as the addresses.
+        :rtype:         list
+        """
+
+        addrs = list(addrs)
+        results = [ False ] * len(addrs)
+        starts, max_ends = self._exec_mem_region_starts, self._exec_mem_region_max_ends
+
+        idx = -1
+        for i in sorted(range(len(addrs)), key=addrs.__getitem__):
+            addr = addrs[i]
+            while idx + 1 < len(starts) and starts[idx + 1] <= addr:
+                idx += 1
+            results[i] = idx >= 0 and addr < max_ends[idx]
+        return results
+
+    def _exec_mem_region_is_section(self, idx):
+        """
+        Check if an executable memory region spans exactly one section, or lies in an object that has no sections.
+        In both cases, any two addresses inside the region belong to the same section.
+
+        :param int idx: Index of the region in self._exec_mem_regions.
+        :return:        True if the region is known to cover a single section, False otherwise.
+        :rtype:         bool
+        """
+
+        if self._exec_mem_region_section_flags is None:
+            flags = [ ]
+            for start, end in self._exec_mem_regions:
+                obj = self.project.loader.find_object_containing(start, membership_check=False)
+                if obj is None:
+                    flags.append(False)
+                elif not obj.sections:
+                    flags.append(True)
+                else:
+                    section = obj.find_section_containing(start)
+                    flags.append(section is not None and section.min_addr == start and section.max_addr == end)
+            self._exec_mem_region_section_flags = flags
+
+        return self._exec_mem_region_section_flags[idx]
 
     def _addrs_belong_to_same_section(self, addr_a, addr_b):
         """
@@ -646,6 +729,13 @@ class CFGBase(Analysis):
         :rtype:             bool
         """
 
+        # fast path: both addresses are inside the same executable section
+        idx = self._exec_mem_region_index(addr_a)
+        if idx >= 0 and addr_a < self._exec_mem_region_ends[idx] and \
+                self._exec_mem_region_starts[idx] <= addr_b < self._exec_mem_region_ends[idx] and \
+                self._exec_mem_region_is_section(idx):
+            return True
+
         obj = self.project.loader.find_object_containing(addr_a, membership_check=False)
 
         if obj is None:
@@ -1,3 +1,4 @@
+import bisect
 import itertools
 import logging
 import math
@@ -25,6 +26,7 @@ from ...utils.constants import DEFAULT_STATEMENT
 from ..forward_analysis import ForwardAnalysis
 from .cfg_arch_options import CFGArchOptions
 from .cfg_base import CFGBase
+from .cfg_fast_workers import lift_blocks_in_parallel
 from .segment_list import SegmentList
 
 
@@ -446,6 +448,7 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
                  model=None,
                  use_patches=False,
                  elf_eh_frame=True,
+                 workers=None,
                  start=None,  # deprecated
                  end=None,  # deprecated
                  collect_data_references=None, # deprecated
@@ -491,6 +494,9 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
         :param bool detect_tail_calls:  Enable aggressive tail-call optimization detection.
         :param bool elf_eh_frame:       Retrieve function starts (and maybe sizes later) from the .eh_frame of ELF
                                         binaries.
+        :param int workers:             Number of worker processes that lift blocks reachable from function symbols
+                                        and prologues before CFG recovery starts. The CFG is still built in the current
+                                        process, and is identical to the one recovered without workers.
         :param int start:               (Deprecated) The beginning address of CFG recovery.
         :param int end:                 (Deprecated) The end address of CFG recovery.
         :param CFGArchOptions arch_options: Architecture-specific options.
@@ -577,6 +583,7 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
         self._regions_size = sum((b - a) for a, b in regions)
         # initial self._regions as a sorted dict
         self._regions = SortedDict(regions)
+        self._region_starts, self._region_ends, self._region_max_ends = self._index_regions(regions)
 
         self._pickle_intermediate_results = pickle_intermediate_results
 
@@ -584,6 +591,7 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
         self._use_function_prologues = function_prologues
         self._force_complete_scan = force_complete_scan
         self._use_elf_eh_frame = elf_eh_frame
+        self._workers = workers
 
         if heuristic_plt_resolving is None:
             # If unspecified, we only enable heuristic PLT resolving when there is at least one binary loaded with the
@@ -629,6 +637,9 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
         self._function_prologue_addrs = None
         self._remaining_function_prologue_addrs = None
 
+        # blocks lifted by worker processes
+        self._prelifted_blocks = None
+
         #
         # Variables used during analysis
         #
@@ -725,12 +736,8 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
         :rtype:             bool
         """
 
-        try:
-            start_addr = next(self._regions.irange(maximum=address, reverse=True))
-        except StopIteration:
-            return False
-        else:
-            return address < self._regions[start_addr]
+        idx = bisect.bisect_right(self._region_starts, address) - 1
+        return idx >= 0 and address < self._region_max_ends[idx]
 
     def _get_min_addr(self):
         """
@@ -756,13 +763,13 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
         :rtype:             int
         """
 
-        if self._inside_regions(address):
+        idx = bisect.bisect_right(self._region_starts, address) - 1
+        if idx >= 0 and address < self._region_max_ends[idx]:
             return address
 
-        try:
-            return next(self._regions.irange(minimum=address, reverse=False))
-        except StopIteration:
-            return None
+        if idx + 1 < len(self._region_starts):
+            return self._region_starts[idx + 1]
+        return None
 
     # Methods for scanning the entire image
 
@@ -795,20 +802,9 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
             if curr_addr % alignment > 0:
                 curr_addr = curr_addr - (curr_addr % alignment) + alignment
 
-        # Make sure curr_addr exists in binary
-        accepted = False
-        for start, end in self._regions.items():
-            if start <= curr_addr < end:
-                # accept
-                accepted = True
-                break
-            if curr_addr < start:
-                # accept, but we are skipping the gap
-                accepted = True
-                curr_addr = start
-                break
-
-        if not accepted:
+        # Make sure curr_addr exists in binary. if it is in a gap, skip to the beginning of the next region
+        curr_addr = self._next_address_in_regions(curr_addr)
+        if curr_addr is None:
             # No memory available!
             return None
 
@@ -1012,13 +1008,17 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
         self._updated_nonreturning_functions = set()
 
         if self._use_function_prologues and self.project.concrete_target is None:
-            self._function_prologue_addrs = sorted(self._func_addrs_from_prologues())
-            # make a copy of those prologue addresses, so that we can pop from the list
-            self._remaining_function_prologue_addrs = self._function_prologue_addrs[::]
+            self._function_prologue_addrs = self._func_addrs_from_prologues()
+            # make a reversed copy of those prologue addresses, so that we can pop the lowest address from the end of
+            # the list
+            self._remaining_function_prologue_addrs = self._function_prologue_addrs[::-1]
 
             # make function_prologue_addrs a set for faster lookups
             self._function_prologue_addrs = set(self._function_prologue_addrs)
 
+        if self._workers is not None and self._workers > 1:
+            self._prelift_blocks(starting_points)
+
     def _pre_job_handling(self, job):  # pylint:disable=arguments-differ
         """
         Some pre job-processing tasks, like update progress bar.
@@ -1153,8 +1153,7 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
 
         if self._use_function_prologues and self._remaining_function_prologue_addrs:
             while self._remaining_function_prologue_addrs:
-                prolog_addr = self._remaining_function_prologue_addrs[0]
-                self._remaining_function_prologue_addrs = self._remaining_function_prologue_addrs[1:]
+                prolog_addr = self._remaining_function_prologue_addrs.pop()
                 if self._seg_list.is_occupied(prolog_addr):
                     continue
 
@@ -1186,6 +1185,9 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
 
     def _post_analysis(self):
 
+        # blocks that were lifted by workers but never reached are not needed anymore
+        self._prelifted_blocks = None
+
         self._make_completed_functions()
 
         if self._normalize:
@@ -1303,50 +1305,57 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
         """
         Scan the entire program image for function prologues, and start code scanning at those positions
 
-        :return: A list of possible function addresses
+        :return: A sorted list of possible function addresses
         """
 
-        # Pre-compile all regexes
+        # Pre-compile all regexes. Each pattern is matched on its own: matches of one pattern do not overlap, which
+        # determines some of the function starts that we find
         regexes = list()
         for ins_regex in self.project.arch.function_prologs:
             r = re.compile(ins_regex)
-            regexes.append(r)
+            regexes.append((r, 0))
         # EDG says: I challenge anyone bothering to read this to come up with a better
         # way to handle CPU modes that affect instruction decoding.
         # Since the only one we care about is ARM/Thumb right now
         # we have this gross hack. Sorry about that.
-        thumb_regexes = list()
         if hasattr(self.project.arch, 'thumb_prologs'):
             for ins_regex in self.project.arch.thumb_prologs:
                 # Thumb prologues are found at even addrs, but their actual addr is odd!
                 # Isn't that great?
                 r = re.compile(ins_regex)
-                thumb_regexes.append(r)
+                regexes.append((r, 1))
+
+        # RVAs translate to mapped addresses by adding a constant. translate the executable memory regions to RVAs once
+        # instead of translating each match
+        mapped_base = AT.from_rva(0, self._binary).to_mva()
+        exec_regions = sorted((start - mapped_base, end - mapped_base) for start, end in self._exec_mem_regions)
+        alignment = self.project.arch.instruction_alignment
 
-        # Construct the binary blob first
-        unassured_functions = [ ]
+        unassured_functions = set()
 
         for start_, bytes_ in self._binary.memory.backers():
-            for regex in regexes:
-                # Match them!
-                for mo in regex.finditer(bytes_):
-                    position = mo.start() + start_
-                    if position % self.project.arch.instruction_alignment == 0:
-                        mapped_position = AT.from_rva(position, self._binary).to_mva()
-                        if self._addr_in_exec_memory_regions(mapped_position):
-                            unassured_functions.append(mapped_position)
-            # HACK part 2: Yes, i really have to do this
-            for regex in thumb_regexes:
-                # Match them!
+            end_ = start_ + len(bytes_)
+            # the executable parts of this backer
+            ranges = [ (max(start_, region_start), min(end_, region_end)) for region_start, region_end in exec_regions
+                       if max(start_, region_start) < min(end_, region_end) ]
+            if not ranges:
+                continue
+
+            for regex, delta in regexes:
+                # always match from the beginning of the backer, so that we get the same non-overlapping matches, but
+                # stop after the last executable range
+                idx = 0
                 for mo in regex.finditer(bytes_):
                     position = mo.start() + start_
-                    if position % self.project.arch.instruction_alignment == 0:
-                        mapped_position = AT.from_rva(position, self._binary).to_mva()
-                        if self._addr_in_exec_memory_regions(mapped_position):
-                            unassured_functions.append(mapped_position+1)
+                    while idx < len(ranges) and position >= ranges[idx][1]:
+                        idx += 1
+                    if idx == len(ranges):
+                        break
+                    if position >= ranges[idx][0] and position % alignment == 0:
+                        unassured_functions.add(position + mapped_base + delta)
 
         l.info("Found %d functions with prologue scanning.", len(unassured_functions))
-        return unassured_functions
+        return sorted(unassured_functions)
 
     # Basic block scanning
 
@@ -2132,9 +2141,10 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
 
         # Make sure all memory data entries cover all data sections
         keys = sorted(self._memory_data.keys())
+        in_exec_regions = self._addrs_in_exec_memory_regions(self._memory_data[k].address for k in keys)
         for i, data_addr in enumerate(keys):
             data = self._memory_data[data_addr]
-            if self._addr_in_exec_memory_regions(data.address):
+            if in_exec_regions[i]:
                 # TODO: Handle data among code regions (or executable regions)
                 pass
             else:
@@ -3404,8 +3414,7 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
             irsb = None
             irsb_string = None
             try:
-                lifted_block = self._lift(addr, size=distance, opt_level=self._iropt_level, collect_data_refs=True,
-                                          strict_block_end=True)
+                lifted_block = self._lift_cfgnode_block(addr, distance)
                 irsb = lifted_block.vex_nostmt
                 irsb_string = lifted_block.bytes[:irsb.size]
             except SimTranslationError:
@@ -3428,8 +3437,7 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
                     return addr_0, cfg_node.function_address, cfg_node, irsb
 
                 try:
-                    lifted_block = self._lift(addr_0, size=distance, opt_level=self._iropt_level,
-                                              collect_data_refs=True, strict_block_end=True)
+                    lifted_block = self._lift_cfgnode_block(addr_0, distance)
                     irsb = lifted_block.vex_nostmt
                     irsb_string = lifted_block.bytes[:irsb.size]
                 except SimTranslationError:
@@ -3511,6 +3519,50 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
         except (SimMemoryError, SimEngineError):
             return None, None, None, None
 
+    def _lift_cfgnode_block(self, addr, distance):
+        """
+        Lift the block that a CFGNode at `addr` is generated from, and reuse the IRSB lifted by a worker process if
+        possible.
+
+        :param int addr:        Address of the block.
+        :param int distance:    Maximum size of the block.
+        :return:                The block.
+        :rtype:                 angr.Block
+        """
+
+        lifted_block = self._lift(addr, size=distance, opt_level=self._iropt_level, collect_data_refs=True,
+                                  strict_block_end=True)
+
+        if self._prelifted_blocks:
+            irsb = self._prelifted_blocks.pop(addr, None)
+            # workers lift at least `distance` bytes. a block that they lifted is identical to a block lifted from at
+            # most `distance` bytes, unless it is cut by a decoding failure right at `distance`
+            if irsb is not None and \
+                    (irsb.size < distance or (irsb.size == distance and irsb.jumpkind != 'Ijk_NoDecode')):
+                lifted_block._vex_nostmt = irsb
+
+        return lifted_block
+
+    def _prelift_blocks(self, starting_points):
+        """
+        Lift blocks reachable from all starting points and function prologues in worker processes.
+
+        :param list starting_points:    Addresses of function starts.
+        :return:                        None
+        """
+
+        if self._use_patches or self._base_state is not None or self.project.arch.name == 'Soot':
+            l.warning("Blocks cannot be lifted in worker processes when patches or a base state are used.")
+            return
+
+        seeds = set(starting_points)
+        if self._function_prologue_addrs:
+            seeds |= self._function_prologue_addrs
+
+        self._prelifted_blocks = lift_blocks_in_parallel(self.project, list(self._regions.items()), seeds,
+                                                         self._workers, opt_level=self._iropt_level,
+                                                         max_size=VEX_IRSB_MAX_SIZE)
+
     def _process_block_arch_specific(self, addr, irsb, func_addr):  # pylint: disable=unused-argument
         """
         According to arch types ['ARMEL', 'ARMHF', 'MIPS32'] does different
@@ -3589,8 +3641,9 @@ class CFGFast(ForwardAnalysis, CFGBase):    # pylint: disable=abstract-method
             return {}
         result = {}
         for code, meaning in self.SPECIAL_THUNKS[self.project.arch.name].items():
-            for addr in self.project.loader.memory.find(code):
-                if self._addr_in_exec_memory_regions(addr):
+            addrs = list(self.project.loader.memory.find(code))
+            for addr, in_exec_regions in zip(addrs, self._addrs_in_exec_memory_regions(addrs)):
+                if in_exec_regions:
                     result[addr] = meaning
 
         return result
@@ -0,0 +1,137 @@
+import bisect
+import logging
+import concurrent.futures
+
+import pyvex
+from archinfo.arch_arm import get_real_address_if_arm
+
+from ...errors import SimEngineError, SimMemoryError, SimTranslationError
+
+l = logging.getLogger(name=__name__)
+
+# the project of the current worker process
+_worker_project = None
+
+
+def _init_worker(project):
+    global _worker_project  # pylint:disable=global-statement
+    _worker_project = project
+
+
+def _block_distance(project, addr, max_size):
+    """
+    Get the maximum number of bytes a block starting at `addr` may span. This is an upper bound of the size that
+    CFGFast._generate_cfgnode() uses when lifting the same block.
+    """
+
+    real_addr = get_real_address_if_arm(project.arch, addr)
+    obj = project.loader.find_object_containing(addr, membership_check=False)
+    if obj is None:
+        return max_size
+
+    section = project.loader.find_section_containing(addr)
+    if section is None:
+        if any(sec.is_executable for sec in obj.sections):
+            return None
+        return max_size
+    if not section.is_executable:
+        return None
+    return min(section.vaddr + section.memsize - real_addr, max_size)
+
+
+def _lift_partition(start, end, seeds, opt_level, max_size):
+    """
+    Lift all blocks in [start, end) that are reachable from `seeds` through direct jumps, calls, and call returns.
+
+    :return: A list of tuples of (block address, IRSB).
+    """
+
+    project = _worker_project
+    lifted = [ ]
+    seen = set()
+
+    stack = list(reversed(seeds))
+    while stack:
+        addr = stack.pop()
+        if addr in seen or not start <= get_real_address_if_arm(project.arch, addr) < end:
+            continue
+        seen.add(addr)
+
+        distance = _block_distance(project, addr, max_size)
+        if distance is None:
+            continue
+
+        try:
+            block = project.factory.block(addr, size=distance, opt_level=opt_level, collect_data_refs=True,
+                                          strict_block_end=True)
+            irsb = block.vex_nostmt
+        except (SimTranslationError, SimEngineError, SimMemoryError):
+            continue
+
+        lifted.append((addr, irsb))
+
+        if irsb.size == 0 or irsb.jumpkind == 'Ijk_NoDecode':
+            continue
+
+        if irsb.jumpkind == 'Ijk_Call' or irsb.jumpkind.startswith('Ijk_Sys'):
+            stack.append(addr + irsb.size)
+        if type(irsb.next) is pyvex.IRExpr.Const:
+            stack.append(irsb.next.con.value)
+        for _, _, exit_stmt in irsb.exit_statements:
+            stack.append(exit_stmt.dst.value)
+
+    return lifted
+
+
+def lift_blocks_in_parallel(project, regions, seeds, workers, opt_level=1, max_size=400, mp_context=None,
+                            partitions_per_worker=4):
+    """
+    Lift blocks in worker processes before CFG recovery starts.
+
+    The regions are split into partitions of roughly the same size. For every partition, a worker lifts all blocks that
+    can be reached from the seeds inside that partition through constant jump targets without leaving the partition.
+    Lifting is done with the same parameters that CFGFast uses, and blocks are returned with their data references.
+
+    :param project:             The project.
+    :param regions:             A list of tuples of (start address, end address) of the memory regions to scan.
+    :param seeds:               An iterable of addresses to start lifting from, e.g. function symbols and prologues.
+    :param int workers:         Number of worker processes.
+    :param int opt_level:       The VEX optimization level.
+    :param int max_size:        Maximum size of each block in bytes.
+    :param mp_context:          A multiprocessing context used to start the workers.
+    :param int partitions_per_worker:   Number of partitions to create for each worker.
+    :return:                    A dict mapping block addresses to IRSBs.
+    :rtype:                     dict
+    """
+
+    regions = sorted(regions)
+    total_size = sum(end - start for start, end in regions)
+    if not total_size:
+        return { }
+
+    # split regions into partitions of roughly the same size
+    partition_size = max(total_size // (workers * partitions_per_worker), 1)
+    partitions = [ ]
+    for start, end in regions:
+        for p_start in range(start, end, partition_size):
+            partitions.append((p_start, min(p_start + partition_size, end)))
+
+    partition_starts = [ p_start for p_start, _ in partitions ]
+    partition_seeds = [ [ ] for _ in partitions ]
+    for seed in sorted(set(seeds)):
+        real_seed = get_real_address_if_arm(project.arch, seed)
+        idx = bisect.bisect_right(partition_starts, real_seed) - 1
+        if idx >= 0 and real_seed < partitions[idx][1]:
+            partition_seeds[idx].append(seed)
+
+    blocks = { }
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                                                initializer=_init_worker, initargs=(project, )) as executor:
+        futures = [ executor.submit(_lift_partition, p_start, p_end, p_seeds, opt_level, max_size)
+                    for (p_start, p_end), p_seeds in zip(partitions, partition_seeds) if p_seeds ]
+        for future in futures:
+            for addr, irsb in future.result():
+                blocks[addr] = irsb
+
+    l.debug("Lifted %d blocks in %d partitions with %d workers.", len(blocks), len(futures), workers)
+    return blocks
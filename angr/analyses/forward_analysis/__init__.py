@@ -1,2 +1,3 @@
 from .forward_analysis import ForwardAnalysis
+from .job_queue import JobQueueBase, ListJobQueue, HeapJobQueue
 from .visitors import CallGraphVisitor, FunctionGraphVisitor, LoopVisitor, SingleNodeGraphVisitor
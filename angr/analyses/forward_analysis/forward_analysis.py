@@ -7,6 +7,7 @@ from ...errors import AngrSkipJobNotice, AngrDelayJobNotice, AngrJobMergingFailu
 
 
 from .job_info import JobInfo
+from .job_queue import HeapJobQueue
 
 class ForwardAnalysis:
     """
@@ -28,6 +29,9 @@ class ForwardAnalysis:
     Feel free to discuss with me (Fish) if you have any suggestions or complaints.
     """
 
+    # The type of the job queue. Analyses whose job sorting keys change over time should use ListJobQueue.
+    JOB_QUEUE_TYPE = HeapJobQueue
+
     def __init__(self, order_jobs=False, allow_merging=False, allow_widening=False, status_callback=None,
                  graph_visitor=None
                  ):
@@ -56,7 +60,9 @@ class ForwardAnalysis:
         self._should_abort = False
 
         # All remaining jobs
-        self._job_info_queue = [ ]
+        self._job_info_queue = self.JOB_QUEUE_TYPE(
+            key=(lambda job_info: self._job_sorting_key(job_info.job)) if self._order_jobs else None
+        )
 
         # A map between job key to job. Jobs with the same key will be merged by calling _merge_jobs()
         self._job_map = { }
@@ -347,7 +353,7 @@ class ForwardAnalysis:
                 # still no job available
                 break
 
-            job_info = self._job_info_queue[0]
+            job_info = self._job_info_queue.peek()
 
             try:
                 self._pre_job_handling(job_info.job)
@@ -356,14 +362,14 @@ class ForwardAnalysis:
                 continue
             except AngrSkipJobNotice:
                 # consume and skip this job
-                self._job_info_queue = self._job_info_queue[1:]
+                self._job_info_queue.popleft()
                 self._job_map.pop(self._job_key(job_info.job), None)
                 continue
 
             # remove the job info from the map
             self._job_map.pop(self._job_key(job_info.job), None)
 
-            self._job_info_queue = self._job_info_queue[1:]
+            self._job_info_queue.popleft()
 
             self._process_job_and_get_successors(job_info)
 
@@ -451,11 +457,7 @@ class ForwardAnalysis:
             job_info = JobInfo(key, job)
             self._job_map[key] = job_info
 
-        if self._order_jobs:
-            self._binary_insert(self._job_info_queue, job_info, lambda elem: self._job_sorting_key(elem.job))
-
-        else:
-            self._job_info_queue.append(job_info)
+        self._job_info_queue.add(job_info)
 
     def _peek_job(self, pos):
         """
@@ -466,42 +468,4 @@ class ForwardAnalysis:
         :return:        The job
         """
 
-        if pos < len(self._job_info_queue):
-            return self._job_info_queue[pos].job
-
-        raise IndexError()
-
-    #
-    # Utils
-    #
-
-    @staticmethod
-    def _binary_insert(lst, elem, key, lo=0, hi=None):
-        """
-        Insert an element into a sorted list, and keep the list sorted.
-
-        The major difference from bisect.bisect_left is that this function supports a key method, so user doesn't have
-        to create the key array for each insertion.
-
-        :param list lst: The list. Must be pre-ordered.
-        :param object element: An element to insert into the list.
-        :param func key: A method to get the key for each element in the list.
-        :param int lo: Lower bound of the search.
-        :param int hi: Upper bound of the search.
-        :return: None
-        """
-
-        if lo < 0:
-            raise ValueError("lo must be a non-negative number")
-
-        if hi is None:
-            hi = len(lst)
-
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if key(lst[mid]) < key(elem):
-                lo = mid + 1
-            else:
-                hi = mid
-
-        lst.insert(lo, elem)
+        return self._job_info_queue.peek(pos).job
@@ -0,0 +1,231 @@
+import heapq
+
+
+class JobQueueBase:
+    """
+    The base class of job queues used by ForwardAnalysis. A job queue holds JobInfo instances, either in the order they
+    are added (FIFO), or sorted by a key function. Jobs with the same sorting key are popped in LIFO order.
+    """
+
+    def __init__(self, key=None):
+        """
+        :param key: A function that takes a JobInfo instance and returns its sorting key, or None if the jobs should
+                    not be ordered.
+        """
+        self._key = key
+
+    def add(self, job_info):
+        """
+        Add a job to the queue.
+
+        :param JobInfo job_info: The job to add.
+        :return:                 None
+        """
+        raise NotImplementedError()
+
+    def remove(self, job_info):
+        """
+        Remove the first job in the queue that is equal to `job_info`. A ValueError will be raised if there is no such
+        job in the queue.
+
+        :param JobInfo job_info: The job to remove.
+        :return:                 None
+        """
+        raise NotImplementedError()
+
+    def remove_if(self, predicate):
+        """
+        Remove all jobs for which `predicate` returns True.
+
+        :param predicate: A function that takes a JobInfo instance and returns a boolean.
+        :return:          The number of removed jobs.
+        :rtype:           int
+        """
+        raise NotImplementedError()
+
+    def peek(self, pos=0):
+        """
+        Get the job at position `pos` without removing it. An IndexError will be raised if that position does not exist.
+
+        :param int pos: Position of the job.
+        :return:        The JobInfo instance.
+        """
+        raise NotImplementedError()
+
+    def popleft(self):
+        """
+        Remove and return the first job in the queue. An IndexError will be raised if the queue is empty.
+
+        :return: The JobInfo instance.
+        """
+        raise NotImplementedError()
+
+    def __contains__(self, job_info):
+        raise NotImplementedError()
+
+    def __iter__(self):
+        raise NotImplementedError()
+
+    def __len__(self):
+        raise NotImplementedError()
+
+    def __bool__(self):
+        return len(self) > 0
+
+
+class ListJobQueue(JobQueueBase):
+    """
+    A job queue that keeps jobs in a sorted list. Sorting keys are computed at every insertion, which makes this queue
+    suitable for analyses whose job sorting keys change over time.
+    """
+
+    def __init__(self, key=None):
+        super().__init__(key=key)
+        self._jobs = [ ]
+
+    def add(self, job_info):
+        if self._key is None:
+            self._jobs.append(job_info)
+        else:
+            self._binary_insert(self._jobs, job_info, self._key)
+
+    def remove(self, job_info):
+        self._jobs.remove(job_info)
+
+    def remove_if(self, predicate):
+        old_len = len(self._jobs)
+        self._jobs = [ job_info for job_info in self._jobs if not predicate(job_info) ]
+        return old_len - len(self._jobs)
+
+    def peek(self, pos=0):
+        return self._jobs[pos]
+
+    def popleft(self):
+        return self._jobs.pop(0)
+
+    def __contains__(self, job_info):
+        return job_info in self._jobs
+
+    def __iter__(self):
+        return iter(self._jobs)
+
+    def __len__(self):
+        return len(self._jobs)
+
+    @staticmethod
+    def _binary_insert(lst, elem, key, lo=0, hi=None):
+        """
+        Insert an element into a sorted list, and keep the list sorted.
+
+        The major difference from bisect.bisect_left is that this function supports a key method, so user doesn't have
+        to create the key array for each insertion.
+
+        :param list lst: The list. Must be pre-ordered.
+        :param object element: An element to insert into the list.
+        :param func key: A method to get the key for each element in the list.
+        :param int lo: Lower bound of the search.
+        :param int hi: Upper bound of the search.
+        :return: None
+        """
+
+        if lo < 0:
+            raise ValueError("lo must be a non-negative number")
+
+        if hi is None:
+            hi = len(lst)
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key(lst[mid]) < key(elem):
+                lo = mid + 1
+            else:
+                hi = mid
+
+        lst.insert(lo, elem)
+
+
+class HeapJobQueue(JobQueueBase):
+    """
+    A job queue backed by a binary heap with lazy deletion. Insertion, removal and popping take O(log n) time. The
+    sorting key of each job is computed once, when the job is added.
+    """
+
+    def __init__(self, key=None):
+        super().__init__(key=key)
+        # heap entries are [sorting key, tie breaker, job info]. job info is set to None when the entry is removed.
+        self._heap = [ ]
+        # job key -> live heap entries
+        self._entries = { }
+        self._counter = 0
+        self._len = 0
+
+    def add(self, job_info):
+        self._counter += 1
+        if self._key is None:
+            entry = [ 0, self._counter, job_info ]
+        else:
+            entry = [ self._key(job_info), -self._counter, job_info ]
+
+        heapq.heappush(self._heap, entry)
+        self._entries.setdefault(job_info.key, [ ]).append(entry)
+        self._len += 1
+
+    def _discard(self, entry):
+        entries = self._entries[entry[2].key]
+        entries.remove(entry)
+        if not entries:
+            del self._entries[entry[2].key]
+        entry[2] = None
+        self._len -= 1
+
+    def _drop_removed(self):
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+
+    def remove(self, job_info):
+        entries = self._entries.get(job_info.key, None)
+        if not entries:
+            raise ValueError("%s is not in the job queue" % job_info)
+        self._discard(min(entries, key=lambda e: (e[0], e[1])))
+        self._drop_removed()
+
+    def remove_if(self, predicate):
+        to_remove = [ entry for entry in self._heap if entry[2] is not None and predicate(entry[2]) ]
+        for entry in to_remove:
+            self._discard(entry)
+        if to_remove:
+            self._heap = [ entry for entry in self._heap if entry[2] is not None ]
+            heapq.heapify(self._heap)
+        return len(to_remove)
+
+    def peek(self, pos=0):
+        if pos == 0:
+            self._drop_removed()
+            if not self._heap:
+                raise IndexError(pos)
+            return self._heap[0][2]
+
+        live = heapq.nsmallest(pos + 1, (entry for entry in self._heap if entry[2] is not None))
+        if pos >= len(live):
+            raise IndexError(pos)
+        return live[pos][2]
+
+    def popleft(self):
+        self._drop_removed()
+        if not self._heap:
+            raise IndexError("pop from an empty job queue")
+        entry = heapq.heappop(self._heap)
+        job_info = entry[2]
+        self._discard(entry)
+        return job_info
+
+    def __contains__(self, job_info):
+        return job_info.key in self._entries
+
+    def __iter__(self):
+        for entry in sorted(entry for entry in self._heap if entry[2] is not None):
+            yield entry[2]
+
+    def __len__(self):
+        return self._len
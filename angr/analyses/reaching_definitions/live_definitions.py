@@ -130,13 +130,14 @@ class LiveDefinitions:
             self.register_definitions.set_object(t9.reg_offset, t9_def, t9.size)
 
     def copy(self):
-        rd = type(self)(
-            self.arch,
-            self._subject,
-            track_tmps=self._track_tmps,
-            analysis=self.analysis,
-        )
-
+        # do not go through __init__(): the initial definitions would be computed only to be thrown away
+        rd = type(self).__new__(type(self))
+        rd.arch = self.arch
+        rd._subject = self._subject
+        rd._track_tmps = self._track_tmps
+        rd.analysis = self.analysis
+
+        # KeyedRegion and Uses are copy-on-write
         rd.register_definitions = self.register_definitions.copy()
         rd.stack_definitions = self.stack_definitions.copy()
         rd.memory_definitions = self.memory_definitions.copy()
@@ -144,6 +145,7 @@ class LiveDefinitions:
         rd.register_uses = self.register_uses.copy()
         rd.stack_uses = self.stack_uses.copy()
         rd.memory_uses = self.memory_uses.copy()
+        rd.uses_by_codeloc = defaultdict(set)
         rd.tmp_uses = self.tmp_uses.copy()
         rd._dead_virgin_definitions = self._dead_virgin_definitions.copy()
 
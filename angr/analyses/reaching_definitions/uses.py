@@ -4,11 +4,41 @@ from collections import defaultdict
 
 class Uses:
 
-    __slots__ = ('_uses_by_definition', )
+    __slots__ = ('_uses_by_definition', '_owned', '_owned_definitions', )
 
     def __init__(self):
         self._uses_by_definition = defaultdict(set)
 
+        # copy-on-write bookkeeping. the dict and each set of uses may be shared with copies of this instance. they are
+        # only duplicated when they are about to be modified.
+        self._owned = True
+        self._owned_definitions = None  # None means all sets are owned
+
+    def __getstate__(self):
+        return self._uses_by_definition,
+
+    def __setstate__(self, s):
+        self._uses_by_definition, = s
+        self._owned = True
+        self._owned_definitions = None
+
+    def _writable_uses(self, definition):
+        if not self._owned:
+            self._uses_by_definition = defaultdict(set, self._uses_by_definition)
+            self._owned = True
+
+        uses = self._uses_by_definition.get(definition, None)
+        if uses is None:
+            uses = self._uses_by_definition[definition] = set()
+        elif self._owned_definitions is not None and definition not in self._owned_definitions:
+            uses = self._uses_by_definition[definition] = set(uses)
+        else:
+            return uses
+
+        if self._owned_definitions is not None:
+            self._owned_definitions.add(definition)
+        return uses
+
     def add_use(self, definition, codeloc):
         """
         Add a use for a given definition.
@@ -16,7 +46,7 @@ class Uses:
         :param angr.analyses.reaching_definitions.definition.Definition definition: The definition that is used.
         :param angr.analyses.code_location.CodeLocation codeloc: The code location where the use occurs.
         """
-        self._uses_by_definition[definition].add(codeloc)
+        self._writable_uses(definition).add(codeloc)
 
     def get_uses(self, definition):
         """
@@ -35,8 +65,14 @@ class Uses:
 
         :return angr.angr.analyses.reaching_definitions.uses.Uses: Return a new <Uses> instance containing the same data.
         """
-        u = Uses()
-        u._uses_by_definition = defaultdict(set, ((k, set(v)) for k, v in self._uses_by_definition.items()))
+        # the new instance shares all storage with this one. both instances copy-on-write from now on.
+        u = Uses.__new__(Uses)
+        u._uses_by_definition = self._uses_by_definition
+        u._owned = False
+        u._owned_definitions = set()
+
+        self._owned = False
+        self._owned_definitions = set()
 
         return u
 
@@ -48,7 +84,4 @@ class Uses:
                                                                         to the current instance.
         """
         for k, v in other._uses_by_definition.items():
-            if k not in self._uses_by_definition:
-                self._uses_by_definition[k] = v
-            else:
-                self._uses_by_definition[k] |= v
+            self._writable_uses(k).update(v)
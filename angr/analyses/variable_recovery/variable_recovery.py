@@ -78,7 +78,7 @@ class VariableRecoveryState(VariableRecoveryStateBase):
             # clear existing breakpoints
             # TODO: all breakpoints are removed. Fix this later by only removing breakpoints that we added
             for bp_type in ('reg_read', 'reg_write', 'mem_read', 'mem_write', 'instruction'):
-                concrete_state.inspect._breakpoints[bp_type] = [ ]
+                concrete_state.inspect.remove_breakpoint(bp_type, filter_func=lambda bp: True)
 
             concrete_state.inspect.add_breakpoint('reg_read', BP(when=BP_AFTER, enabled=True,
                                                                  action=self._hook_register_read
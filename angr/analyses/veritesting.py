@@ -1,6 +1,5 @@
 import logging
 from collections import defaultdict
-from functools import cmp_to_key
 
 import networkx
 
@@ -9,7 +8,7 @@ from .. import options as o
 from ..knowledge_base import KnowledgeBase
 from ..errors import AngrError, AngrCFGError
 from ..sim_manager import SimulationManager
-from ..utils.graph import shallow_reverse
+from ..utils.graph import PostDominators
 from . import Analysis
 
 l = logging.getLogger(name=__name__)
@@ -166,6 +165,8 @@ class Veritesting(Analysis):
     """
     # A cache for CFG we generated before
     cfg_cache = { }
+    # A cache for the merge points of the CFGs in cfg_cache, under the same keys
+    merge_points_cache = { }
     # Names of all stashes we will return from Veritesting
     all_stashes = ('successful', 'errored', 'deadended', 'deviated', 'unconstrained')
 
@@ -268,7 +269,11 @@ class Veritesting(Analysis):
         """
 
         # Find all merge points
-        merge_points = self._get_all_merge_points(self._cfg, self._loop_graph)
+        cfg_key = self._cfg_key()
+        merge_points = self.merge_points_cache.get(cfg_key)
+        if merge_points is None:
+            merge_points = self._get_all_merge_points(self._cfg)
+            self.merge_points_cache[cfg_key] = merge_points
         l.debug('Merge points: %s', [ hex(i[0]) for i in merge_points ])
 
         #
@@ -517,6 +522,13 @@ class Veritesting(Analysis):
     # Merge point determination
     #
 
+    def _cfg_key(self):
+        """
+        The key of the CFG of the current function in cfg_cache.
+        """
+        state = self._input_state
+        return (state.addr, state.history.jumpkind, self.project.filename)
+
     def _make_cfg(self):
         """
         Builds a CFG from the current function.
@@ -528,7 +540,7 @@ class Veritesting(Analysis):
         state = self._input_state
         ip_int = state.addr
 
-        cfg_key = (ip_int, state.history.jumpkind, self.project.filename)
+        cfg_key = self._cfg_key()
         if cfg_key in self.cfg_cache:
             cfg, cfg_graph_with_loops = self.cfg_cache[cfg_key]
         else:
@@ -565,30 +577,16 @@ class Veritesting(Analysis):
 
         return cfg, cfg_graph_with_loops
 
-    @staticmethod
-    def _post_dominate(reversed_graph, n1, n2):
-        """
-        Checks whether `n1` post-dominates `n2` in the *original* (not reversed) graph.
-
-        :param networkx.DiGraph reversed_graph:  The reversed networkx.DiGraph instance.
-        :param networkx.Node n1:                 Node 1.
-        :param networkx.Node n2:                 Node 2.
-        :returns bool:                           True/False.
-        """
-
-        ds = networkx.immediate_dominators(reversed_graph, n1)
-        return n2 in ds
-
-    def _get_all_merge_points(self, cfg, graph_with_loops):
+    def _get_all_merge_points(self, cfg):
         """
         Return all possible merge points in this CFG.
 
         :param CFGEmulated cfg: The control flow graph, which must be acyclic.
-        :returns [(int, int)]:  A list of merge points (address and number of times looped).
+        :returns [(int, int)]:  A list of merge points (address and number of times looped), where every merge point
+                                comes before the merge points that post-dominate it.
         """
 
         graph = networkx.DiGraph(cfg.graph)
-        reversed_cyclic_graph = shallow_reverse(graph_with_loops)
 
         # Remove all "FakeRet" edges
         fakeret_edges = [
@@ -597,26 +595,53 @@ class Veritesting(Analysis):
         ]
         graph.remove_edges_from(fakeret_edges)
 
-        # Remove all "FakeRet" edges from cyclic_graph as well
-        fakeret_edges = [
-            (src, dst) for src, dst, data in reversed_cyclic_graph.edges(data=True)
-            if data['jumpkind'] in ('Ijk_FakeRet', 'Ijk_Exit')
-        ]
-        reversed_cyclic_graph.remove_edges_from(fakeret_edges)
-
         # Perform a topological sort
-        sorted_nodes = networkx.topological_sort(graph)
+        sorted_nodes = list(networkx.topological_sort(graph))
+        if not sorted_nodes:
+            return [ ]
 
         nodes = [ n for n in sorted_nodes if graph.in_degree(n) > 1 and n.looping_times == 0 ]
+        if len(nodes) < 2:
+            return [ (n.addr, n.looping_times) for n in nodes ]
 
-        # Reorder nodes based on post-dominance relations
-        nodes = sorted(nodes, key=cmp_to_key(lambda n1, n2: (
-            1 if self._post_dominate(reversed_cyclic_graph, n1, n2)
-            else (-1 if self._post_dominate(reversed_cyclic_graph, n2, n1) else 0)
-        )))
+        # Reorder nodes based on post-dominance relations: a post-order traversal of the post-dominator tree, which is
+        # computed only once, puts every node before its post-dominators
+        order = self._post_dominance_order(graph, sorted_nodes)
+        nodes = sorted(nodes, key=lambda n: order.get(n, len(order)))
 
         return [ (n.addr, n.looping_times) for n in nodes ]
 
+    @staticmethod
+    def _post_dominance_order(graph, sorted_nodes):
+        """
+        Number the nodes of an acyclic graph in the post-order of its post-dominator tree. The children of each node in
+        the tree are visited in topological order.
+
+        :param networkx.DiGraph graph:  The graph.
+        :param list sorted_nodes:       All nodes of the graph in topological order. The first one is the entry.
+        :returns dict:                  A mapping from nodes to their position in the post-order.
+        """
+
+        post_dom = PostDominators(graph, sorted_nodes[0]).post_dom
+        topological_index = { n: i for i, n in enumerate(sorted_nodes) }
+
+        def children(n):
+            return iter(sorted(post_dom.successors(n), key=lambda c: topological_index.get(c, -1)))
+
+        order = { }
+        roots = [ n for n in post_dom.nodes() if post_dom.in_degree(n) == 0 ]
+        for root in roots:
+            stack = [ (root, children(root)) ]
+            while stack:
+                n, it = stack[-1]
+                child = next(it, None)
+                if child is None:
+                    stack.pop()
+                    order[n] = len(order)
+                else:
+                    stack.append((child, children(child)))
+        return order
+
 from angr.analyses import AnalysesHub
 AnalysesHub.register_default('Veritesting', Veritesting)
 
@@ -11,6 +11,7 @@ from . import Analysis
 from .cfg.cfg_job_base import BlockID, FunctionKey, CFGJobBase
 from .cfg.cfg_utils import CFGUtils
 from .forward_analysis import ForwardAnalysis
+from .forward_analysis.job_queue import ListJobQueue
 from .. import sim_options
 from ..engines.procedure import ProcedureMixin
 from ..engines import SimSuccessors
@@ -255,6 +256,9 @@ class VFG(ForwardAnalysis, Analysis):   # pylint:disable=abstract-method
     # TODO: right now the graph traversal method is not optimal. A new solution is needed to minimize the iteration we
     # TODO: access each node in the graph
 
+    # job sorting keys depend on the current task stack, so they must be recomputed at every insertion
+    JOB_QUEUE_TYPE = ListJobQueue
+
     def __init__(self,
                  cfg=None,
                  context_sensitivity_level=2,
@@ -21,12 +21,22 @@ class SimEngineXRefsVEX(
         self.project = project
         self.xref_manager = xref_manager
         self.replacements = replacements if replacements is not None else { }
+        # xrefs of the current block. they are added to the xref manager in one batch when the block is processed.
+        self._pending_xrefs = [ ]
 
     def add_xref(self, xref_type, from_loc, to_loc):
-        self.xref_manager.add_xref(XRef(ins_addr=from_loc.ins_addr, block_addr=from_loc.block_addr,
+        self._pending_xrefs.append(XRef(ins_addr=from_loc.ins_addr, block_addr=from_loc.block_addr,
                                         stmt_idx=from_loc.stmt_idx, dst=to_loc, xref_type=xref_type)
                                    )
 
+    def _process(self, state, successors, *args, block=None, whitelist=None, **kwargs):  # pylint:disable=arguments-differ
+        try:
+            super()._process(state, successors, *args, block=block, whitelist=whitelist, **kwargs)
+        finally:
+            if self._pending_xrefs:
+                self.xref_manager.add_xrefs(self._pending_xrefs)
+                self._pending_xrefs = [ ]
+
     #
     # Statement handlers
     #
@@ -0,0 +1,114 @@
+import os
+import pickle
+import sqlite3
+import hashlib
+import logging
+
+import pyvex
+
+l = logging.getLogger(name=__name__)
+
+
+class PersistentIRSBCache:
+    """
+    A persistent cache of lifted IRSBs, stored in an SQLite database so that it can be shared between runs and between
+    processes.
+
+    Blocks are keyed by a hash of the bytes they are lifted from, together with the address, the architecture and its
+    endianness, the pyvex version and all lifting parameters. A rebuilt binary, a different library version, code that
+    has been modified at runtime or an upgraded lifter simply produce different keys. Entries of older pyvex versions
+    are never used again, but they are not removed either: use clear() to reclaim their space.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path:    Path to the SQLite database. It is created if it does not exist.
+        """
+        self.path = path
+
+        self._db = None
+        self._pid = None
+
+    def __getstate__(self):
+        return { 'path': self.path }
+
+    def __setstate__(self, s):
+        self.__dict__.update(s)
+        self._db = None
+        self._pid = None
+
+    def __repr__(self):
+        return "<PersistentIRSBCache %s>" % self.path
+
+    @property
+    def db(self):
+        # SQLite connections must not be shared between forked processes
+        if self._db is None or self._pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # losing a few entries upon a crash is fine for a cache
+            self._db.execute("PRAGMA synchronous=OFF")
+            self._db.execute("CREATE TABLE IF NOT EXISTS irsbs (key TEXT PRIMARY KEY, irsb BLOB)")
+            self._pid = os.getpid()
+        return self._db
+
+    @staticmethod
+    def make_key(buff, addr, arch, thumb, opt_level, size, num_inst, strict_block_end):
+        """
+        Generate the cache key of a block.
+
+        :param bytes buff:  The bytes the block is lifted from.
+        :return:            The key.
+        :rtype:             str
+        """
+        return "%s:%#x:%s:%s:%s:%d:%d:%d:%s:%d" % (
+            hashlib.sha1(buff).hexdigest(), addr, arch.name, arch.memory_endness, pyvex.__version__, thumb, opt_level,
+            size, num_inst, strict_block_end,
+        )
+
+    def get(self, key):
+        """
+        Load a block from the cache.
+
+        :param str key: The cache key.
+        :return:        The IRSB, or None if it is not cached.
+        """
+        row = self.db.execute("SELECT irsb FROM irsbs WHERE key = ?", (key, )).fetchone()
+        if row is None:
+            return None
+
+        try:
+            irsb = pickle.loads(row[0])
+        except Exception:  # pylint:disable=broad-except
+            l.warning("Failed to load a cached IRSB. Discarding it.", exc_info=True)
+            self.db.execute("DELETE FROM irsbs WHERE key = ?", (key, ))
+            return None
+
+        return irsb
+
+    def put(self, key, irsb):
+        """
+        Store a block in the cache.
+
+        :param str key:     The cache key.
+        :param irsb:        The IRSB.
+        :return:            None
+        """
+        try:
+            data = pickle.dumps(irsb, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            l.debug("Cannot serialize the IRSB at %#x.", irsb.addr)
+            return
+
+        self.db.execute("INSERT OR IGNORE INTO irsbs (key, irsb) VALUES (?, ?)", (key, sqlite3.Binary(data)))
+
+    def clear(self):
+        """
+        Remove all cached blocks.
+        """
+        self.db.execute("DELETE FROM irsbs")
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
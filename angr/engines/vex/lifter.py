@@ -6,6 +6,7 @@ from cachetools import LRUCache
 import logging
 
 from ..engine import SimEngineBase
+from .irsb_cache import PersistentIRSBCache
 from ...state_plugins.inspect import BP_AFTER, BP_BEFORE
 from ...misc.ux import once
 from ...errors import SimEngineError, SimTranslationError, SimError
@@ -23,7 +24,8 @@ class VEXLifter(SimEngineBase):
                  default_opt_level=1,
                  support_selfmodifying_code=None,
                  single_step=False,
-                 default_strict_block_end=False, **kwargs):
+                 default_strict_block_end=False,
+                 persistent_cache=None, **kwargs):
 
         super().__init__(project, **kwargs)
 
@@ -33,6 +35,7 @@ class VEXLifter(SimEngineBase):
         self._support_selfmodifying_code = support_selfmodifying_code
         self._single_step = single_step
         self.default_strict_block_end = default_strict_block_end
+        self._persistent_cache = persistent_cache
 
         if self._use_cache is None:
             if self.project is not None:
@@ -44,11 +47,17 @@ class VEXLifter(SimEngineBase):
                 self._support_selfmodifying_code = self.project._support_selfmodifying_code
             else:
                 self._support_selfmodifying_code = False
+        if self._persistent_cache is None and self.project is not None:
+            self._persistent_cache = getattr(self.project, '_persistent_translation_cache', None)
+        if isinstance(self._persistent_cache, str):
+            self._persistent_cache = PersistentIRSBCache(self._persistent_cache)
 
         # block cache
         self._block_cache = None
         self._block_cache_hits = 0
         self._block_cache_misses = 0
+        self._persistent_cache_hits = 0
+        self._persistent_cache_misses = 0
 
         self._initialize_block_cache()
 
@@ -56,12 +65,16 @@ class VEXLifter(SimEngineBase):
         self._block_cache = LRUCache(maxsize=self._cache_size)
         self._block_cache_hits = 0
         self._block_cache_misses = 0
+        self._persistent_cache_hits = 0
+        self._persistent_cache_misses = 0
 
     def clear_cache(self):
         self._block_cache = LRUCache(maxsize=self._cache_size)
 
         self._block_cache_hits = 0
         self._block_cache_misses = 0
+        self._persistent_cache_hits = 0
+        self._persistent_cache_misses = 0
 
 
     def lift_vex(self,
@@ -209,6 +222,22 @@ class VEXLifter(SimEngineBase):
         if not buff or size == 0:
             raise SimEngineError("No bytes in memory for block starting at %#x." % addr)
 
+        # phase 4.5: check the persistent cache, which is keyed by the block content
+        persistent_key = None
+        if use_cache and self._persistent_cache is not None:
+            persistent_key = PersistentIRSBCache.make_key(
+                buff if isinstance(buff, bytes) else pyvex.ffi.buffer(buff, size)[:],
+                addr, arch, thumb, opt_level, size, num_inst, strict_block_end,
+            )
+            irsb = self._persistent_cache.get(persistent_key)
+            if irsb is not None and self._first_stoppoint(irsb, extra_stop_points) is None:
+                self._persistent_cache_hits += 1
+                self._block_cache[cache_key] = irsb
+                if state:
+                    state._inspect('vex_lift', BP_AFTER, mem_read_address=addr, mem_read_length=size)
+                return irsb
+            self._persistent_cache_misses += 1
+
         # phase 5: call into pyvex
         # l.debug("Creating pyvex.IRSB of arch %s at %#x", arch.name, addr)
         try:
@@ -234,6 +263,8 @@ class VEXLifter(SimEngineBase):
 
                 if use_cache:
                     self._block_cache[cache_key] = irsb
+                    if persistent_key is not None and subphase == 0:
+                        self._persistent_cache.put(persistent_key, irsb)
                 if state:
                     state._inspect('vex_lift', BP_AFTER, mem_read_address=addr, mem_read_length=size)
                 return irsb
@@ -353,7 +384,8 @@ class VEXLifter(SimEngineBase):
              '_support_selfmodifying_code': self._support_selfmodifying_code,
              '_single_step': self._single_step,
              '_cache_size': self._cache_size,
-             'default_strict_block_end': self.default_strict_block_end
+             'default_strict_block_end': self.default_strict_block_end,
+             '_persistent_cache': self._persistent_cache,
         }
 
         return (s, ostate)
@@ -366,6 +398,7 @@ class VEXLifter(SimEngineBase):
         self._single_step = s['_single_step']
         self._cache_size = s['_cache_size']
         self.default_strict_block_end = s['default_strict_block_end']
+        self._persistent_cache = s.get('_persistent_cache', None)
 
         # rebuild block cache
         self._initialize_block_cache()
@@ -1,6 +1,6 @@
 
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 
 import networkx
 
@@ -19,6 +19,10 @@ class BaseGoal(object):
 
     REQUIRE_CFG_STATES = False
 
+    # distances from CFG nodes to the goal, and the CFG graph they are computed on
+    _distances = None
+    _distances_graph = None
+
     def __init__(self, sort):
         self.sort = sort
 
@@ -53,10 +57,102 @@ class BaseGoal(object):
 
         raise NotImplementedError()
 
+    def distance(self, cfg, state):
+        """
+        Get the minimum number of blocks that the state has to execute on the control flow graph before reaching this
+        goal.
+
+        :param angr.analyses.CFGEmulated cfg:   An instance of CFGEmulated.
+        :param angr.SimState state:             The state to check.
+        :return: The distance, or None if the goal is unreachable from the state or the distance is unknown.
+        :rtype: int or None
+        """
+
+        node = self._get_cfg_node(cfg, state)
+
+        if node is None:
+            l.debug('Failed to find CFGNode for state %s on the control flow graph.', state)
+            return None
+
+        return self._node_distance(cfg, node)
+
+    def invalidate_distances(self):
+        """
+        Drop the cached distances to the goal. This must be called whenever the control flow graph has been modified.
+
+        :return: None
+        """
+
+        self._distances = None
+        self._distances_graph = None
+
     #
     # Private methods
     #
 
+    def _node_distance(self, cfg, node):
+        """
+        Get the minimum number of blocks to execute from a node on the control flow graph before reaching this goal.
+
+        :param angr.analyses.CFGEmulated cfg:   An instance of CFGEmulated.
+        :param CFGNode node:                    The node.
+        :return: The distance, or None if the goal is unreachable from the node or the distance is unknown.
+        :rtype: int or None
+        """
+
+        distances = self._get_distances(cfg)
+        if distances is None:
+            return None
+        return distances.get(node, None)
+
+    def _goal_nodes(self, cfg):  # pylint:disable=no-self-use,unused-argument
+        """
+        Get all CFG nodes that satisfy this goal.
+
+        :param angr.analyses.CFGEmulated cfg:   An instance of CFGEmulated.
+        :return: An iterable of CFGNode instances, or None if this goal cannot be located on the control flow graph.
+        """
+
+        return None
+
+    def _get_distances(self, cfg):
+        """
+        Get the distance from each CFG node to the nearest goal node. Distances are computed with a breadth-first search
+        from the goal nodes over the reversed control flow graph. They are cached until invalidate_distances() is
+        called, or until a different graph is passed in.
+
+        :param angr.analyses.CFGEmulated cfg:   An instance of CFGEmulated.
+        :return: A dict mapping CFG nodes to their distances, or None if this goal cannot be located on the control
+                 flow graph.
+        :rtype: dict or None
+        """
+
+        graph = cfg.graph
+        if self._distances_graph is graph:
+            return self._distances
+
+        goal_nodes = self._goal_nodes(cfg)
+        if goal_nodes is None:
+            distances = None
+        else:
+            distances = { }
+            queue = deque()
+            for node in goal_nodes:
+                if node not in distances:
+                    distances[node] = 0
+                    queue.append(node)
+            while queue:
+                dst = queue.popleft()
+                src_distance = distances[dst] + 1
+                for src in graph.predecessors(dst):
+                    if src not in distances:
+                        distances[src] = src_distance
+                        queue.append(src)
+
+        self._distances = distances
+        self._distances_graph = graph
+        return distances
+
     @staticmethod
     def _get_cfg_node(cfg, state):
         """
@@ -136,19 +232,11 @@ class ExecuteAddressGoal(BaseGoal):
         :rtype: bool
         """
 
-        # Get the current CFGNode from the CFG
-        node = self._get_cfg_node(cfg, state)
-
-        if node is None:
-            # Umm it doesn't exist on the control flow graph - why?
-            l.error('Failed to find CFGNode for state %s on the control flow graph.', state)
-            return False
+        distance = self.distance(cfg, state)
 
-        # crawl the graph to see if we can reach the target address next
-        for src, dst in self._dfs_edges(cfg.graph, node, max_steps=peek_blocks):
-            if src.addr == self.addr or dst.addr == self.addr:
-                l.debug("State %s will reach %#x.", state, self.addr)
-                return True
+        if distance is not None and distance <= peek_blocks:
+            l.debug("State %s will reach %#x.", state, self.addr)
+            return True
 
         l.debug('SimState %s will not reach %#x.', state, self.addr)
         return False
@@ -164,6 +252,13 @@ class ExecuteAddressGoal(BaseGoal):
 
         return state.addr == self.addr
 
+    #
+    # Private methods
+    #
+
+    def _goal_nodes(self, cfg):
+        return [ node for node in cfg.graph if node.addr == self.addr ]
+
 
 class CallFunctionGoal(BaseGoal):
     """
@@ -213,35 +308,10 @@ class CallFunctionGoal(BaseGoal):
         :return:
         """
 
-        # Get the current CFGNode
-        node = self._get_cfg_node(cfg, state)
-
-        if node is None:
-            l.error("Failed to find CFGNode for state %s on the control flow graph.", state)
-            return False
+        distance = self.distance(cfg, state)
 
-        # crawl the graph to see if we can reach the target function within the limited steps
-        for src, dst in self._dfs_edges(cfg.graph, node, max_steps=peek_blocks):
-            the_node = None
-            if src.addr == self.function.addr:
-                the_node = src
-            elif dst.addr == self.function.addr:
-                the_node = dst
-
-            if the_node is not None:
-                if self.arguments is None:
-                    # we do not care about arguments
-                    return True
-
-                else:
-                    # check arguments
-                    arch = state.arch
-                    state = the_node.input_state
-                    same_arguments = self._check_arguments(arch, state)
-
-                    if same_arguments:
-                        # all arguments are the same!
-                        return True
+        if distance is not None and distance <= peek_blocks:
+            return True
 
         l.debug("SimState %s will not reach function %s.", state, self.function)
         return False
@@ -266,6 +336,15 @@ class CallFunctionGoal(BaseGoal):
     # Private methods
     #
 
+    def _goal_nodes(self, cfg):
+        nodes = [ node for node in cfg.graph if node.addr == self.function.addr ]
+        if self.arguments is None:
+            # we do not care about arguments
+            return nodes
+        # check arguments
+        return [ node for node in nodes if node.input_state is not None and
+                 self._check_arguments(node.input_state.arch, node.input_state) ]
+
     def _check_arguments(self, arch, state):
 
         # TODO: add calling convention detection to individual functions, and use that instead of the
@@ -369,6 +448,8 @@ class Director(ExplorationTechnique):
     - Might reach the destination within the peek depth. Those states are prioritized.
     - Will not reach the destination within the peek depth. Those states are de-prioritized. However, there is a little
       chance for those states to be explored as well in order to prevent over-fitting.
+
+    Active states are ordered by their distance (in basic blocks on the CFG) to the closest goal.
     """
 
     def __init__(self, peek_blocks=100, peek_functions=5, goals=None, cfg_keep_states=False,
@@ -455,6 +536,10 @@ class Director(ExplorationTechnique):
 
             self._cfg.resume(starts=starts, max_steps=self._peek_blocks)
 
+        # CFG recovery may have added or removed nodes and edges
+        for goal in self._goals:
+            goal.invalidate_distances()
+
     def _load_fallback_states(self, pg):
         """
         Load the last N deprioritized states will be extracted from the "deprioritized" stash and put to "active" stash.
@@ -500,7 +585,8 @@ class Director(ExplorationTechnique):
 
         if simgr.active:
             # TODO: pick some states from depriorized stash to active stash to avoid overfitting
-            pass
+            # states that are closer to a goal come first
+            simgr.apply(stash_func=lambda states: sorted(states, key=self._state_distance), stash='active')
 
         active_states = len(simgr.active)
         # deprioritized_states = len(simgr.deprioritized)
@@ -509,6 +595,22 @@ class Director(ExplorationTechnique):
 
         return simgr
 
+    def _state_distance(self, state):
+        """
+        Get the minimum distance from the state to any goal on the control flow graph.
+
+        :param angr.SimState state: The state to check.
+        :return: The distance in blocks, or infinity if no goal is known to be reachable.
+        :rtype: int or float
+        """
+
+        node = BaseGoal._get_cfg_node(self._cfg, state)
+        if node is None:
+            return float('inf')
+
+        distances = [ d for d in (goal._node_distance(self._cfg, node) for goal in self._goals) if d is not None ]
+        return min(distances) if distances else float('inf')
+
     def _check_goals(self, goal, state):  # pylint:disable=no-self-use
         """
         Check if the state is satisfying the goal.
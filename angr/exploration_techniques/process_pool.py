@@ -0,0 +1,197 @@
+import io
+import pickle
+import logging
+import concurrent.futures
+import concurrent.futures.process
+
+from . import ExplorationTechnique
+
+l = logging.getLogger(name=__name__)
+
+# the project of the current worker process
+_worker_project = None
+
+
+def _index_histories(states):
+    """
+    Index the history chains of a list of states.
+
+    :return: A tuple of a dict mapping id(history) to its persistent ID, and a list of history chains.
+    """
+    ids = { }
+    chains = [ ]
+    for i, state in enumerate(states):
+        chain = [ ]
+        h = state.history
+        while h is not None:
+            if id(h) not in ids:
+                ids[id(h)] = ('history', i, len(chain))
+            chain.append(h)
+            h = h.parent
+        chains.append(chain)
+    return ids, chains
+
+
+class _StatePickler(pickle.Pickler):
+    """
+    Pickles states without their project, and with references instead of copies of the histories that the receiving
+    side already has.
+    """
+    def __init__(self, file, project, history_ids=None):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._project = project
+        self._history_ids = history_ids
+
+    def persistent_id(self, obj):
+        if obj is self._project:
+            return 'project'
+        if self._history_ids:
+            return self._history_ids.get(id(obj), None)
+        return None
+
+
+class _StateUnpickler(pickle.Unpickler):
+    def __init__(self, file, project, history_chains=None):
+        super().__init__(file)
+        self._project = project
+        self._history_chains = history_chains
+
+    def persistent_load(self, pid):
+        if pid == 'project':
+            return self._project
+        _, i, j = pid
+        return self._history_chains[i][j]
+
+
+def _dumps(obj, project, history_ids=None):
+    f = io.BytesIO()
+    _StatePickler(f, project, history_ids=history_ids).dump(obj)
+    return f.getvalue()
+
+
+def _loads(data, project, history_chains=None):
+    return _StateUnpickler(io.BytesIO(data), project, history_chains=history_chains).load()
+
+
+def _init_worker(project, project_factory):
+    global _worker_project  # pylint:disable=global-statement
+    _worker_project = project_factory() if project_factory is not None else project
+
+
+def _step_batch(data, steps, save_unsat, run_args):
+    states = _loads(data, _worker_project)
+    history_ids, _ = _index_histories(states)
+
+    simgr = _worker_project.factory.simulation_manager(states, save_unsat=save_unsat, hierarchy=False)
+    for _ in range(steps):
+        simgr.step(**run_args)
+        if not simgr.active:
+            break
+
+    for record in simgr.errored:
+        # tracebacks cannot be pickled
+        record.traceback = None
+
+    stashes = { k: v for k, v in simgr.stashes.items() if v }
+    return _dumps((stashes, simgr.errored), _worker_project, history_ids=history_ids)
+
+
+class ProcessPool(ExplorationTechnique):
+    """
+    Step states in parallel in a pool of worker processes.
+
+    Every worker holds its own copy of the project, so block caches stay warm across steps. At each step, the states
+    in the stepped stash are split into batches, which are pickled (without the project, and with references to the
+    histories both sides share) and stepped for `steps_per_batch` steps by the workers.
+
+    Shipping the states to the workers pickles their whole history ancestry, so the cost of each step grows linearly
+    with the depth of the paths (see tests/perf_process_pool.py). Only the successors coming back reference the
+    histories that this process already has. Larger values of `steps_per_batch` amortize this cost over more steps.
+
+    Techniques that hook `filter`, `selector`, `step_state` or `successors` are not consulted for states that are
+    stepped in workers. Steps with custom `selector_func`, `successor_func` or `filter_func`, or with arguments that
+    cannot be pickled, fall back to stepping in the current process.
+    """
+    def __init__(self, workers=None, batch_size=None, steps_per_batch=1, min_states=2, project_factory=None,
+                 mp_context=None):
+        """
+        :param int workers:             Number of worker processes. Defaults to the number of CPUs.
+        :param int batch_size:          Maximum number of states shipped to a worker at once. Defaults to an even split
+                                        of the stash between all workers.
+        :param int steps_per_batch:     Number of steps each worker takes on a batch before returning its successors.
+        :param int min_states:          Step in the current process when the stash has fewer states than this.
+        :param project_factory:         A picklable callable creating the project in each worker. Defaults to
+                                        inheriting (or unpickling) the project of the simulation manager.
+        :param mp_context:              A multiprocessing context used to start the workers.
+        """
+        super(ProcessPool, self).__init__()
+        self.workers = workers
+        self.batch_size = batch_size
+        self.steps_per_batch = steps_per_batch
+        self.min_states = min_states
+        self.project_factory = project_factory
+        self.mp_context = mp_context
+
+        self.executor = None
+
+    def setup(self, simgr):
+        self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers,
+                                                               mp_context=self.mp_context,
+                                                               initializer=_init_worker,
+                                                               initargs=(self.project if self.project_factory is None
+                                                                         else None,
+                                                                         self.project_factory))
+        if self.workers is None:
+            self.workers = self.executor._max_workers
+
+    def shutdown(self):
+        """
+        Shut down the worker processes.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def step(self, simgr, stash='active', selector_func=None, successor_func=None, filter_func=None, step_func=None,
+             **run_args):
+        states = simgr.stashes.get(stash, [ ])
+        if self.executor is None or len(states) < self.min_states or \
+                selector_func is not None or successor_func is not None or filter_func is not None:
+            return simgr.step(stash=stash, selector_func=selector_func, successor_func=successor_func,
+                              filter_func=filter_func, step_func=step_func, **run_args)
+
+        try:
+            pickle.dumps(run_args)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            l.warning("Arguments to step() cannot be pickled. Stepping in the current process.")
+            return simgr.step(stash=stash, step_func=step_func, **run_args)
+
+        batch_size = self.batch_size or -(-len(states) // self.workers)
+        batches = [ states[i:i + batch_size] for i in range(0, len(states), batch_size) ]
+
+        # collect all the results before touching the stash, so that a failing batch does not lose any state
+        futures = [ ]
+        try:
+            for batch in batches:
+                futures.append(self.executor.submit(_step_batch, _dumps(batch, self.project), self.steps_per_batch,
+                                                    simgr._save_unsat, run_args))
+            results = [ _loads(future.result(), self.project, history_chains=_index_histories(batch)[1])
+                        for batch, future in zip(batches, futures) ]
+        except Exception as ex:  # pylint:disable=broad-except
+            l.warning("Stepping in worker processes failed. Stepping in the current process.", exc_info=True)
+            for future in futures:
+                future.cancel()
+            if isinstance(ex, concurrent.futures.process.BrokenProcessPool):
+                # a worker died, the pool cannot be used anymore
+                self.shutdown()
+            return simgr.step(stash=stash, step_func=step_func, **run_args)
+
+        simgr._clear_states(stash)
+        for stashes, errored in results:
+            for to_stash, successors in stashes.items():
+                simgr.populate(stash if to_stash == 'active' else to_stash, successors)
+            simgr._errored.extend(errored)
+
+        if step_func is not None:
+            return step_func(simgr)
+        return simgr
@@ -1,5 +1,9 @@
 from typing import List
+from array import array
+from collections import defaultdict
+import bisect
 import logging
+import mmap
 
 from . import ExplorationTechnique
 from .. import BP_BEFORE, BP_AFTER, sim_options
@@ -112,7 +116,8 @@ class Tracer(ExplorationTechnique):
     If the given concrete input makes the program crash, you should provide crash_addr, and the
     crashing state will be found in the 'crashed' stash.
 
-    :param trace:               The basic block trace.
+    :param trace:               The basic block trace, as a sequence of addresses, or the path to a file of native
+                                uint64 addresses, which is memory-mapped.
     :param resiliency:          Should we continue to step forward even if qemu and angr disagree?
     :param keep_predecessors:   Number of states before the final state we should log.
     :param crash_addr:          If the trace resulted in a crash, provide the crashing instruction
@@ -137,7 +142,9 @@ class Tracer(ExplorationTechnique):
             copy_states=False,
             mode=TracingMode.Strict):
         super(Tracer, self).__init__()
-        self._trace = trace
+        self._trace = self._load_trace(trace)
+        # address -> sorted positions of the address in the trace. built on first use
+        self._trace_positions = None
         self._resiliency = resiliency
         self._crash_addr = crash_addr
         self._copy_states = copy_states
@@ -206,6 +213,47 @@ class Tracer(ExplorationTechnique):
     def complete(self, simgr):
         return bool(simgr.traced)
 
+    @staticmethod
+    def _load_trace(trace):
+        """
+        Store the trace as an array of uint64 addresses.
+
+        :param trace:   A sequence of addresses, the path to a file of native uint64 addresses, or None.
+        :return:        An array.array or a memoryview of uint64 addresses, or None.
+        """
+        if trace is None or isinstance(trace, (array, memoryview)):
+            return trace
+        if isinstance(trace, str):
+            with open(trace, 'rb') as f:
+                if f.seek(0, 2) == 0:
+                    return array('Q')
+                # the mapping stays valid after the file is closed
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)).cast('Q')
+        return array('Q', trace)
+
+    def _trace_index(self, addr, start):
+        """
+        Find the first position of an address in the trace, at or after a given position.
+
+        :param int addr:    The address in the trace.
+        :param int start:   The position to start from.
+        :return:            The position.
+        :rtype:             int
+        :raises ValueError: If the address does not appear in the trace after the position.
+        """
+        if self._trace_positions is None:
+            # one uint64 array per distinct address, to keep the index as compact as the trace itself
+            positions = defaultdict(lambda: array('Q'))
+            for i, trace_addr in enumerate(self._trace):
+                positions[trace_addr].append(i)
+            self._trace_positions = dict(positions)
+
+        positions = self._trace_positions.get(addr, ())
+        i = bisect.bisect_left(positions, start)
+        if i == len(positions):
+            raise ValueError("%#x is not in the trace after position %d" % (addr, start))
+        return positions[i]
+
     def filter(self, simgr, state, **kwargs):
         # check completion
         if state.globals['trace_idx'] >= len(self._trace) - 1:
@@ -374,16 +422,25 @@ class Tracer(ExplorationTechnique):
             if sync is not None:
                 raise Exception("TODO")
 
-            for addr in state.history.recent_bbl_addrs:
-                if addr == state.unicorn.transmit_addr:
-                    continue
+            addrs = [ addr for addr in state.history.recent_bbl_addrs if addr != state.unicorn.transmit_addr ]
 
-                if self._compare_addr(self._trace[idx], addr):
-                    idx += 1
-                else:
-                    raise TracerDesyncError('BUG! Please investigate the claim in the comment above me',
-                                            deviating_addr=addr,
-                                            deviating_trace_idx=idx)
+            # fast path: all blocks are in the object we are in, so the whole run can be compared with the trace at once
+            try:
+                expected = array('Q', (addr + self._current_slide for addr in addrs)) \
+                    if self._current_slide is not None else None
+            except OverflowError:
+                expected = None
+
+            if expected is not None and self._trace[idx:idx + len(addrs)] == expected:
+                idx += len(addrs)
+            else:
+                for addr in addrs:
+                    if self._compare_addr(self._trace[idx], addr):
+                        idx += 1
+                    else:
+                        raise TracerDesyncError('BUG! Please investigate the claim in the comment above me',
+                                                deviating_addr=addr,
+                                                deviating_trace_idx=idx)
 
             idx -= 1 # use normal code to do the last synchronization
 
@@ -554,7 +611,7 @@ class Tracer(ExplorationTechnique):
     def _sync(self, state, idx, addr):
         addr_translated = self._translate_state_addr(addr)
         try:
-            sync_idx = self._trace.index(addr_translated, idx)
+            sync_idx = self._trace_index(addr_translated, idx)
         except ValueError:
             l.error("Trying to synchronize at %#x (%#x) but it does not appear in the trace?")
             return False
@@ -575,7 +632,7 @@ class Tracer(ExplorationTechnique):
         self._current_slide = self._aslr_slides[target_obj]
         target_addr += self._current_slide
         try:
-            target_idx = self._trace.index(target_addr, state.globals['trace_idx'] + 1)
+            target_idx = self._trace_index(target_addr, state.globals['trace_idx'] + 1)
         except ValueError as e:
             raise AngrTracerError("Trace failed to synchronize during fast forward? You might want to unhook %s." % (self.project.hooked_by(state.history.addr).display_name)) from e
         else:
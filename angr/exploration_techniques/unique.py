@@ -1,3 +1,4 @@
+import itertools
 from difflib import SequenceMatcher
 from collections import Counter
 
@@ -12,6 +13,9 @@ class UniqueSearch(ExplorationTechnique):
     A path's uniqueness is determined by its average similarity between the other (deferred) paths.
     Similarity is calculated based on the supplied `similarity_func`, which by default is:
     The (L2) distance between the counts of the state addresses in the history of the path.
+
+    With the default similarity function, the address counts of each state are kept as a sparse vector and updated
+    from the blocks executed in each step, instead of being rebuilt from the full history for every pair of states.
     """
 
     def __init__(self, similarity_func=None, deferred_stash='deferred'):
@@ -25,17 +29,34 @@ class UniqueSearch(ExplorationTechnique):
         self.uniqueness = dict()
         self.num_deadended = 0
 
+        # state -> (address counts, squared L2 norm of the counts). only used with the default similarity function
+        self._counts = dict()
+
     def setup(self, simgr):
         if self.deferred_stash not in simgr.stashes:
             simgr.stashes[self.deferred_stash] = []
 
     def step(self, simgr, stash='active', **kwargs):
+        incremental = self.similarity_func is UniqueSearch.similarity
+        if incremental:
+            # the histories of the states being stepped are the ancestors of the histories of their successors
+            parent_counts = { id(s.history): self._counts_of(s) for s in simgr.stashes[stash] }
+            stepped_states = simgr.stashes[stash][:]
+
         simgr = simgr.step(stash=stash, **kwargs)
 
         old_states = simgr.stashes[self.deferred_stash][:]
         new_states = simgr.stashes[stash][:]
         simgr.move(from_stash=stash, to_stash=self.deferred_stash)
 
+        similarity_func = self.similarity_func
+        if incremental:
+            for state in stepped_states:
+                self._counts.pop(state, None)
+            for state in itertools.chain(new_states, simgr.deadended[self.num_deadended:]):
+                self._counts[state] = self._derive_counts(state, parent_counts)
+            similarity_func = self._incremental_similarity
+
         def update_average(state, new, mem=1.0):
             """
             param state: The state to update the average for.
@@ -50,19 +71,22 @@ class UniqueSearch(ExplorationTechnique):
             self.uniqueness[state_a] = 0, 0
             for state_b in old_states:
                 # Update similarity averages between new and old states
-                similarity = self.similarity_func(state_a, state_b)
+                similarity = similarity_func(state_a, state_b)
                 update_average(state_a, similarity)
                 update_average(state_b, similarity)
             for state_b in (s for s in new_states if s is not state_a):
                 # Update similarity averages between new states
-                similarity = self.similarity_func(state_a, state_b)
+                similarity = similarity_func(state_a, state_b)
                 update_average(state_a, similarity)
 
         for state_a in simgr.stashes[self.deferred_stash]:
             for state_b in simgr.deadended[self.num_deadended:]:
                 # Update similarity averages between all states and newly deadended states
-                similarity = self.similarity_func(state_a, state_b)
+                similarity = similarity_func(state_a, state_b)
                 update_average(state_a, similarity)
+        if incremental:
+            for state in simgr.deadended[self.num_deadended:]:
+                del self._counts[state]
         self.num_deadended = len(simgr.deadended)
 
         if self.uniqueness:
@@ -74,6 +98,64 @@ class UniqueSearch(ExplorationTechnique):
 
         return simgr
 
+    def _counts_of(self, state):
+        """
+        Get the address counts of a state, computing them from its full history if they are not known yet.
+
+        :param state:   The state.
+        :return:        A tuple of the address counts and their squared L2 norm.
+        """
+        try:
+            return self._counts[state]
+        except KeyError:
+            counts = Counter(state.history.bbl_addrs)
+            self._counts[state] = counts, sum(c * c for c in counts.values())
+            return self._counts[state]
+
+    @staticmethod
+    def _derive_counts(state, parent_counts):
+        """
+        Compute the address counts of a successor state from the counts of the state it was stepped from.
+
+        :param state:           The successor state.
+        :param parent_counts:   A dict mapping ids of the histories of the stepped states to their counts.
+        :return:                A tuple of the address counts and their squared L2 norm.
+        """
+        recent = [ ]
+        history = state.history
+        while history is not None and id(history) not in parent_counts:
+            recent.append(history.recent_bbl_addrs)
+            history = history.parent
+
+        if history is None:
+            counts = Counter(state.history.bbl_addrs)
+            return counts, sum(c * c for c in counts.values())
+
+        counts, norm = parent_counts[id(history)]
+        counts = Counter(counts)
+        for addrs in recent:
+            for addr in addrs:
+                # (c + 1) ** 2 - c ** 2
+                norm += 2 * counts[addr] + 1
+                counts[addr] += 1
+        return counts, norm
+
+    def _incremental_similarity(self, state_a, state_b):
+        """
+        The same as similarity(), computed from the sparse address counts of both states with
+        ||a - b||^2 = ||a||^2 + ||b||^2 - 2 * a.b
+
+        :param state_a: The first state to compare
+        :param state_b: The second state to compare
+        """
+        count_a, norm_a = self._counts_of(state_a)
+        count_b, norm_b = self._counts_of(state_b)
+        if len(count_a) > len(count_b):
+            count_a, count_b = count_b, count_a
+        dot = sum(c * count_b.get(addr, 0) for addr, c in count_a.items())
+        normal_distance = max(norm_a + norm_b - 2 * dot, 0) ** 0.5
+        return 1.0 / (1 + normal_distance)
+
     @staticmethod
     def similarity(state_a, state_b):
         """
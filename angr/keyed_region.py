@@ -105,19 +105,29 @@ class KeyedRegion:
     Registers and function frames can all be viewed as a keyed region.
     """
 
-    __slots__ = ('_storage', '_object_mapping', '_phi_node_contains' )
+    __slots__ = ('_storage', '_object_mapping', '_phi_node_contains', '_storage_owned', '_object_mapping_owned',
+                 '_owned_items', )
 
     def __init__(self, tree=None, phi_node_contains=None):
         self._storage = SortedDict() if tree is None else tree
         self._object_mapping = weakref.WeakValueDictionary()
         self._phi_node_contains = phi_node_contains
 
+        # copy-on-write bookkeeping. the storage, the object mapping, and each RegionObject may be shared with copies of
+        # this region. they are only duplicated when they are about to be modified.
+        self._storage_owned = True
+        self._object_mapping_owned = True
+        self._owned_items = set() if tree is None else None
+
     def __getstate__(self):
         return self._storage, dict(self._object_mapping), self._phi_node_contains
 
     def __setstate__(self, s):
         self._storage, om, self._phi_node_contains = s
         self._object_mapping = weakref.WeakValueDictionary(om)
+        self._storage_owned = True
+        self._object_mapping_owned = True
+        self._owned_items = None
 
     def _get_container(self, offset):
         try:
@@ -163,10 +173,18 @@ class KeyedRegion:
         if not self._storage:
             return KeyedRegion(phi_node_contains=self._phi_node_contains)
 
-        kr = KeyedRegion(phi_node_contains=self._phi_node_contains)
-        for key, ro in self._storage.items():
-            kr._storage[key] = ro.copy()
-        kr._object_mapping = self._object_mapping.copy()
+        # the new region shares all storage with this one. both regions copy-on-write from now on.
+        kr = KeyedRegion.__new__(KeyedRegion)
+        kr._storage = self._storage
+        kr._object_mapping = self._object_mapping
+        kr._phi_node_contains = self._phi_node_contains
+        kr._storage_owned = False
+        kr._object_mapping_owned = False
+        kr._owned_items = set()
+
+        self._storage_owned = False
+        self._object_mapping_owned = False
+        self._owned_items = set()
         return kr
 
     def merge(self, other, replacements=None):
@@ -182,7 +200,7 @@ class KeyedRegion:
             for so in item.stored_objects:  # type: StoredObject
                 if replacements and so.obj in replacements:
                     so = StoredObject(so.start, replacements[so.obj], so.size)
-                self._object_mapping[so.obj_id] = so
+                self._writable_object_mapping()[so.obj_id] = so
                 self.__store(so, overwrite=False)
 
         return self
@@ -200,7 +218,7 @@ class KeyedRegion:
             for so in item.stored_objects:  # type: StoredObject
                 if replacements and so.obj in replacements:
                     so = StoredObject(so.start, replacements[so.obj], so.size)
-                self._object_mapping[so.obj_id] = so
+                self._writable_object_mapping()[so.obj_id] = so
                 self.__store(so, overwrite=False, merge_to_top=True, top=top)
 
         return self
@@ -340,6 +358,38 @@ class KeyedRegion:
     # Private methods
     #
 
+    def _writable_object_mapping(self):
+        if not self._object_mapping_owned:
+            self._object_mapping = self._object_mapping.copy()
+            self._object_mapping_owned = True
+        return self._object_mapping
+
+    def _writable_storage(self):
+        if not self._storage_owned:
+            # RegionObjects are still shared with other regions until they are modified
+            self._storage = self._storage.copy()
+            self._storage_owned = True
+        return self._storage
+
+    def _writable_item(self, key):
+        """
+        Get the RegionObject stored at the given key, and make sure it is not shared with any other region.
+
+        :param int key: The base offset of the RegionObject.
+        :return:        The RegionObject.
+        :rtype:         RegionObject
+        """
+
+        item = self._storage[key]
+        if self._owned_items is None:
+            # all items are owned
+            return item
+        if key not in self._owned_items:
+            item = item.copy()
+            self._writable_storage()[key] = item
+            self._owned_items.add(key)
+        return item
+
     def _store(self, start, obj, size, overwrite=False):
         """
         Store a variable into the storage.
@@ -352,7 +402,7 @@ class KeyedRegion:
         """
 
         stored_object = StoredObject(start, obj, size)
-        self._object_mapping[stored_object.obj_id] = stored_object
+        self._writable_object_mapping()[stored_object.obj_id] = stored_object
         self.__store(stored_object, overwrite=overwrite)
 
     def __store(self, stored_object, overwrite=False, merge_to_top=False, top=None):
@@ -382,8 +432,10 @@ class KeyedRegion:
         to_update = {start: RegionObject(start, object_size, {stored_object})}
         last_end = start
 
+        storage = self._writable_storage()
+
         for floor_key in overlapping_items:
-            item = self._storage[floor_key]
+            item = storage[floor_key]
             if item.start < start:
                 # we need to break this item into two
                 a, b = item.split(start)
@@ -411,13 +463,17 @@ class KeyedRegion:
                 to_update[b.start] = b
                 last_end = b.end
             else:
+                # this item is modified in place
+                item = self._writable_item(floor_key)
                 if overwrite:
                     item.set_object(stored_object)
                 else:
                     self._add_object_with_check(item, stored_object, merge_to_top=merge_to_top, top=top)
                 to_update[item.start] = item
 
-        self._storage.update(to_update)
+        storage.update(to_update)
+        if self._owned_items is not None:
+            self._owned_items.update(to_update)
 
     def _is_overlapping(self, start, variable):
 
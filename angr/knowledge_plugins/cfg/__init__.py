@@ -3,4 +3,5 @@ from .memory_data import MemoryDataSort, MemoryData
 from .cfg_node import CFGNode, CFGENode
 from .indirect_jump import IndirectJump
 from .cfg_model import CFGModel
+from .compact_cfg_model import CompactCFGModel
 from .cfg_manager import CFGManager
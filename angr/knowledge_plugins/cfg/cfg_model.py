@@ -10,6 +10,7 @@ from ...serializable import Serializable
 from ...utils.enums_conv import cfg_jumpkind_to_pb, cfg_jumpkind_from_pb
 from ...errors import AngrCFGError
 from .cfg_node import CFGNode
+from .compact_cfg_model import CompactCFGModel
 from .memory_data import MemoryData
 from ...misc.ux import once
 
@@ -177,6 +178,16 @@ class CFGModel(Serializable):
 
         return model
 
+    def compact(self):
+        """
+        Create a read-only, compact copy of this model that stores nodes and edges in arrays.
+
+        :return: The compact model.
+        :rtype:  CompactCFGModel
+        """
+
+        return CompactCFGModel(self)
+
     #
     # CFG View
     #
@@ -0,0 +1,557 @@
+import bisect
+import logging
+from array import array
+
+import networkx
+
+from ...errors import AngrCFGError
+from .cfg_node import CFGNode
+
+
+l = logging.getLogger(name=__name__)
+
+# node flags
+_IS_SYSCALL = 1
+_THUMB = 2
+_NO_RET = 4
+_HAS_RETURN = 8
+_NO_FUNCTION_ADDRESS = 16
+_NO_SIZE = 32
+
+# marks a None in unsigned columns
+_NONE = 0xffffffffffffffff
+
+
+class CompactCFGModel:
+    """
+    A read-only, compact representation of a CFGModel.
+
+    Instead of a networkx.DiGraph of CFGNode instances, nodes and edges are stored in columnar arrays: nodes are sorted
+    by their addresses, and both successors and predecessors are stored in compressed sparse row (CSR) form. CFGNode
+    instances are created on demand whenever a method returns a node. Since CFGNodes are compared by their addresses,
+    sizes, and SimProcedure names, nodes created from the same entry compare and hash as equal.
+
+    IRSBs and byte strings of nodes are not kept. Nodes of CFGEmulated are not supported.
+    """
+
+    __slots__ = ('ident', 'jump_tables', 'memory_data', 'insn_addr_to_memory_data', '_cfg_manager', '_iropt_level',
+                 '_addrs', '_sizes', '_func_addrs', '_flags', '_max_size', '_insn_offsets', '_insn_deltas',
+                 '_simprocedure_names', '_names', '_block_ids', '_block_id_to_idx', '_jumpkinds', '_succ_offsets',
+                 '_succ_nodes', '_edge_jumpkinds', '_edge_ins_addrs', '_edge_stmt_idxs', '_edge_data',
+                 '_pred_offsets', '_pred_nodes', '_pred_edges', )
+
+    def __init__(self, model):
+        """
+        :param CFGModel model: The model to compact.
+        """
+
+        self.ident = model.ident
+        self._cfg_manager = model._cfg_manager
+        self._iropt_level = model._iropt_level
+
+        self.jump_tables = model.jump_tables
+        self.memory_data = model.memory_data
+        self.insn_addr_to_memory_data = model.insn_addr_to_memory_data
+
+        graph = model.graph
+
+        # nodes at the same address keep the order of _nodes_by_addr, so get_any_node() returns the same node
+        def _sort_key(n):
+            nodes_at_addr = model._nodes_by_addr.get(n.addr, ())
+            for i, node in enumerate(nodes_at_addr):
+                if node is n:
+                    return n.addr, i
+            return n.addr, len(nodes_at_addr)
+
+        for n in graph:
+            if type(n) is not CFGNode or type(n.addr) is not int:
+                raise AngrCFGError("CompactCFGModel only supports CFGNodes with integer addresses.")
+        nodes = sorted(graph, key=_sort_key)
+        node_to_idx = { id(n): i for i, n in enumerate(nodes) }
+
+        self._addrs = array('Q')
+        self._sizes = array('I')
+        self._func_addrs = array('Q')
+        self._flags = array('B')
+        self._max_size = 0
+        self._insn_offsets = array('I', [ 0 ])
+        self._insn_deltas = array('i')
+        self._simprocedure_names = { }
+        self._names = { }
+        self._block_ids = { }
+        self._block_id_to_idx = { }
+
+        for i, n in enumerate(nodes):
+            flags = 0
+            if n.is_syscall:
+                flags |= _IS_SYSCALL
+            if n.thumb:
+                flags |= _THUMB
+            if n.no_ret:
+                flags |= _NO_RET
+            if n.has_return:
+                flags |= _HAS_RETURN
+            if n.function_address is None:
+                flags |= _NO_FUNCTION_ADDRESS
+            if n.size is None:
+                flags |= _NO_SIZE
+            else:
+                self._max_size = max(self._max_size, n.size)
+
+            self._addrs.append(n.addr)
+            self._sizes.append(n.size if n.size is not None else 0)
+            self._func_addrs.append(n.function_address if n.function_address is not None else 0)
+            self._flags.append(flags)
+
+            self._insn_deltas.extend(ins_addr - n.addr for ins_addr in n.instruction_addrs)
+            self._insn_offsets.append(len(self._insn_deltas))
+
+            if n.simprocedure_name is not None:
+                self._simprocedure_names[i] = n.simprocedure_name
+            if n._name != n.simprocedure_name:
+                self._names[i] = n._name
+            if n.block_id != n.addr:
+                self._block_ids[i] = n.block_id
+                self._block_id_to_idx[n.block_id] = i
+
+        # edges
+        self._jumpkinds = [ ]
+        jumpkind_to_id = { }
+
+        self._succ_offsets = array('I', [ 0 ])
+        self._succ_nodes = array('I')
+        self._edge_jumpkinds = array('B')
+        self._edge_ins_addrs = array('Q')
+        self._edge_stmt_idxs = array('q')
+        self._edge_data = { }
+        edge_ids = { }
+
+        for i, n in enumerate(nodes):
+            for dst, data in graph.succ[n].items():
+                edge_id = len(self._succ_nodes)
+                dst_idx = node_to_idx[id(dst)]
+                edge_ids[(i, dst_idx)] = edge_id
+                self._succ_nodes.append(dst_idx)
+
+                jumpkind = data.get('jumpkind', None)
+                if jumpkind not in jumpkind_to_id:
+                    jumpkind_to_id[jumpkind] = len(self._jumpkinds)
+                    self._jumpkinds.append(jumpkind)
+                self._edge_jumpkinds.append(jumpkind_to_id[jumpkind])
+
+                ins_addr = data.get('ins_addr', None)
+                stmt_idx = data.get('stmt_idx', None)
+                self._edge_ins_addrs.append(ins_addr if ins_addr is not None else _NONE)
+                # DEFAULT_STATEMENT is -2
+                self._edge_stmt_idxs.append(stmt_idx if stmt_idx is not None else -1)
+
+                extra = { k: v for k, v in data.items() if k not in ('jumpkind', 'ins_addr', 'stmt_idx') }
+                if extra:
+                    self._edge_data[edge_id] = extra
+            self._succ_offsets.append(len(self._succ_nodes))
+
+        # predecessors keep the order of the original graph
+        self._pred_offsets = array('I', [ 0 ])
+        self._pred_nodes = array('I')
+        self._pred_edges = array('I')
+        for i, n in enumerate(nodes):
+            for src in graph.pred[n]:
+                src_idx = node_to_idx[id(src)]
+                self._pred_nodes.append(src_idx)
+                self._pred_edges.append(edge_ids[(src_idx, i)])
+            self._pred_offsets.append(len(self._pred_nodes))
+
+    def __getstate__(self):
+        return dict((k, getattr(self, k)) for k in self.__slots__)
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
+    def __repr__(self):
+        return "<CompactCFGModel %s with %d nodes and %d edges>" % (self.ident, len(self._addrs),
+                                                                    len(self._succ_nodes))
+
+    def __len__(self):
+        return len(self._addrs)
+
+    #
+    # Properties
+    #
+
+    @property
+    def project(self):
+        if self._cfg_manager is None:
+            return None
+        return self._cfg_manager._kb._project
+
+    @property
+    def graph(self):
+        """
+        A networkx.DiGraph of all nodes and edges. The graph is created upon each access, which is slow and takes as
+        much memory as a regular CFGModel does. Use the query methods of this class whenever possible.
+
+        :rtype: networkx.DiGraph
+        """
+
+        graph = networkx.DiGraph()
+        nodes = [ self._node(i) for i in range(len(self._addrs)) ]
+        graph.add_nodes_from(nodes)
+        for i, src in enumerate(nodes):
+            for edge_id in range(self._succ_offsets[i], self._succ_offsets[i + 1]):
+                graph.add_edge(src, nodes[self._succ_nodes[edge_id]], **self._edge_attrs(edge_id))
+        return graph
+
+    #
+    # Private methods
+    #
+
+    def _node(self, idx):
+        """
+        Create the CFGNode of a given node index.
+        """
+
+        flags = self._flags[idx]
+        addr = self._addrs[idx]
+        instruction_addrs = [ addr + delta for delta in
+                              self._insn_deltas[self._insn_offsets[idx]:self._insn_offsets[idx + 1]] ]
+        simprocedure_name = self._simprocedure_names.get(idx, None)
+
+        node = CFGNode(addr,
+                       None if flags & _NO_SIZE else self._sizes[idx],
+                       self,
+                       simprocedure_name=simprocedure_name,
+                       no_ret=bool(flags & _NO_RET),
+                       function_address=None if flags & _NO_FUNCTION_ADDRESS else self._func_addrs[idx],
+                       block_id=self._block_ids.get(idx, addr),
+                       instruction_addrs=instruction_addrs,
+                       thumb=bool(flags & _THUMB),
+                       is_syscall=bool(flags & _IS_SYSCALL),
+                       )
+        if idx in self._names:
+            node._name = self._names[idx]
+        node.has_return = bool(flags & _HAS_RETURN)
+        return node
+
+    def _node_index(self, node):
+        """
+        Find the index of a CFGNode, or None if the node is not in this model.
+        """
+
+        if type(node) is not CFGNode:
+            return None
+        idx = bisect.bisect_left(self._addrs, node.addr)
+        while idx < len(self._addrs) and self._addrs[idx] == node.addr:
+            size = None if self._flags[idx] & _NO_SIZE else self._sizes[idx]
+            if size == node.size and self._simprocedure_names.get(idx, None) == node.simprocedure_name:
+                return idx
+            idx += 1
+        return None
+
+    def _edge_attrs(self, edge_id):
+        ins_addr = self._edge_ins_addrs[edge_id]
+        stmt_idx = self._edge_stmt_idxs[edge_id]
+        attrs = {
+            'jumpkind': self._jumpkinds[self._edge_jumpkinds[edge_id]],
+            'ins_addr': ins_addr if ins_addr != _NONE else None,
+            'stmt_idx': stmt_idx if stmt_idx != -1 else None,
+        }
+        if edge_id in self._edge_data:
+            attrs.update(self._edge_data[edge_id])
+        return attrs
+
+    def _accepts_jumpkind(self, edge_id, excluding_fakeret, jumpkind):
+        jk = self._jumpkinds[self._edge_jumpkinds[edge_id]]
+        if jumpkind is not None:
+            return jk == jumpkind
+        if excluding_fakeret:
+            return jk != 'Ijk_FakeRet'
+        return True
+
+    def _dfs_reachable(self, idx, offsets, neighbors, depth_limit):
+        """
+        Get the indices of all nodes reachable from a node within `depth_limit` steps, following the same traversal as
+        networkx.dfs_successors().
+        """
+
+        if depth_limit is None:
+            depth_limit = len(self._addrs)
+
+        visited = { idx }
+        reached = set()
+        stack = [ (depth_limit, iter(range(offsets[idx], offsets[idx + 1]))) ]
+        while stack:
+            depth_now, children = stack[-1]
+            try:
+                child = neighbors[next(children)]
+            except StopIteration:
+                stack.pop()
+                continue
+            if child not in visited:
+                visited.add(child)
+                reached.add(child)
+                if depth_now > 1:
+                    stack.append((depth_now - 1, iter(range(offsets[child], offsets[child + 1]))))
+        return reached
+
+    #
+    # Other methods
+    #
+
+    def copy(self):
+        # the model is read-only, so all columns can be shared
+        model = CompactCFGModel.__new__(CompactCFGModel)
+        for k in self.__slots__:
+            setattr(model, k, getattr(self, k))
+        model.jump_tables = self.jump_tables.copy()
+        model.memory_data = self.memory_data.copy()
+        model.insn_addr_to_memory_data = self.insn_addr_to_memory_data.copy()
+        return model
+
+    def to_model(self, cfg_manager=None):
+        """
+        Create a regular CFGModel from this model.
+
+        :param cfg_manager: The CFGManager of the new model.
+        :return:            The new model.
+        :rtype:             CFGModel
+        """
+
+        from .cfg_model import CFGModel  # pylint:disable=import-outside-toplevel
+
+        model = CFGModel(self.ident, cfg_manager=cfg_manager if cfg_manager is not None else self._cfg_manager)
+        model._iropt_level = self._iropt_level
+        model.jump_tables = self.jump_tables.copy()
+        model.memory_data = self.memory_data.copy()
+        model.insn_addr_to_memory_data = self.insn_addr_to_memory_data.copy()
+        model.graph = self.graph
+        for node in model.graph:
+            node._cfg_model = model
+            model._nodes[node.block_id] = node
+            model._nodes_by_addr[node.addr].append(node)
+        return model
+
+    #
+    # CFG View
+    #
+
+    def get_node(self, block_id):
+        """
+        Get a single node from node key.
+
+        :param BlockID block_id: Block ID of the node.
+        :return:                 The CFGNode
+        :rtype:                  CFGNode
+        """
+
+        if block_id in self._block_id_to_idx:
+            return self._node(self._block_id_to_idx[block_id])
+        if type(block_id) is int:
+            idx = bisect.bisect_left(self._addrs, block_id)
+            while idx < len(self._addrs) and self._addrs[idx] == block_id:
+                if idx not in self._block_ids:
+                    return self._node(idx)
+                idx += 1
+        return None
+
+    def get_any_node(self, addr, is_syscall=None, anyaddr=False, force_fastpath=False):
+        """
+        Get an arbitrary CFGNode from the graph.
+
+        :param int addr:            Address of the beginning of the basic block. Set anyaddr to True to support
+                                    arbitrary address.
+        :param bool is_syscall:     Whether you want to get the syscall node or any other node. None means get either,
+                                    True means get a syscall node, False means get something that isn't a syscall node.
+        :param bool anyaddr:        If anyaddr is True, then addr doesn't have to be the beginning address of a basic
+                                    block.
+        :param bool force_fastpath: If force_fastpath is True, only a node starting at `addr` is returned.
+        :return: A CFGNode if there is any that satisfies given conditions, or None otherwise
+        """
+
+        idx = bisect.bisect_left(self._addrs, addr)
+
+        # fastpath: the first node at this address
+        if not anyaddr and idx < len(self._addrs) and self._addrs[idx] == addr:
+            return self._node(idx)
+        if force_fastpath:
+            return None
+
+        def _match(i):
+            return is_syscall is None or bool(self._flags[i] & _IS_SYSCALL) == is_syscall
+
+        # nodes starting at this address
+        i = idx
+        while i < len(self._addrs) and self._addrs[i] == addr:
+            if _match(i):
+                return self._node(i)
+            i += 1
+
+        if anyaddr:
+            # nodes covering this address start at most _max_size bytes before it
+            i = idx - 1
+            while i >= 0 and self._addrs[i] + self._max_size > addr:
+                if not self._flags[i] & _NO_SIZE and self._addrs[i] <= addr < self._addrs[i] + self._sizes[i] and \
+                        _match(i):
+                    return self._node(i)
+                i -= 1
+
+        return None
+
+    def get_all_nodes(self, addr, is_syscall=None, anyaddr=False):  # pylint:disable=unused-argument
+        """
+        Get all CFGNodes whose address is the specified one.
+
+        :param addr:       Address of the node
+        :param is_syscall: This argument is ignored.
+        :param anyaddr:    Also return nodes covering the address.
+        :return:           all CFGNodes
+        """
+
+        idx = bisect.bisect_right(self._addrs, addr)
+        lo = idx
+        while lo > 0 and self._addrs[lo - 1] == addr:
+            lo -= 1
+        if anyaddr:
+            while lo > 0 and self._addrs[lo - 1] + self._max_size > addr:
+                lo -= 1
+
+        results = [ ]
+        for i in range(lo, idx):
+            if self._addrs[i] == addr or (anyaddr and not self._flags[i] & _NO_SIZE and
+                                          self._addrs[i] <= addr < self._addrs[i] + self._sizes[i]):
+                results.append(self._node(i))
+        return results
+
+    def nodes(self):
+        """
+        An iterator of all nodes in the graph.
+
+        :return: The iterator.
+        :rtype: iterator
+        """
+
+        return (self._node(i) for i in range(len(self._addrs)))
+
+    def get_predecessors(self, cfgnode, excluding_fakeret=True, jumpkind=None):
+        """
+        Get predecessors of a node in the control flow graph.
+
+        :param CFGNode cfgnode:             The node.
+        :param bool excluding_fakeret:      True if you want to exclude all predecessors that is connected to the node
+                                            with a fakeret edge.
+        :param str or None jumpkind:        Only return predecessors with the specified jumpkind. This argument will be
+                                            ignored if set to None.
+        :return:                            A list of predecessors
+        :rtype:                             list
+        """
+
+        if excluding_fakeret and jumpkind == 'Ijk_FakeRet':
+            return [ ]
+
+        idx = self._node_index(cfgnode)
+        if idx is None:
+            return [ ]
+
+        return [ self._node(self._pred_nodes[i]) for i in range(self._pred_offsets[idx], self._pred_offsets[idx + 1])
+                 if self._accepts_jumpkind(self._pred_edges[i], excluding_fakeret, jumpkind) ]
+
+    def get_successors(self, node, excluding_fakeret=True, jumpkind=None):
+        """
+        Get successors of a node in the control flow graph.
+
+        :param CFGNode node:                The node.
+        :param bool excluding_fakeret:      True if you want to exclude all successors that is connected to the node
+                                            with a fakeret edge.
+        :param str or None jumpkind:        Only return successors with the specified jumpkind. This argument will be
+                                            ignored if set to None.
+        :return:                            A list of successors
+        :rtype:                             list
+        """
+
+        if excluding_fakeret and jumpkind == 'Ijk_FakeRet':
+            return [ ]
+
+        idx = self._node_index(node)
+        if idx is None:
+            return [ ]
+
+        return [ self._node(self._succ_nodes[i]) for i in range(self._succ_offsets[idx], self._succ_offsets[idx + 1])
+                 if self._accepts_jumpkind(i, excluding_fakeret, jumpkind) ]
+
+    def get_successors_and_jumpkind(self, node, excluding_fakeret=True):
+        """
+        Get a list of tuples where the first element is the successor of the CFG node and the second element is the
+        jumpkind of the successor.
+
+        :param CFGNode node:            The node.
+        :param bool excluding_fakeret:  True if you want to exclude all successors that are fall-through successors.
+        :return:                        A list of successors and their corresponding jumpkinds.
+        :rtype:                         list
+        """
+
+        idx = self._node_index(node)
+        if idx is None:
+            return [ ]
+
+        successors = [ ]
+        for i in range(self._succ_offsets[idx], self._succ_offsets[idx + 1]):
+            jumpkind = self._jumpkinds[self._edge_jumpkinds[i]]
+            if not excluding_fakeret or jumpkind != 'Ijk_FakeRet':
+                successors.append((self._node(self._succ_nodes[i]), jumpkind))
+        return successors
+
+    def get_all_predecessors(self, cfgnode, depth_limit=None):
+        """
+        Get all predecessors of a specific node on the control flow graph.
+
+        :param CFGNode cfgnode: The CFGNode object
+        :param int depth_limit: Optional depth limit for the depth-first search
+        :return: A list of predecessors in the CFG
+        :rtype: list
+        """
+
+        idx = self._node_index(cfgnode)
+        if idx is None:
+            raise KeyError(cfgnode)
+        return [ self._node(i) for i in self._dfs_reachable(idx, self._pred_offsets, self._pred_nodes, depth_limit) ]
+
+    def get_all_successors(self, cfgnode, depth_limit=None):
+        """
+        Get all successors of a specific node on the control flow graph.
+
+        :param CFGNode cfgnode: The CFGNode object
+        :param int depth_limit: Optional depth limit for the depth-first search
+        :return: A list of successors in the CFG
+        :rtype: list
+        """
+
+        idx = self._node_index(cfgnode)
+        if idx is None:
+            raise KeyError(cfgnode)
+        return [ self._node(i) for i in self._dfs_reachable(idx, self._succ_offsets, self._succ_nodes, depth_limit) ]
+
+    def get_branching_nodes(self):
+        """
+        Returns all nodes that has an out degree >= 2
+        """
+
+        return set(self._node(i) for i in range(len(self._addrs))
+                   if self._succ_offsets[i + 1] - self._succ_offsets[i] >= 2)
+
+    def get_exit_stmt_idx(self, src_block, dst_block):
+        """
+        Get the corresponding exit statement ID for control flow to reach destination block from source block.
+        Note that there must be a direct edge between the two blocks, otherwise an exception will be raised.
+
+        :return: The exit statement ID
+        """
+
+        src_idx = self._node_index(src_block)
+        dst_idx = self._node_index(dst_block)
+        if src_idx is not None and dst_idx is not None:
+            for i in range(self._succ_offsets[src_idx], self._succ_offsets[src_idx + 1]):
+                if self._succ_nodes[i] == dst_idx:
+                    stmt_idx = self._edge_stmt_idxs[i]
+                    return stmt_idx if stmt_idx != -1 else None
+
+        raise AngrCFGError('Edge (%s, %s) does not exist in CFG' % (src_block, dst_block))
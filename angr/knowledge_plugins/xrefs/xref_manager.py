@@ -2,6 +2,8 @@
 import logging
 from collections import defaultdict
 
+from sortedcontainers import SortedList
+
 from ...serializable import Serializable
 from ...protos import xrefs_pb2
 from ..plugin import KnowledgeBasePlugin
@@ -19,35 +21,131 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
         self.xrefs_by_ins_addr = defaultdict(set)
         self.xrefs_by_dst = defaultdict(set)
 
+        # sorted indices of all integer keys in xrefs_by_ins_addr and xrefs_by_dst
+        self._ins_addrs = SortedList()
+        self._dsts = SortedList()
+
+        # copy-on-write bookkeeping. dicts, indices, and sets of xrefs may be shared with copies of this manager. they
+        # are only duplicated when they are about to be modified.
+        self._owned = True
+        self._owned_ins_addrs = None  # None means all sets are owned
+        self._owned_dsts = None
+
     def copy(self):
-        xm = XRefManager(self._kb)
-        xm.xrefs_by_ins_addr = self.xrefs_by_ins_addr.copy()
-        xm.xrefs_by_dst = self.xrefs_by_dst.copy()
+        xm = XRefManager.__new__(XRefManager)
+        KnowledgeBasePlugin.__init__(xm)
+        xm._kb = self._kb
+        xm.xrefs_by_ins_addr = self.xrefs_by_ins_addr
+        xm.xrefs_by_dst = self.xrefs_by_dst
+        xm._ins_addrs = self._ins_addrs
+        xm._dsts = self._dsts
+        xm._owned = False
+        xm._owned_ins_addrs = set()
+        xm._owned_dsts = set()
+
+        self._owned = False
+        self._owned_ins_addrs = set()
+        self._owned_dsts = set()
         return xm
 
-    def add_xref(self, xref):
-        to_remove = set()
+    def __getstate__(self):
+        return {
+            '_kb': self._kb,
+            'xrefs_by_ins_addr': self.xrefs_by_ins_addr,
+            'xrefs_by_dst': self.xrefs_by_dst,
+        }
+
+    def __setstate__(self, state):
+        self._kb = state['_kb']
+        self.xrefs_by_ins_addr = state['xrefs_by_ins_addr']
+        self.xrefs_by_dst = state['xrefs_by_dst']
+        self._ins_addrs = SortedList(k for k in self.xrefs_by_ins_addr if isinstance(k, int))
+        self._dsts = SortedList(k for k in self.xrefs_by_dst if isinstance(k, int))
+        self._owned = True
+        self._owned_ins_addrs = None
+        self._owned_dsts = None
+
+    def _make_owned(self):
+        if not self._owned:
+            self.xrefs_by_ins_addr = defaultdict(set, self.xrefs_by_ins_addr)
+            self.xrefs_by_dst = defaultdict(set, self.xrefs_by_dst)
+            self._ins_addrs = self._ins_addrs.copy()
+            self._dsts = self._dsts.copy()
+            self._owned = True
+
+    @staticmethod
+    def _writable_set(d, owned_keys, key, new_keys):
+        """
+        Get the set of xrefs of a key for writing. The set is created, or copied if it is shared with another manager.
+        Integer keys that are new to `d` are appended to `new_keys`.
+        """
+
+        xrefs = d.get(key, None)
+        if xrefs is None:
+            xrefs = d[key] = set()
+            if isinstance(key, int):
+                new_keys.append(key)
+            if owned_keys is not None:
+                owned_keys.add(key)
+        elif owned_keys is not None and key not in owned_keys:
+            xrefs = d[key] = set(xrefs)
+            owned_keys.add(key)
+        return xrefs
+
+    def _add_xref(self, xref, new_ins_addrs, new_dsts):
+        # this is on the hot path of CFG recovery. only call _writable_set() when the set is missing or shared.
+        owned_ins_addrs, owned_dsts = self._owned_ins_addrs, self._owned_dsts
+
+        d0 = self.xrefs_by_ins_addr.get(xref.ins_addr, None)
+        if d0 is None or (owned_ins_addrs is not None and xref.ins_addr not in owned_ins_addrs):
+            d0 = self._writable_set(self.xrefs_by_ins_addr, owned_ins_addrs, xref.ins_addr, new_ins_addrs)
+
         # Overwrite existing "offset" refs
-        if xref.type != XRefType.Offset:
-            existing = self.get_xrefs_by_ins_addr(xref.ins_addr)
-            if existing:
-                for ex in existing:
-                    if ex.dst == xref.dst and ex.type == XRefType.Offset:
-                        # We want to remove this one and replace it with the new one
-                        to_remove.add(ex)
-
-        d0 = self.xrefs_by_ins_addr[xref.ins_addr]
+        to_remove = None
+        if d0 and xref.type != XRefType.Offset:
+            for ex in d0:
+                if ex.dst == xref.dst and ex.type == XRefType.Offset:
+                    # We want to remove this one and replace it with the new one
+                    if to_remove is None:
+                        to_remove = [ ]
+                    to_remove.append(ex)
+
         d0.add(xref)
-        d1 = self.xrefs_by_dst[xref.dst]
+        d1 = self.xrefs_by_dst.get(xref.dst, None)
+        if d1 is None or (owned_dsts is not None and xref.dst not in owned_dsts):
+            d1 = self._writable_set(self.xrefs_by_dst, owned_dsts, xref.dst, new_dsts)
         d1.add(xref)
 
-        for ex in to_remove:
-            d0.discard(ex)
-            d1.discard(ex)
+        if to_remove is not None:
+            for ex in to_remove:
+                d0.discard(ex)
+                d1.discard(ex)
+
+    def add_xref(self, xref):
+        self._make_owned()
+
+        new_ins_addrs, new_dsts = [ ], [ ]
+        self._add_xref(xref, new_ins_addrs, new_dsts)
+        for key in new_ins_addrs:
+            self._ins_addrs.add(key)
+        for key in new_dsts:
+            self._dsts.add(key)
 
     def add_xrefs(self, xrefs):
+        """
+        Add many xrefs at once. Sorted indices are updated only once for the entire batch.
+
+        :param iterable xrefs:  XRef instances to add.
+        :return:                None
+        """
+
+        self._make_owned()
+
+        new_ins_addrs, new_dsts = [ ], [ ]
         for xref in xrefs:
-            self.add_xref(xref)
+            self._add_xref(xref, new_ins_addrs, new_dsts)
+        self._ins_addrs.update(new_ins_addrs)
+        self._dsts.update(new_dsts)
 
     def get_xrefs_by_ins_addr(self, ins_addr):
         return self.xrefs_by_ins_addr.get(ins_addr, set())
@@ -61,11 +159,9 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
         bounded by start and end.
         Will only return absolute xrefs, not relative ones (like SP offsets)
         """
-        f = lambda x: isinstance(x, int) and start <= x <= end
-        addrs = filter(f, self.xrefs_by_dst.keys())
         refs = set()
-        for addr in addrs:
-            refs = refs.union(self.xrefs_by_dst[addr])
+        for addr in self._dsts.irange(start, end):
+            refs |= self.xrefs_by_dst[addr]
         return refs
 
     def get_xrefs_by_ins_addr_region(self, start, end):
@@ -73,11 +169,9 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
         Get a set of XRef objects that originate at a given address region
         bounded by start and end.  Useful for finding references from a basic block or function.
         """
-        f = lambda x: isinstance(x, int) and start <= x <= end
-        addrs = filter(f, self.xrefs_by_ins_addr.keys())
         refs = set()
-        for addr in addrs:
-            refs = refs.union(self.xrefs_by_ins_addr[addr])
+        for addr in self._ins_addrs.irange(start, end):
+            refs |= self.xrefs_by_ins_addr[addr]
         return refs
 
     # TODO: Maybe add some helpers that accept Function or Block objects for the sake of clean analyses.
@@ -103,6 +197,7 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
         model = XRefManager(None)
 
         # references
+        xrefs = [ ]
         for xref_pb2 in cmsg.xrefs:
             if xref_pb2.data_ea == -1:
                 l.warning("Unknown address of the referenced data item. Ignore the reference at %#x.", xref_pb2.ea)
@@ -110,7 +205,8 @@ class XRefManager(KnowledgeBasePlugin, Serializable):
             xref = XRef.parse_from_cmessage(xref_pb2)
             if cfg_model is not None:
                 xref.memory_data = cfg_model.memory_data[xref_pb2.data_ea]
-            model.add_xref(xref)
+            xrefs.append(xref)
+        model.add_xrefs(xrefs)
 
         return model
 
@@ -1,7 +1,11 @@
+import ast
 import copy
 import os
+import re
 import archinfo
 from collections import defaultdict
+from collections.abc import MutableMapping
+import importlib
 import logging
 import inspect
 
@@ -12,7 +16,107 @@ from ..stubs.ReturnUnconstrained import ReturnUnconstrained
 from ..stubs.syscall_stub import syscall as stub_syscall
 
 l = logging.getLogger(name=__name__)
-SIM_LIBRARIES = {}
+
+
+class _SimLibraries(MutableMapping):
+    """
+    The mapping behind ``angr.SIM_LIBRARIES``. Modules in the ``angr.procedures.definitions`` package are imported on
+    first access instead of when angr is imported. Looking up a library imports only the module that provides it. Which
+    module provides which library is found by scanning the sources of the package for set_library_names() calls, so
+    looking up a name that no module provides is a cheap miss. Iterating over the mapping imports every module.
+    """
+    def __init__(self, package_path):
+        self._libraries = {}
+        self._package_path = package_path
+        self._library_modules = None
+        self._all_loaded = False
+
+    def _load_module(self, module_name):
+        try:
+            importlib.import_module(".%s" % module_name, __name__)
+        except ImportError:
+            l.warning("Unable to autoimport module %s.%s", __name__, module_name, exc_info=True)
+
+    def _build_index(self):
+        """
+        Find the module that provides each library from the set_library_names() calls in the sources of the package.
+        Modules that set their library names in a way this cannot follow are imported right away.
+        """
+        self._library_modules = {}
+        for file_name in sorted(os.listdir(self._package_path)):
+            if not file_name.endswith('.py') or file_name == '__init__.py':
+                continue
+            module_name = file_name[:-3]
+            try:
+                with open(os.path.join(self._package_path, file_name)) as f:
+                    source = f.read()
+            except OSError:
+                self._load_module(module_name)
+                continue
+
+            for args in _SET_LIBRARY_NAMES_CALL.findall(source):
+                try:
+                    names = ast.literal_eval("[%s]" % args)
+                except (ValueError, SyntaxError):
+                    names = None
+                if not names or not all(isinstance(name, str) for name in names):
+                    l.debug("Cannot index the library names in %s.%s, importing it", __name__, module_name)
+                    self._load_module(module_name)
+                    break
+                for name in names:
+                    self._library_modules[name] = module_name
+
+    def _load(self, name):
+        if name in self._libraries or self._all_loaded:
+            return
+        if self._library_modules is None:
+            self._build_index()
+            if name in self._libraries:
+                return
+        module_name = self._library_modules.get(name, None)
+        if module_name is not None:
+            self._load_module(module_name)
+
+    def load_all(self):
+        """
+        Import every module in the ``angr.procedures.definitions`` package.
+        """
+        if self._all_loaded:
+            return
+        self._all_loaded = True
+        for _ in autoimport.auto_import_modules(__name__, self._package_path):
+            pass
+
+    def __getitem__(self, k):
+        self._load(k)
+        return self._libraries[k]
+
+    def __setitem__(self, k, v):
+        self._libraries[k] = v
+
+    def __delitem__(self, k):
+        self._load(k)
+        del self._libraries[k]
+
+    def __contains__(self, k):
+        self._load(k)
+        return k in self._libraries
+
+    def __iter__(self):
+        self.load_all()
+        return iter(self._libraries)
+
+    def __len__(self):
+        self.load_all()
+        return len(self._libraries)
+
+    def __repr__(self):
+        return "<SimLibraries: %d loaded>" % len(self._libraries)
+
+
+_SET_LIBRARY_NAMES_CALL = re.compile(r"\.set_library_names\(([^)]*)\)")
+
+SIM_LIBRARIES = _SimLibraries(os.path.dirname(os.path.realpath(__file__)))
 
 
 class SimLibrary:
@@ -30,12 +134,30 @@ class SimLibrary:
     def __init__(self):
         self.procedures = {}
         self.non_returning = set()
-        self.prototypes = {}
+        self._prototypes = {}
+        self._prototype_loaders = []
         self.default_ccs = {}
         self.names = []
         self.fallback_cc = dict(DEFAULT_CC)
         self.fallback_proc = ReturnUnconstrained
 
+    @property
+    def prototypes(self):
+        """
+        A mapping from function names to their prototypes. Prototypes added with set_prototype_loader() are built when
+        this property is first accessed.
+        """
+        if self._prototype_loaders:
+            loaders, self._prototype_loaders = self._prototype_loaders, []
+            for loader in loaders:
+                self._prototypes.update(loader())
+        return self._prototypes
+
+    @prototypes.setter
+    def prototypes(self, v):
+        self._prototypes = v
+        self._prototype_loaders = []
+
     def copy(self):
         """
         Make a copy of this SimLibrary, allowing it to be mutated without affecting the global version.
@@ -45,7 +167,8 @@ class SimLibrary:
         o = SimLibrary()
         o.procedures = dict(self.procedures)
         o.non_returning = set(self.non_returning)
-        o.prototypes = dict(self.prototypes)
+        o._prototypes = dict(self._prototypes)
+        o._prototype_loaders = list(self._prototype_loaders)
         o.default_ccs = dict(self.default_ccs)
         o.names = list(self.names)
         return o
@@ -114,6 +237,16 @@ class SimLibrary:
         """
         self.prototypes.update(protos)
 
+    def set_prototype_loader(self, loader):
+        """
+        Set the prototypes of many functions without building them now. The loader is called the first time the
+        prototypes of this library are accessed.
+
+        :param loader:  A function that takes no arguments and returns a dictionary mapping function names to
+                        SimTypeFunction objects
+        """
+        self._prototype_loaders.append(loader)
+
     def set_c_prototype(self, c_decl):
         """
         Set the prototype of a function in the form of a C-style function declaration.
@@ -273,7 +406,8 @@ class SimSyscallLibrary(SimLibrary):
         o = SimSyscallLibrary()
         o.procedures = dict(self.procedures)
         o.non_returning = set(self.non_returning)
-        o.prototypes = dict(self.prototypes)
+        o._prototypes = dict(self._prototypes)
+        o._prototype_loaders = list(self._prototype_loaders)
         o.default_ccs = dict(self.default_ccs)
         o.names = list(self.names)
         o.syscall_number_mapping = defaultdict(dict, self.syscall_number_mapping) # {abi: {number: name}}
@@ -419,5 +553,9 @@ class SimSyscallLibrary(SimLibrary):
         name, _, _ = self._canonicalize(number, arch, abi_list)
         return super(SimSyscallLibrary, self).has_implementation(name)
 
-for _ in autoimport.auto_import_modules('angr.procedures.definitions', os.path.dirname(os.path.realpath(__file__))):
-    pass
+
+def load_all_definitions():
+    """
+    Import all library definitions now instead of on first access.
+    """
+    SIM_LIBRARIES.load_all()
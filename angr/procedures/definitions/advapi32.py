@@ -13,813 +13,820 @@ if 'advapi32' in P:
 lib.set_default_cc('X86', SimCCStdcall)
 lib.set_default_cc('AMD64', SimCCMicrosoftAMD64)
 
-prototypes = {
-    "A_SHAFinal": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "A_SHAInit": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "A_SHAUpdate": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "AbortSystemShutdownA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "AbortSystemShutdownW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "AccessCheck": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "AccessCheckAndAuditAlarmA": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "AccessCheckAndAuditAlarmW": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "AccessCheckByType": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "AccessCheckByTypeAndAuditAlarmA": SimTypeFunction((SimTypeLong(),)*16, SimTypeLong()),
-    "AccessCheckByTypeAndAuditAlarmW": SimTypeFunction((SimTypeLong(),)*16, SimTypeLong()),
-    "AccessCheckByTypeResultList": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "AccessCheckByTypeResultListAndAuditAlarmA": SimTypeFunction((SimTypeLong(),)*16, SimTypeLong()),
-    "AccessCheckByTypeResultListAndAuditAlarmByHandleA": SimTypeFunction((SimTypeLong(),)*17, SimTypeLong()),
-    "AccessCheckByTypeResultListAndAuditAlarmByHandleW": SimTypeFunction((SimTypeLong(),)*17, SimTypeLong()),
-    "AccessCheckByTypeResultListAndAuditAlarmW": SimTypeFunction((SimTypeLong(),)*16, SimTypeLong()),
-    "AddAccessAllowedAce": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "AddAccessAllowedAceEx": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "AddAccessAllowedObjectAce": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "AddAccessDeniedAce": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "AddAccessDeniedAceEx": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "AddAccessDeniedObjectAce": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "AddAce": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "AddAuditAccessAce": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "AddAuditAccessAceEx": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "AddAuditAccessObjectAce": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "AddConditionalAce": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "AddMandatoryAce": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "AddUsersToEncryptedFile": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AddUsersToEncryptedFileEx": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "AdjustTokenGroups": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "AdjustTokenPrivileges": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "AllocateAndInitializeSid": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "AllocateLocallyUniqueId": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "AreAllAccessesGranted": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AreAnyAccessesGranted": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditComputeEffectivePolicyBySid": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "AuditComputeEffectivePolicyByToken": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "AuditEnumerateCategories": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditEnumeratePerUserPolicy": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "AuditEnumerateSubCategories": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "AuditFree": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "AuditLookupCategoryGuidFromCategoryId": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditLookupCategoryIdFromCategoryGuid": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditLookupCategoryNameA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditLookupCategoryNameW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditLookupSubCategoryNameA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditLookupSubCategoryNameW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditQueryGlobalSaclA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditQueryGlobalSaclW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditQueryPerUserPolicy": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "AuditQuerySecurity": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditQuerySystemPolicy": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "AuditSetGlobalSaclA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditSetGlobalSaclW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditSetPerUserPolicy": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "AuditSetSecurity": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "AuditSetSystemPolicy": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "BackupEventLogA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "BackupEventLogW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "BuildExplicitAccessWithNameA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "BuildExplicitAccessWithNameW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "BuildImpersonateExplicitAccessWithNameA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "BuildImpersonateExplicitAccessWithNameW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "BuildImpersonateTrusteeA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "BuildImpersonateTrusteeW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "BuildSecurityDescriptorA": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "BuildSecurityDescriptorW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "BuildTrusteeWithNameA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "BuildTrusteeWithNameW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "BuildTrusteeWithObjectsAndNameA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "BuildTrusteeWithObjectsAndNameW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "BuildTrusteeWithObjectsAndSidA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "BuildTrusteeWithObjectsAndSidW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "BuildTrusteeWithSidA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "BuildTrusteeWithSidW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CancelOverlappedAccess": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "ChangeServiceConfig2A": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ChangeServiceConfig2W": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ChangeServiceConfigA": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "ChangeServiceConfigW": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "CheckTokenMembership": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ClearEventLogA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ClearEventLogW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CloseCodeAuthzLevel": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CloseEncryptedFileRaw": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CloseEventLog": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CloseServiceHandle": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CloseThreadWaitChainSession": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CloseTrace": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CommandLineFromMsiDescriptor": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ComputeAccessTokenFromCodeAuthzLevel": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ControlService": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ControlServiceExA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "ControlServiceExW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "ControlTraceA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ControlTraceW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ConvertAccessToSecurityDescriptorA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ConvertAccessToSecurityDescriptorW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ConvertSDToStringSDRootDomainA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "ConvertSDToStringSDRootDomainW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "ConvertSecurityDescriptorToAccessA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "ConvertSecurityDescriptorToAccessNamedA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "ConvertSecurityDescriptorToAccessNamedW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "ConvertSecurityDescriptorToAccessW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "ConvertSecurityDescriptorToStringSecurityDescriptorA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ConvertSecurityDescriptorToStringSecurityDescriptorW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ConvertSidToStringSidA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ConvertSidToStringSidW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ConvertStringSDToSDDomainA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "ConvertStringSDToSDDomainW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "ConvertStringSDToSDRootDomainA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ConvertStringSDToSDRootDomainW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ConvertStringSecurityDescriptorToSecurityDescriptorA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "ConvertStringSecurityDescriptorToSecurityDescriptorW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "ConvertStringSidToSidA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ConvertStringSidToSidW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ConvertToAutoInheritPrivateObjectSecurity": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CopySid": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CreateCodeAuthzLevel": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CreatePrivateObjectSecurity": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CreatePrivateObjectSecurityEx": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "CreatePrivateObjectSecurityWithMultipleInheritance": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "CreateProcessAsUserA": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "CreateProcessAsUserW": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "CreateProcessWithLogonW": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "CreateProcessWithTokenW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "CreateRestrictedToken": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "CreateServiceA": SimTypeFunction((SimTypeLong(),)*13, SimTypeLong()),
-    "CreateServiceW": SimTypeFunction((SimTypeLong(),)*13, SimTypeLong()),
-    "CreateTraceInstanceId": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CreateWellKnownSid": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredBackupCredentials": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CredDeleteA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredDeleteW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredEncryptAndMarshalBinaryBlob": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredEnumerateA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredEnumerateW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredFindBestCredentialA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredFindBestCredentialW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredFree": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CredGetSessionTypes": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CredGetTargetInfoA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredGetTargetInfoW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredIsMarshaledCredentialA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CredIsMarshaledCredentialW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CredIsProtectedA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CredIsProtectedW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CredMarshalCredentialA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredMarshalCredentialW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredProfileLoaded": SimTypeFunction((SimTypeLong(),)*0, SimTypeLong()),
-    "CredProfileUnloaded": SimTypeFunction((SimTypeLong(),)*0, SimTypeLong()),
-    "CredProtectA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CredProtectW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CredReadA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredReadByTokenHandle": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CredReadDomainCredentialsA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredReadDomainCredentialsW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredReadW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredRenameA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredRenameW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredRestoreCredentials": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredUnmarshalCredentialA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredUnmarshalCredentialW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredUnprotectA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CredUnprotectW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CredWriteA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CredWriteDomainCredentialsA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredWriteDomainCredentialsW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CredWriteW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CredpConvertCredential": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredpConvertOneCredentialSize": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CredpConvertTargetInfo": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CredpDecodeCredential": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CredpEncodeCredential": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CredpEncodeSecret": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptAcquireContextA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptAcquireContextW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptContextAddRef": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CryptCreateHash": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptDecrypt": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptDeriveKey": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptDestroyHash": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CryptDestroyKey": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "CryptDuplicateHash": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CryptDuplicateKey": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CryptEncrypt": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "CryptEnumProviderTypesA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptEnumProviderTypesW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptEnumProvidersA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptEnumProvidersW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptExportKey": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptGenKey": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CryptGenRandom": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CryptGetDefaultProviderA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptGetDefaultProviderW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptGetHashParam": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptGetKeyParam": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptGetProvParam": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "CryptGetUserKey": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CryptHashData": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CryptHashSessionKey": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "CryptImportKey": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptReleaseContext": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CryptSetHashParam": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CryptSetKeyParam": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CryptSetProvParam": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CryptSetProviderA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CryptSetProviderExA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CryptSetProviderExW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "CryptSetProviderW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "CryptSignHashA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptSignHashW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptVerifySignatureA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "CryptVerifySignatureW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "DecryptFileA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "DecryptFileW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "DeleteAce": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "DeleteService": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "DeregisterEventSource": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "DestroyPrivateObjectSecurity": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "DuplicateEncryptionInfoFile": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "DuplicateToken": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "DuplicateTokenEx": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "ElfBackupEventLogFileA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ElfBackupEventLogFileW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ElfChangeNotify": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ElfClearEventLogFileA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ElfClearEventLogFileW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ElfCloseEventLog": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "ElfDeregisterEventSource": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "ElfFlushEventLog": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "ElfNumberOfRecords": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ElfOldestRecord": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ElfOpenBackupEventLogA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ElfOpenBackupEventLogW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ElfOpenEventLogA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ElfOpenEventLogW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ElfReadEventLogA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "ElfReadEventLogW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "ElfRegisterEventSourceA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ElfRegisterEventSourceW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ElfReportEventA": SimTypeFunction((SimTypeLong(),)*12, SimTypeLong()),
-    "ElfReportEventAndSourceW": SimTypeFunction((SimTypeLong(),)*15, SimTypeLong()),
-    "ElfReportEventW": SimTypeFunction((SimTypeLong(),)*12, SimTypeLong()),
-    "EnableTrace": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "EnableTraceEx": SimTypeFunction((SimTypeLong(),)*12, SimTypeLong()),
-    "EnableTraceEx2": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "EncryptFileA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "EncryptFileW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "EncryptedFileKeyInfo": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "EncryptionDisable": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "EnumDependentServicesA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "EnumDependentServicesW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "EnumServiceGroupW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "EnumServicesStatusA": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "EnumServicesStatusExA": SimTypeFunction((SimTypeLong(),)*10, SimTypeLong()),
-    "EnumServicesStatusExW": SimTypeFunction((SimTypeLong(),)*10, SimTypeLong()),
-    "EnumServicesStatusW": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "EnumerateTraceGuids": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "EnumerateTraceGuidsEx": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "EqualDomainSid": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "EqualPrefixSid": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "EqualSid": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "EventAccessControl": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "EventAccessQuery": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "EventAccessRemove": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "EventActivityIdControl": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "EventEnabled": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "EventProviderEnabled": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "EventRegister": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "EventUnregister": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "EventWrite": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "EventWriteEndScenario": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "EventWriteEx": SimTypeFunction((SimTypeLong(),)*10, SimTypeLong()),
-    "EventWriteStartScenario": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "EventWriteString": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "EventWriteTransfer": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "FileEncryptionStatusA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "FileEncryptionStatusW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "FindFirstFreeAce": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "FlushEfsCache": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "FlushTraceA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "FlushTraceW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "FreeEncryptedFileKeyInfo": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "FreeEncryptedFileMetadata": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "FreeEncryptionCertificateHashList": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "FreeInheritedFromArray": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "FreeSid": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetAccessPermissionsForObjectA": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "GetAccessPermissionsForObjectW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "GetAce": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetAclInformation": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetAuditedPermissionsFromAclA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetAuditedPermissionsFromAclW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetCurrentHwProfileA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetCurrentHwProfileW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetEffectiveRightsFromAclA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetEffectiveRightsFromAclW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetEncryptedFileMetadata": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetEventLogInformation": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "GetExplicitEntriesFromAclA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetExplicitEntriesFromAclW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetFileSecurityA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "GetFileSecurityW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "GetInformationCodeAuthzLevelW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "GetInformationCodeAuthzPolicyW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "GetInheritanceSourceA": SimTypeFunction((SimTypeLong(),)*10, SimTypeLong()),
-    "GetInheritanceSourceW": SimTypeFunction((SimTypeLong(),)*10, SimTypeLong()),
-    "GetKernelObjectSecurity": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "GetLengthSid": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetLocalManagedApplicationData": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetLocalManagedApplications": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetManagedApplicationCategories": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "GetManagedApplications": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "GetMultipleTrusteeA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetMultipleTrusteeOperationA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetMultipleTrusteeOperationW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetMultipleTrusteeW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetNamedSecurityInfoA": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "GetNamedSecurityInfoExA": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "GetNamedSecurityInfoExW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "GetNamedSecurityInfoW": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "GetNumberOfEventLogRecords": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "GetOldestEventLogRecord": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "GetOverlappedAccessResults": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetPrivateObjectSecurity": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "GetSecurityDescriptorControl": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetSecurityDescriptorDacl": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetSecurityDescriptorGroup": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetSecurityDescriptorLength": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetSecurityDescriptorOwner": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "GetSecurityDescriptorRMControl": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "GetSecurityDescriptorSacl": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetSecurityInfo": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "GetSecurityInfoExA": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "GetSecurityInfoExW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "GetServiceDisplayNameA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetServiceDisplayNameW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetServiceKeyNameA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetServiceKeyNameW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "GetSidIdentifierAuthority": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetSidLengthRequired": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetSidSubAuthority": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "GetSidSubAuthorityCount": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetThreadWaitChain": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "GetTokenInformation": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "GetTraceEnableFlags": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "GetTraceEnableLevel": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "GetTraceLoggerHandle": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetTrusteeFormA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetTrusteeFormW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetTrusteeNameA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetTrusteeNameW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetTrusteeTypeA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetTrusteeTypeW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "GetUserNameA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "GetUserNameW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "GetWindowsAccountDomainSid": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "I_QueryTagInformation": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "I_ScGetCurrentGroupStateW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "I_ScIsSecurityProcess": SimTypeFunction((SimTypeLong(),)*0, SimTypeLong()),
-    "I_ScPnPGetServiceName": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "I_ScQueryServiceConfig": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "I_ScSendPnPMessage": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "I_ScSendTSMessage": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "I_ScSetServiceBitsA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "I_ScSetServiceBitsW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "I_ScValidatePnPService": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "IdentifyCodeAuthzLevelW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "ImpersonateAnonymousToken": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "ImpersonateLoggedOnUser": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "ImpersonateNamedPipeClient": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "ImpersonateSelf": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "InitializeAcl": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "InitializeSecurityDescriptor": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "InitializeSid": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "InitiateShutdownA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "InitiateShutdownW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "InitiateSystemShutdownA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "InitiateSystemShutdownExA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "InitiateSystemShutdownExW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "InitiateSystemShutdownW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "InstallApplication": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "IsTextUnicode": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "IsTokenRestricted": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "IsTokenUntrusted": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "IsValidAcl": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "IsValidRelativeSecurityDescriptor": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "IsValidSecurityDescriptor": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "IsValidSid": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "IsWellKnownSid": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "LockServiceDatabase": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "LogonUserA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "LogonUserExA": SimTypeFunction((SimTypeLong(),)*10, SimTypeLong()),
-    "LogonUserExExW": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "LogonUserExW": SimTypeFunction((SimTypeLong(),)*10, SimTypeLong()),
-    "LogonUserW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "LookupAccountNameA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "LookupAccountNameW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "LookupAccountSidA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "LookupAccountSidW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "LookupPrivilegeDisplayNameA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LookupPrivilegeDisplayNameW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LookupPrivilegeNameA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LookupPrivilegeNameW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LookupPrivilegeValueA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LookupPrivilegeValueW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LookupSecurityDescriptorPartsA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "LookupSecurityDescriptorPartsW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "LsaAddAccountRights": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaAddPrivilegesToAccount": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "LsaClearAuditLog": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "LsaClose": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "LsaCreateAccount": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaCreateSecret": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaCreateTrustedDomain": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaCreateTrustedDomainEx": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaDelete": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "LsaDeleteTrustedDomain": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "LsaEnumerateAccountRights": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaEnumerateAccounts": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaEnumerateAccountsWithUserRight": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaEnumeratePrivileges": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaEnumeratePrivilegesOfAccount": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "LsaEnumerateTrustedDomains": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaEnumerateTrustedDomainsEx": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaFreeMemory": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "LsaGetQuotasForAccount": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "LsaGetRemoteUserName": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaGetSystemAccessAccount": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "LsaGetUserName": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "LsaICLookupNames": SimTypeFunction((SimTypeLong(),)*10, SimTypeLong()),
-    "LsaICLookupNamesWithCreds": SimTypeFunction((SimTypeLong(),)*12, SimTypeLong()),
-    "LsaICLookupSids": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "LsaICLookupSidsWithCreds": SimTypeFunction((SimTypeLong(),)*12, SimTypeLong()),
-    "LsaLookupNames": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaLookupNames2": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "LsaLookupPrivilegeDisplayName": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaLookupPrivilegeName": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaLookupPrivilegeValue": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaLookupSids": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaManageSidNameMapping": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaNtStatusToWinError": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "LsaOpenAccount": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaOpenPolicy": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaOpenPolicySce": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaOpenSecret": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaOpenTrustedDomain": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaOpenTrustedDomainByName": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaQueryDomainInformationPolicy": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaQueryForestTrustInformation": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaQueryInfoTrustedDomain": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaQueryInformationPolicy": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaQuerySecret": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaQuerySecurityObject": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaQueryTrustedDomainInfo": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaQueryTrustedDomainInfoByName": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaRemoveAccountRights": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaRemovePrivilegesFromAccount": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaRetrievePrivateData": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaSetDomainInformationPolicy": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaSetForestTrustInformation": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "LsaSetInformationPolicy": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaSetInformationTrustedDomain": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaSetQuotasForAccount": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "LsaSetSecret": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaSetSecurityObject": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "LsaSetSystemAccessAccount": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "LsaSetTrustedDomainInfoByName": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaSetTrustedDomainInformation": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "LsaStorePrivateData": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "MD4Final": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "MD4Init": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "MD4Update": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "MD5Final": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "MD5Init": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "MD5Update": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "MSChapSrvChangePassword": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "MSChapSrvChangePassword2": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "MakeAbsoluteSD": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "MakeAbsoluteSD2": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "MakeSelfRelativeSD": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "MapGenericMask": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "NotifyBootConfigStatus": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "NotifyChangeEventLog": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "NotifyServiceStatusChange": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "NotifyServiceStatusChangeA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "NotifyServiceStatusChangeW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ObjectCloseAuditAlarmA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ObjectCloseAuditAlarmW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ObjectDeleteAuditAlarmA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ObjectDeleteAuditAlarmW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ObjectOpenAuditAlarmA": SimTypeFunction((SimTypeLong(),)*12, SimTypeLong()),
-    "ObjectOpenAuditAlarmW": SimTypeFunction((SimTypeLong(),)*12, SimTypeLong()),
-    "ObjectPrivilegeAuditAlarmA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "ObjectPrivilegeAuditAlarmW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "OpenBackupEventLogA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "OpenBackupEventLogW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "OpenEncryptedFileRawA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "OpenEncryptedFileRawW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "OpenEventLogA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "OpenEventLogW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "OpenProcessToken": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "OpenSCManagerA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "OpenSCManagerW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "OpenServiceA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "OpenServiceW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "OpenThreadToken": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "OpenThreadWaitChainSession": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "OpenTraceA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "OpenTraceW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "PerfAddCounters": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "PerfCloseQueryHandle": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "PerfCreateInstance": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "PerfDecrementULongCounterValue": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "PerfDecrementULongLongCounterValue": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "PerfDeleteCounters": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "PerfDeleteInstance": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "PerfEnumerateCounterSet": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "PerfEnumerateCounterSetInstances": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "PerfIncrementULongCounterValue": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "PerfIncrementULongLongCounterValue": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "PerfOpenQueryHandle": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "PerfQueryCounterData": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "PerfQueryCounterInfo": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "PerfQueryCounterSetRegistrationInfo": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "PerfQueryInstance": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "PerfSetCounterRefValue": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "PerfSetCounterSetInfo": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "PerfSetULongCounterValue": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "PerfSetULongLongCounterValue": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "PerfStartProvider": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "PerfStartProviderEx": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "PerfStopProvider": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "PrivilegeCheck": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "PrivilegedServiceAuditAlarmA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "PrivilegedServiceAuditAlarmW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "ProcessIdleTasks": SimTypeFunction((SimTypeLong(),)*0, SimTypeLong()),
-    "ProcessIdleTasksW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "ProcessTrace": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "QueryAllTracesA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "QueryAllTracesW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "QueryRecoveryAgentsOnEncryptedFile": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "QuerySecurityAccessMask": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "QueryServiceConfig2A": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "QueryServiceConfig2W": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "QueryServiceConfigA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "QueryServiceConfigW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "QueryServiceLockStatusA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "QueryServiceLockStatusW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "QueryServiceObjectSecurity": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "QueryServiceStatus": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "QueryServiceStatusEx": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "QueryTraceA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "QueryTraceW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "QueryUsersOnEncryptedFile": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ReadEncryptedFileRaw": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "ReadEventLogA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "ReadEventLogW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "RegCloseKey": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "RegConnectRegistryA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegConnectRegistryExA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegConnectRegistryExW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegConnectRegistryW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegCopyTreeA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegCopyTreeW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegCreateKeyA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegCreateKeyExA": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "RegCreateKeyExW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "RegCreateKeyTransactedA": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "RegCreateKeyTransactedW": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "RegCreateKeyW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegDeleteKeyA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegDeleteKeyExA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegDeleteKeyExW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegDeleteKeyTransactedA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "RegDeleteKeyTransactedW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "RegDeleteKeyValueA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegDeleteKeyValueW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegDeleteKeyW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegDeleteTreeA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegDeleteTreeW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegDeleteValueA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegDeleteValueW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegDisablePredefinedCache": SimTypeFunction((SimTypeLong(),)*0, SimTypeLong()),
-    "RegDisablePredefinedCacheEx": SimTypeFunction((SimTypeLong(),)*0, SimTypeLong()),
-    "RegDisableReflectionKey": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "RegEnableReflectionKey": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "RegEnumKeyA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegEnumKeyExA": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "RegEnumKeyExW": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "RegEnumKeyW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegEnumValueA": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "RegEnumValueW": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "RegFlushKey": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "RegGetKeySecurity": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegGetValueA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "RegGetValueW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "RegLoadAppKeyA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "RegLoadAppKeyW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "RegLoadKeyA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegLoadKeyW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegLoadMUIStringA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "RegLoadMUIStringW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "RegNotifyChangeKeyValue": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "RegOpenCurrentUser": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegOpenKeyA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegOpenKeyExA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "RegOpenKeyExW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "RegOpenKeyTransactedA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "RegOpenKeyTransactedW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "RegOpenKeyW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegOpenUserClassesRoot": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegOverridePredefKey": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegQueryInfoKeyA": SimTypeFunction((SimTypeLong(),)*12, SimTypeLong()),
-    "RegQueryInfoKeyW": SimTypeFunction((SimTypeLong(),)*12, SimTypeLong()),
-    "RegQueryMultipleValuesA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "RegQueryMultipleValuesW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "RegQueryReflectionKey": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegQueryValueA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegQueryValueExA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "RegQueryValueExW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "RegQueryValueW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegRenameKey": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegReplaceKeyA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegReplaceKeyW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegRestoreKeyA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegRestoreKeyW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegSaveKeyA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegSaveKeyExA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegSaveKeyExW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegSaveKeyW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegSetKeySecurity": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegSetKeyValueA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "RegSetKeyValueW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "RegSetValueA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "RegSetValueExA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "RegSetValueExW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "RegSetValueW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "RegUnLoadKeyA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegUnLoadKeyW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegisterEventSourceA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegisterEventSourceW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegisterIdleTask": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "RegisterServiceCtrlHandlerA": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegisterServiceCtrlHandlerExA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegisterServiceCtrlHandlerExW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "RegisterServiceCtrlHandlerW": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RegisterTraceGuidsA": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "RegisterTraceGuidsW": SimTypeFunction((SimTypeLong(),)*8, SimTypeLong()),
-    "RegisterWaitChainCOMCallback": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "RemoveTraceCallback": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "RemoveUsersFromEncryptedFile": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "ReportEventA": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "ReportEventW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "RevertToSelf": SimTypeFunction((SimTypeLong(),)*0, SimTypeLong()),
-    "SaferCloseLevel": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "SaferComputeTokenFromLevel": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "SaferCreateLevel": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "SaferGetLevelInformation": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "SaferGetPolicyInformation": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "SaferIdentifyLevel": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SaferRecordEventLogEntry": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SaferSetLevelInformation": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SaferSetPolicyInformation": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "SaferiChangeRegistryScope": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SaferiCompareTokenLevels": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SaferiIsDllAllowed": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SaferiIsExecutableFileType": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SaferiPopulateDefaultsInRegistry": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SaferiRecordEventLogEntry": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SaferiRegisterExtensionDll": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SaferiSearchMatchingHashRules": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "SetAclInformation": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SetEncryptedFileMetadata": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "SetEntriesInAccessListA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "SetEntriesInAccessListW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "SetEntriesInAclA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SetEntriesInAclW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SetEntriesInAuditListA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "SetEntriesInAuditListW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "SetFileSecurityA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SetFileSecurityW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SetInformationCodeAuthzLevelW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SetInformationCodeAuthzPolicyW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "SetKernelObjectSecurity": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SetNamedSecurityInfoA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "SetNamedSecurityInfoExA": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "SetNamedSecurityInfoExW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "SetNamedSecurityInfoW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "SetPrivateObjectSecurity": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "SetPrivateObjectSecurityEx": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "SetSecurityAccessMask": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SetSecurityDescriptorControl": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SetSecurityDescriptorDacl": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SetSecurityDescriptorGroup": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SetSecurityDescriptorOwner": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SetSecurityDescriptorRMControl": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SetSecurityDescriptorSacl": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SetSecurityInfo": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "SetSecurityInfoExA": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "SetSecurityInfoExW": SimTypeFunction((SimTypeLong(),)*9, SimTypeLong()),
-    "SetServiceBits": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SetServiceObjectSecurity": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SetServiceStatus": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SetThreadToken": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SetTokenInformation": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SetTraceCallback": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SetUserFileEncryptionKey": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "SetUserFileEncryptionKeyEx": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "StartServiceA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "StartServiceCtrlDispatcherA": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "StartServiceCtrlDispatcherW": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "StartServiceW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "StartTraceA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "StartTraceW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "StopTraceA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "StopTraceW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "SystemFunction001": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction002": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction003": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction004": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction005": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction006": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction007": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction008": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction009": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction010": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction011": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction012": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction013": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction014": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction015": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction016": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction017": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction018": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction019": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction020": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction021": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction022": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction023": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction024": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction025": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction026": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction027": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction028": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction029": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction030": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction031": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction032": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction033": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction034": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction035": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "SystemFunction036": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "SystemFunction040": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "SystemFunction041": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "TraceEvent": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "TraceEventInstance": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "TraceMessage": SimTypeFunction((SimTypeLong(),)*0, SimTypeLong()),
-    "TraceMessageVa": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "TraceSetInformation": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "TreeResetNamedSecurityInfoA": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "TreeResetNamedSecurityInfoW": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "TreeSetNamedSecurityInfoA": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "TreeSetNamedSecurityInfoW": SimTypeFunction((SimTypeLong(),)*11, SimTypeLong()),
-    "TrusteeAccessToObjectA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "TrusteeAccessToObjectW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "UninstallApplication": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "UnlockServiceDatabase": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "UnregisterIdleTask": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "UnregisterTraceGuids": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "UpdateTraceA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "UpdateTraceW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "UsePinForEncryptedFilesA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "UsePinForEncryptedFilesW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "WmiCloseBlock": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "WmiDevInstToInstanceNameA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiDevInstToInstanceNameW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiEnumerateGuids": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "WmiExecuteMethodA": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "WmiExecuteMethodW": SimTypeFunction((SimTypeLong(),)*7, SimTypeLong()),
-    "WmiFileHandleToInstanceNameA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiFileHandleToInstanceNameW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiFreeBuffer": SimTypeFunction((SimTypeLong(),)*1, SimTypeLong()),
-    "WmiMofEnumerateResourcesA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "WmiMofEnumerateResourcesW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "WmiNotificationRegistrationA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "WmiNotificationRegistrationW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "WmiOpenBlock": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "WmiQueryAllDataA": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "WmiQueryAllDataMultipleA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiQueryAllDataMultipleW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiQueryAllDataW": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong()),
-    "WmiQueryGuidInformation": SimTypeFunction((SimTypeLong(),)*2, SimTypeLong()),
-    "WmiQuerySingleInstanceA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiQuerySingleInstanceMultipleA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "WmiQuerySingleInstanceMultipleW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "WmiQuerySingleInstanceW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiReceiveNotificationsA": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiReceiveNotificationsW": SimTypeFunction((SimTypeLong(),)*4, SimTypeLong()),
-    "WmiSetSingleInstanceA": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "WmiSetSingleInstanceW": SimTypeFunction((SimTypeLong(),)*5, SimTypeLong()),
-    "WmiSetSingleItemA": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "WmiSetSingleItemW": SimTypeFunction((SimTypeLong(),)*6, SimTypeLong()),
-    "WriteEncryptedFileRaw": SimTypeFunction((SimTypeLong(),)*3, SimTypeLong())
+# the number of arguments of each function. all arguments and return values are longs
+_prototype_num_args = {
+    "A_SHAFinal": 2,
+    "A_SHAInit": 1,
+    "A_SHAUpdate": 3,
+    "AbortSystemShutdownA": 1,
+    "AbortSystemShutdownW": 1,
+    "AccessCheck": 8,
+    "AccessCheckAndAuditAlarmA": 11,
+    "AccessCheckAndAuditAlarmW": 11,
+    "AccessCheckByType": 11,
+    "AccessCheckByTypeAndAuditAlarmA": 16,
+    "AccessCheckByTypeAndAuditAlarmW": 16,
+    "AccessCheckByTypeResultList": 11,
+    "AccessCheckByTypeResultListAndAuditAlarmA": 16,
+    "AccessCheckByTypeResultListAndAuditAlarmByHandleA": 17,
+    "AccessCheckByTypeResultListAndAuditAlarmByHandleW": 17,
+    "AccessCheckByTypeResultListAndAuditAlarmW": 16,
+    "AddAccessAllowedAce": 4,
+    "AddAccessAllowedAceEx": 5,
+    "AddAccessAllowedObjectAce": 7,
+    "AddAccessDeniedAce": 4,
+    "AddAccessDeniedAceEx": 5,
+    "AddAccessDeniedObjectAce": 7,
+    "AddAce": 5,
+    "AddAuditAccessAce": 6,
+    "AddAuditAccessAceEx": 7,
+    "AddAuditAccessObjectAce": 9,
+    "AddConditionalAce": 8,
+    "AddMandatoryAce": 5,
+    "AddUsersToEncryptedFile": 2,
+    "AddUsersToEncryptedFileEx": 4,
+    "AdjustTokenGroups": 6,
+    "AdjustTokenPrivileges": 6,
+    "AllocateAndInitializeSid": 11,
+    "AllocateLocallyUniqueId": 1,
+    "AreAllAccessesGranted": 2,
+    "AreAnyAccessesGranted": 2,
+    "AuditComputeEffectivePolicyBySid": 4,
+    "AuditComputeEffectivePolicyByToken": 4,
+    "AuditEnumerateCategories": 2,
+    "AuditEnumeratePerUserPolicy": 1,
+    "AuditEnumerateSubCategories": 4,
+    "AuditFree": 1,
+    "AuditLookupCategoryGuidFromCategoryId": 2,
+    "AuditLookupCategoryIdFromCategoryGuid": 2,
+    "AuditLookupCategoryNameA": 2,
+    "AuditLookupCategoryNameW": 2,
+    "AuditLookupSubCategoryNameA": 2,
+    "AuditLookupSubCategoryNameW": 2,
+    "AuditQueryGlobalSaclA": 2,
+    "AuditQueryGlobalSaclW": 2,
+    "AuditQueryPerUserPolicy": 4,
+    "AuditQuerySecurity": 2,
+    "AuditQuerySystemPolicy": 3,
+    "AuditSetGlobalSaclA": 2,
+    "AuditSetGlobalSaclW": 2,
+    "AuditSetPerUserPolicy": 3,
+    "AuditSetSecurity": 2,
+    "AuditSetSystemPolicy": 2,
+    "BackupEventLogA": 2,
+    "BackupEventLogW": 2,
+    "BuildExplicitAccessWithNameA": 5,
+    "BuildExplicitAccessWithNameW": 5,
+    "BuildImpersonateExplicitAccessWithNameA": 6,
+    "BuildImpersonateExplicitAccessWithNameW": 6,
+    "BuildImpersonateTrusteeA": 2,
+    "BuildImpersonateTrusteeW": 2,
+    "BuildSecurityDescriptorA": 9,
+    "BuildSecurityDescriptorW": 9,
+    "BuildTrusteeWithNameA": 2,
+    "BuildTrusteeWithNameW": 2,
+    "BuildTrusteeWithObjectsAndNameA": 6,
+    "BuildTrusteeWithObjectsAndNameW": 6,
+    "BuildTrusteeWithObjectsAndSidA": 5,
+    "BuildTrusteeWithObjectsAndSidW": 5,
+    "BuildTrusteeWithSidA": 2,
+    "BuildTrusteeWithSidW": 2,
+    "CancelOverlappedAccess": 1,
+    "ChangeServiceConfig2A": 3,
+    "ChangeServiceConfig2W": 3,
+    "ChangeServiceConfigA": 11,
+    "ChangeServiceConfigW": 11,
+    "CheckTokenMembership": 3,
+    "ClearEventLogA": 2,
+    "ClearEventLogW": 2,
+    "CloseCodeAuthzLevel": 1,
+    "CloseEncryptedFileRaw": 1,
+    "CloseEventLog": 1,
+    "CloseServiceHandle": 1,
+    "CloseThreadWaitChainSession": 1,
+    "CloseTrace": 2,
+    "CommandLineFromMsiDescriptor": 3,
+    "ComputeAccessTokenFromCodeAuthzLevel": 5,
+    "ControlService": 3,
+    "ControlServiceExA": 4,
+    "ControlServiceExW": 4,
+    "ControlTraceA": 5,
+    "ControlTraceW": 5,
+    "ConvertAccessToSecurityDescriptorA": 5,
+    "ConvertAccessToSecurityDescriptorW": 5,
+    "ConvertSDToStringSDRootDomainA": 6,
+    "ConvertSDToStringSDRootDomainW": 6,
+    "ConvertSecurityDescriptorToAccessA": 7,
+    "ConvertSecurityDescriptorToAccessNamedA": 7,
+    "ConvertSecurityDescriptorToAccessNamedW": 7,
+    "ConvertSecurityDescriptorToAccessW": 7,
+    "ConvertSecurityDescriptorToStringSecurityDescriptorA": 5,
+    "ConvertSecurityDescriptorToStringSecurityDescriptorW": 5,
+    "ConvertSidToStringSidA": 2,
+    "ConvertSidToStringSidW": 2,
+    "ConvertStringSDToSDDomainA": 6,
+    "ConvertStringSDToSDDomainW": 6,
+    "ConvertStringSDToSDRootDomainA": 5,
+    "ConvertStringSDToSDRootDomainW": 5,
+    "ConvertStringSecurityDescriptorToSecurityDescriptorA": 4,
+    "ConvertStringSecurityDescriptorToSecurityDescriptorW": 4,
+    "ConvertStringSidToSidA": 2,
+    "ConvertStringSidToSidW": 2,
+    "ConvertToAutoInheritPrivateObjectSecurity": 6,
+    "CopySid": 3,
+    "CreateCodeAuthzLevel": 5,
+    "CreatePrivateObjectSecurity": 6,
+    "CreatePrivateObjectSecurityEx": 8,
+    "CreatePrivateObjectSecurityWithMultipleInheritance": 9,
+    "CreateProcessAsUserA": 11,
+    "CreateProcessAsUserW": 11,
+    "CreateProcessWithLogonW": 11,
+    "CreateProcessWithTokenW": 9,
+    "CreateRestrictedToken": 9,
+    "CreateServiceA": 13,
+    "CreateServiceW": 13,
+    "CreateTraceInstanceId": 2,
+    "CreateWellKnownSid": 4,
+    "CredBackupCredentials": 5,
+    "CredDeleteA": 3,
+    "CredDeleteW": 3,
+    "CredEncryptAndMarshalBinaryBlob": 3,
+    "CredEnumerateA": 4,
+    "CredEnumerateW": 4,
+    "CredFindBestCredentialA": 4,
+    "CredFindBestCredentialW": 4,
+    "CredFree": 1,
+    "CredGetSessionTypes": 2,
+    "CredGetTargetInfoA": 3,
+    "CredGetTargetInfoW": 3,
+    "CredIsMarshaledCredentialA": 1,
+    "CredIsMarshaledCredentialW": 1,
+    "CredIsProtectedA": 2,
+    "CredIsProtectedW": 2,
+    "CredMarshalCredentialA": 3,
+    "CredMarshalCredentialW": 3,
+    "CredProfileLoaded": 0,
+    "CredProfileUnloaded": 0,
+    "CredProtectA": 6,
+    "CredProtectW": 6,
+    "CredReadA": 4,
+    "CredReadByTokenHandle": 5,
+    "CredReadDomainCredentialsA": 4,
+    "CredReadDomainCredentialsW": 4,
+    "CredReadW": 4,
+    "CredRenameA": 4,
+    "CredRenameW": 4,
+    "CredRestoreCredentials": 4,
+    "CredUnmarshalCredentialA": 3,
+    "CredUnmarshalCredentialW": 3,
+    "CredUnprotectA": 5,
+    "CredUnprotectW": 5,
+    "CredWriteA": 2,
+    "CredWriteDomainCredentialsA": 3,
+    "CredWriteDomainCredentialsW": 3,
+    "CredWriteW": 2,
+    "CredpConvertCredential": 4,
+    "CredpConvertOneCredentialSize": 2,
+    "CredpConvertTargetInfo": 4,
+    "CredpDecodeCredential": 1,
+    "CredpEncodeCredential": 1,
+    "CredpEncodeSecret": 5,
+    "CryptAcquireContextA": 5,
+    "CryptAcquireContextW": 5,
+    "CryptContextAddRef": 3,
+    "CryptCreateHash": 5,
+    "CryptDecrypt": 6,
+    "CryptDeriveKey": 5,
+    "CryptDestroyHash": 1,
+    "CryptDestroyKey": 1,
+    "CryptDuplicateHash": 4,
+    "CryptDuplicateKey": 4,
+    "CryptEncrypt": 7,
+    "CryptEnumProviderTypesA": 6,
+    "CryptEnumProviderTypesW": 6,
+    "CryptEnumProvidersA": 6,
+    "CryptEnumProvidersW": 6,
+    "CryptExportKey": 6,
+    "CryptGenKey": 4,
+    "CryptGenRandom": 3,
+    "CryptGetDefaultProviderA": 5,
+    "CryptGetDefaultProviderW": 5,
+    "CryptGetHashParam": 5,
+    "CryptGetKeyParam": 5,
+    "CryptGetProvParam": 5,
+    "CryptGetUserKey": 3,
+    "CryptHashData": 4,
+    "CryptHashSessionKey": 3,
+    "CryptImportKey": 6,
+    "CryptReleaseContext": 2,
+    "CryptSetHashParam": 4,
+    "CryptSetKeyParam": 4,
+    "CryptSetProvParam": 4,
+    "CryptSetProviderA": 2,
+    "CryptSetProviderExA": 4,
+    "CryptSetProviderExW": 4,
+    "CryptSetProviderW": 2,
+    "CryptSignHashA": 6,
+    "CryptSignHashW": 6,
+    "CryptVerifySignatureA": 6,
+    "CryptVerifySignatureW": 6,
+    "DecryptFileA": 2,
+    "DecryptFileW": 2,
+    "DeleteAce": 2,
+    "DeleteService": 1,
+    "DeregisterEventSource": 1,
+    "DestroyPrivateObjectSecurity": 1,
+    "DuplicateEncryptionInfoFile": 5,
+    "DuplicateToken": 3,
+    "DuplicateTokenEx": 6,
+    "ElfBackupEventLogFileA": 2,
+    "ElfBackupEventLogFileW": 2,
+    "ElfChangeNotify": 2,
+    "ElfClearEventLogFileA": 2,
+    "ElfClearEventLogFileW": 2,
+    "ElfCloseEventLog": 1,
+    "ElfDeregisterEventSource": 1,
+    "ElfFlushEventLog": 1,
+    "ElfNumberOfRecords": 2,
+    "ElfOldestRecord": 2,
+    "ElfOpenBackupEventLogA": 3,
+    "ElfOpenBackupEventLogW": 3,
+    "ElfOpenEventLogA": 3,
+    "ElfOpenEventLogW": 3,
+    "ElfReadEventLogA": 7,
+    "ElfReadEventLogW": 7,
+    "ElfRegisterEventSourceA": 3,
+    "ElfRegisterEventSourceW": 3,
+    "ElfReportEventA": 12,
+    "ElfReportEventAndSourceW": 15,
+    "ElfReportEventW": 12,
+    "EnableTrace": 6,
+    "EnableTraceEx": 12,
+    "EnableTraceEx2": 11,
+    "EncryptFileA": 1,
+    "EncryptFileW": 1,
+    "EncryptedFileKeyInfo": 3,
+    "EncryptionDisable": 2,
+    "EnumDependentServicesA": 6,
+    "EnumDependentServicesW": 6,
+    "EnumServiceGroupW": 9,
+    "EnumServicesStatusA": 8,
+    "EnumServicesStatusExA": 10,
+    "EnumServicesStatusExW": 10,
+    "EnumServicesStatusW": 8,
+    "EnumerateTraceGuids": 3,
+    "EnumerateTraceGuidsEx": 6,
+    "EqualDomainSid": 3,
+    "EqualPrefixSid": 2,
+    "EqualSid": 2,
+    "EventAccessControl": 5,
+    "EventAccessQuery": 3,
+    "EventAccessRemove": 1,
+    "EventActivityIdControl": 2,
+    "EventEnabled": 3,
+    "EventProviderEnabled": 5,
+    "EventRegister": 4,
+    "EventUnregister": 2,
+    "EventWrite": 5,
+    "EventWriteEndScenario": 5,
+    "EventWriteEx": 10,
+    "EventWriteStartScenario": 5,
+    "EventWriteString": 6,
+    "EventWriteTransfer": 7,
+    "FileEncryptionStatusA": 2,
+    "FileEncryptionStatusW": 2,
+    "FindFirstFreeAce": 2,
+    "FlushEfsCache": 1,
+    "FlushTraceA": 4,
+    "FlushTraceW": 4,
+    "FreeEncryptedFileKeyInfo": 1,
+    "FreeEncryptedFileMetadata": 1,
+    "FreeEncryptionCertificateHashList": 1,
+    "FreeInheritedFromArray": 3,
+    "FreeSid": 1,
+    "GetAccessPermissionsForObjectA": 9,
+    "GetAccessPermissionsForObjectW": 9,
+    "GetAce": 3,
+    "GetAclInformation": 4,
+    "GetAuditedPermissionsFromAclA": 4,
+    "GetAuditedPermissionsFromAclW": 4,
+    "GetCurrentHwProfileA": 1,
+    "GetCurrentHwProfileW": 1,
+    "GetEffectiveRightsFromAclA": 3,
+    "GetEffectiveRightsFromAclW": 3,
+    "GetEncryptedFileMetadata": 3,
+    "GetEventLogInformation": 5,
+    "GetExplicitEntriesFromAclA": 3,
+    "GetExplicitEntriesFromAclW": 3,
+    "GetFileSecurityA": 5,
+    "GetFileSecurityW": 5,
+    "GetInformationCodeAuthzLevelW": 5,
+    "GetInformationCodeAuthzPolicyW": 6,
+    "GetInheritanceSourceA": 10,
+    "GetInheritanceSourceW": 10,
+    "GetKernelObjectSecurity": 5,
+    "GetLengthSid": 1,
+    "GetLocalManagedApplicationData": 3,
+    "GetLocalManagedApplications": 3,
+    "GetManagedApplicationCategories": 2,
+    "GetManagedApplications": 5,
+    "GetMultipleTrusteeA": 1,
+    "GetMultipleTrusteeOperationA": 1,
+    "GetMultipleTrusteeOperationW": 1,
+    "GetMultipleTrusteeW": 1,
+    "GetNamedSecurityInfoA": 8,
+    "GetNamedSecurityInfoExA": 9,
+    "GetNamedSecurityInfoExW": 9,
+    "GetNamedSecurityInfoW": 8,
+    "GetNumberOfEventLogRecords": 2,
+    "GetOldestEventLogRecord": 2,
+    "GetOverlappedAccessResults": 4,
+    "GetPrivateObjectSecurity": 5,
+    "GetSecurityDescriptorControl": 3,
+    "GetSecurityDescriptorDacl": 4,
+    "GetSecurityDescriptorGroup": 3,
+    "GetSecurityDescriptorLength": 1,
+    "GetSecurityDescriptorOwner": 3,
+    "GetSecurityDescriptorRMControl": 2,
+    "GetSecurityDescriptorSacl": 4,
+    "GetSecurityInfo": 8,
+    "GetSecurityInfoExA": 9,
+    "GetSecurityInfoExW": 9,
+    "GetServiceDisplayNameA": 4,
+    "GetServiceDisplayNameW": 4,
+    "GetServiceKeyNameA": 4,
+    "GetServiceKeyNameW": 4,
+    "GetSidIdentifierAuthority": 1,
+    "GetSidLengthRequired": 1,
+    "GetSidSubAuthority": 2,
+    "GetSidSubAuthorityCount": 1,
+    "GetThreadWaitChain": 7,
+    "GetTokenInformation": 5,
+    "GetTraceEnableFlags": 2,
+    "GetTraceEnableLevel": 2,
+    "GetTraceLoggerHandle": 1,
+    "GetTrusteeFormA": 1,
+    "GetTrusteeFormW": 1,
+    "GetTrusteeNameA": 1,
+    "GetTrusteeNameW": 1,
+    "GetTrusteeTypeA": 1,
+    "GetTrusteeTypeW": 1,
+    "GetUserNameA": 2,
+    "GetUserNameW": 2,
+    "GetWindowsAccountDomainSid": 3,
+    "I_QueryTagInformation": 3,
+    "I_ScGetCurrentGroupStateW": 3,
+    "I_ScIsSecurityProcess": 0,
+    "I_ScPnPGetServiceName": 3,
+    "I_ScQueryServiceConfig": 3,
+    "I_ScSendPnPMessage": 6,
+    "I_ScSendTSMessage": 4,
+    "I_ScSetServiceBitsA": 5,
+    "I_ScSetServiceBitsW": 5,
+    "I_ScValidatePnPService": 3,
+    "IdentifyCodeAuthzLevelW": 4,
+    "ImpersonateAnonymousToken": 1,
+    "ImpersonateLoggedOnUser": 1,
+    "ImpersonateNamedPipeClient": 1,
+    "ImpersonateSelf": 1,
+    "InitializeAcl": 3,
+    "InitializeSecurityDescriptor": 2,
+    "InitializeSid": 3,
+    "InitiateShutdownA": 5,
+    "InitiateShutdownW": 5,
+    "InitiateSystemShutdownA": 5,
+    "InitiateSystemShutdownExA": 6,
+    "InitiateSystemShutdownExW": 6,
+    "InitiateSystemShutdownW": 5,
+    "InstallApplication": 1,
+    "IsTextUnicode": 3,
+    "IsTokenRestricted": 1,
+    "IsTokenUntrusted": 1,
+    "IsValidAcl": 1,
+    "IsValidRelativeSecurityDescriptor": 3,
+    "IsValidSecurityDescriptor": 1,
+    "IsValidSid": 1,
+    "IsWellKnownSid": 2,
+    "LockServiceDatabase": 1,
+    "LogonUserA": 6,
+    "LogonUserExA": 10,
+    "LogonUserExExW": 11,
+    "LogonUserExW": 10,
+    "LogonUserW": 6,
+    "LookupAccountNameA": 7,
+    "LookupAccountNameW": 7,
+    "LookupAccountSidA": 7,
+    "LookupAccountSidW": 7,
+    "LookupPrivilegeDisplayNameA": 5,
+    "LookupPrivilegeDisplayNameW": 5,
+    "LookupPrivilegeNameA": 4,
+    "LookupPrivilegeNameW": 4,
+    "LookupPrivilegeValueA": 3,
+    "LookupPrivilegeValueW": 3,
+    "LookupSecurityDescriptorPartsA": 7,
+    "LookupSecurityDescriptorPartsW": 7,
+    "LsaAddAccountRights": 4,
+    "LsaAddPrivilegesToAccount": 2,
+    "LsaClearAuditLog": 1,
+    "LsaClose": 1,
+    "LsaCreateAccount": 4,
+    "LsaCreateSecret": 4,
+    "LsaCreateTrustedDomain": 4,
+    "LsaCreateTrustedDomainEx": 5,
+    "LsaDelete": 1,
+    "LsaDeleteTrustedDomain": 2,
+    "LsaEnumerateAccountRights": 4,
+    "LsaEnumerateAccounts": 5,
+    "LsaEnumerateAccountsWithUserRight": 4,
+    "LsaEnumeratePrivileges": 5,
+    "LsaEnumeratePrivilegesOfAccount": 2,
+    "LsaEnumerateTrustedDomains": 5,
+    "LsaEnumerateTrustedDomainsEx": 5,
+    "LsaFreeMemory": 1,
+    "LsaGetQuotasForAccount": 2,
+    "LsaGetRemoteUserName": 3,
+    "LsaGetSystemAccessAccount": 2,
+    "LsaGetUserName": 2,
+    "LsaICLookupNames": 10,
+    "LsaICLookupNamesWithCreds": 12,
+    "LsaICLookupSids": 9,
+    "LsaICLookupSidsWithCreds": 12,
+    "LsaLookupNames": 5,
+    "LsaLookupNames2": 6,
+    "LsaLookupPrivilegeDisplayName": 4,
+    "LsaLookupPrivilegeName": 3,
+    "LsaLookupPrivilegeValue": 3,
+    "LsaLookupSids": 5,
+    "LsaManageSidNameMapping": 3,
+    "LsaNtStatusToWinError": 1,
+    "LsaOpenAccount": 4,
+    "LsaOpenPolicy": 4,
+    "LsaOpenPolicySce": 4,
+    "LsaOpenSecret": 4,
+    "LsaOpenTrustedDomain": 4,
+    "LsaOpenTrustedDomainByName": 4,
+    "LsaQueryDomainInformationPolicy": 3,
+    "LsaQueryForestTrustInformation": 3,
+    "LsaQueryInfoTrustedDomain": 3,
+    "LsaQueryInformationPolicy": 3,
+    "LsaQuerySecret": 5,
+    "LsaQuerySecurityObject": 3,
+    "LsaQueryTrustedDomainInfo": 4,
+    "LsaQueryTrustedDomainInfoByName": 4,
+    "LsaRemoveAccountRights": 5,
+    "LsaRemovePrivilegesFromAccount": 3,
+    "LsaRetrievePrivateData": 3,
+    "LsaSetDomainInformationPolicy": 3,
+    "LsaSetForestTrustInformation": 5,
+    "LsaSetInformationPolicy": 3,
+    "LsaSetInformationTrustedDomain": 3,
+    "LsaSetQuotasForAccount": 2,
+    "LsaSetSecret": 3,
+    "LsaSetSecurityObject": 3,
+    "LsaSetSystemAccessAccount": 2,
+    "LsaSetTrustedDomainInfoByName": 4,
+    "LsaSetTrustedDomainInformation": 4,
+    "LsaStorePrivateData": 3,
+    "MD4Final": 1,
+    "MD4Init": 1,
+    "MD4Update": 3,
+    "MD5Final": 1,
+    "MD5Init": 1,
+    "MD5Update": 3,
+    "MSChapSrvChangePassword": 7,
+    "MSChapSrvChangePassword2": 7,
+    "MakeAbsoluteSD": 11,
+    "MakeAbsoluteSD2": 2,
+    "MakeSelfRelativeSD": 3,
+    "MapGenericMask": 2,
+    "NotifyBootConfigStatus": 1,
+    "NotifyChangeEventLog": 2,
+    "NotifyServiceStatusChange": 3,
+    "NotifyServiceStatusChangeA": 3,
+    "NotifyServiceStatusChangeW": 3,
+    "ObjectCloseAuditAlarmA": 3,
+    "ObjectCloseAuditAlarmW": 3,
+    "ObjectDeleteAuditAlarmA": 3,
+    "ObjectDeleteAuditAlarmW": 3,
+    "ObjectOpenAuditAlarmA": 12,
+    "ObjectOpenAuditAlarmW": 12,
+    "ObjectPrivilegeAuditAlarmA": 6,
+    "ObjectPrivilegeAuditAlarmW": 6,
+    "OpenBackupEventLogA": 2,
+    "OpenBackupEventLogW": 2,
+    "OpenEncryptedFileRawA": 3,
+    "OpenEncryptedFileRawW": 3,
+    "OpenEventLogA": 2,
+    "OpenEventLogW": 2,
+    "OpenProcessToken": 3,
+    "OpenSCManagerA": 3,
+    "OpenSCManagerW": 3,
+    "OpenServiceA": 3,
+    "OpenServiceW": 3,
+    "OpenThreadToken": 4,
+    "OpenThreadWaitChainSession": 2,
+    "OpenTraceA": 1,
+    "OpenTraceW": 1,
+    "PerfAddCounters": 3,
+    "PerfCloseQueryHandle": 1,
+    "PerfCreateInstance": 4,
+    "PerfDecrementULongCounterValue": 4,
+    "PerfDecrementULongLongCounterValue": 5,
+    "PerfDeleteCounters": 3,
+    "PerfDeleteInstance": 2,
+    "PerfEnumerateCounterSet": 4,
+    "PerfEnumerateCounterSetInstances": 5,
+    "PerfIncrementULongCounterValue": 4,
+    "PerfIncrementULongLongCounterValue": 5,
+    "PerfOpenQueryHandle": 2,
+    "PerfQueryCounterData": 4,
+    "PerfQueryCounterInfo": 4,
+    "PerfQueryCounterSetRegistrationInfo": 7,
+    "PerfQueryInstance": 4,
+    "PerfSetCounterRefValue": 4,
+    "PerfSetCounterSetInfo": 3,
+    "PerfSetULongCounterValue": 4,
+    "PerfSetULongLongCounterValue": 5,
+    "PerfStartProvider": 3,
+    "PerfStartProviderEx": 3,
+    "PerfStopProvider": 1,
+    "PrivilegeCheck": 3,
+    "PrivilegedServiceAuditAlarmA": 5,
+    "PrivilegedServiceAuditAlarmW": 5,
+    "ProcessIdleTasks": 0,
+    "ProcessIdleTasksW": 4,
+    "ProcessTrace": 4,
+    "QueryAllTracesA": 3,
+    "QueryAllTracesW": 3,
+    "QueryRecoveryAgentsOnEncryptedFile": 2,
+    "QuerySecurityAccessMask": 2,
+    "QueryServiceConfig2A": 5,
+    "QueryServiceConfig2W": 5,
+    "QueryServiceConfigA": 4,
+    "QueryServiceConfigW": 4,
+    "QueryServiceLockStatusA": 4,
+    "QueryServiceLockStatusW": 4,
+    "QueryServiceObjectSecurity": 5,
+    "QueryServiceStatus": 2,
+    "QueryServiceStatusEx": 5,
+    "QueryTraceA": 4,
+    "QueryTraceW": 4,
+    "QueryUsersOnEncryptedFile": 2,
+    "ReadEncryptedFileRaw": 3,
+    "ReadEventLogA": 7,
+    "ReadEventLogW": 7,
+    "RegCloseKey": 1,
+    "RegConnectRegistryA": 3,
+    "RegConnectRegistryExA": 4,
+    "RegConnectRegistryExW": 4,
+    "RegConnectRegistryW": 3,
+    "RegCopyTreeA": 3,
+    "RegCopyTreeW": 3,
+    "RegCreateKeyA": 3,
+    "RegCreateKeyExA": 9,
+    "RegCreateKeyExW": 9,
+    "RegCreateKeyTransactedA": 11,
+    "RegCreateKeyTransactedW": 11,
+    "RegCreateKeyW": 3,
+    "RegDeleteKeyA": 2,
+    "RegDeleteKeyExA": 4,
+    "RegDeleteKeyExW": 4,
+    "RegDeleteKeyTransactedA": 6,
+    "RegDeleteKeyTransactedW": 6,
+    "RegDeleteKeyValueA": 3,
+    "RegDeleteKeyValueW": 3,
+    "RegDeleteKeyW": 2,
+    "RegDeleteTreeA": 2,
+    "RegDeleteTreeW": 2,
+    "RegDeleteValueA": 2,
+    "RegDeleteValueW": 2,
+    "RegDisablePredefinedCache": 0,
+    "RegDisablePredefinedCacheEx": 0,
+    "RegDisableReflectionKey": 1,
+    "RegEnableReflectionKey": 1,
+    "RegEnumKeyA": 4,
+    "RegEnumKeyExA": 8,
+    "RegEnumKeyExW": 8,
+    "RegEnumKeyW": 4,
+    "RegEnumValueA": 8,
+    "RegEnumValueW": 8,
+    "RegFlushKey": 1,
+    "RegGetKeySecurity": 4,
+    "RegGetValueA": 7,
+    "RegGetValueW": 7,
+    "RegLoadAppKeyA": 5,
+    "RegLoadAppKeyW": 5,
+    "RegLoadKeyA": 3,
+    "RegLoadKeyW": 3,
+    "RegLoadMUIStringA": 7,
+    "RegLoadMUIStringW": 7,
+    "RegNotifyChangeKeyValue": 5,
+    "RegOpenCurrentUser": 2,
+    "RegOpenKeyA": 3,
+    "RegOpenKeyExA": 5,
+    "RegOpenKeyExW": 5,
+    "RegOpenKeyTransactedA": 7,
+    "RegOpenKeyTransactedW": 7,
+    "RegOpenKeyW": 3,
+    "RegOpenUserClassesRoot": 4,
+    "RegOverridePredefKey": 2,
+    "RegQueryInfoKeyA": 12,
+    "RegQueryInfoKeyW": 12,
+    "RegQueryMultipleValuesA": 5,
+    "RegQueryMultipleValuesW": 5,
+    "RegQueryReflectionKey": 2,
+    "RegQueryValueA": 4,
+    "RegQueryValueExA": 6,
+    "RegQueryValueExW": 6,
+    "RegQueryValueW": 4,
+    "RegRenameKey": 3,
+    "RegReplaceKeyA": 4,
+    "RegReplaceKeyW": 4,
+    "RegRestoreKeyA": 3,
+    "RegRestoreKeyW": 3,
+    "RegSaveKeyA": 3,
+    "RegSaveKeyExA": 4,
+    "RegSaveKeyExW": 4,
+    "RegSaveKeyW": 3,
+    "RegSetKeySecurity": 3,
+    "RegSetKeyValueA": 6,
+    "RegSetKeyValueW": 6,
+    "RegSetValueA": 5,
+    "RegSetValueExA": 6,
+    "RegSetValueExW": 6,
+    "RegSetValueW": 5,
+    "RegUnLoadKeyA": 2,
+    "RegUnLoadKeyW": 2,
+    "RegisterEventSourceA": 2,
+    "RegisterEventSourceW": 2,
+    "RegisterIdleTask": 4,
+    "RegisterServiceCtrlHandlerA": 2,
+    "RegisterServiceCtrlHandlerExA": 3,
+    "RegisterServiceCtrlHandlerExW": 3,
+    "RegisterServiceCtrlHandlerW": 2,
+    "RegisterTraceGuidsA": 8,
+    "RegisterTraceGuidsW": 8,
+    "RegisterWaitChainCOMCallback": 2,
+    "RemoveTraceCallback": 1,
+    "RemoveUsersFromEncryptedFile": 2,
+    "ReportEventA": 9,
+    "ReportEventW": 9,
+    "RevertToSelf": 0,
+    "SaferCloseLevel": 1,
+    "SaferComputeTokenFromLevel": 5,
+    "SaferCreateLevel": 5,
+    "SaferGetLevelInformation": 5,
+    "SaferGetPolicyInformation": 6,
+    "SaferIdentifyLevel": 4,
+    "SaferRecordEventLogEntry": 3,
+    "SaferSetLevelInformation": 4,
+    "SaferSetPolicyInformation": 5,
+    "SaferiChangeRegistryScope": 2,
+    "SaferiCompareTokenLevels": 3,
+    "SaferiIsDllAllowed": 3,
+    "SaferiIsExecutableFileType": 2,
+    "SaferiPopulateDefaultsInRegistry": 2,
+    "SaferiRecordEventLogEntry": 3,
+    "SaferiRegisterExtensionDll": 2,
+    "SaferiSearchMatchingHashRules": 6,
+    "SetAclInformation": 4,
+    "SetEncryptedFileMetadata": 6,
+    "SetEntriesInAccessListA": 6,
+    "SetEntriesInAccessListW": 6,
+    "SetEntriesInAclA": 4,
+    "SetEntriesInAclW": 4,
+    "SetEntriesInAuditListA": 6,
+    "SetEntriesInAuditListW": 6,
+    "SetFileSecurityA": 3,
+    "SetFileSecurityW": 3,
+    "SetInformationCodeAuthzLevelW": 4,
+    "SetInformationCodeAuthzPolicyW": 5,
+    "SetKernelObjectSecurity": 3,
+    "SetNamedSecurityInfoA": 7,
+    "SetNamedSecurityInfoExA": 9,
+    "SetNamedSecurityInfoExW": 9,
+    "SetNamedSecurityInfoW": 7,
+    "SetPrivateObjectSecurity": 5,
+    "SetPrivateObjectSecurityEx": 6,
+    "SetSecurityAccessMask": 2,
+    "SetSecurityDescriptorControl": 3,
+    "SetSecurityDescriptorDacl": 4,
+    "SetSecurityDescriptorGroup": 3,
+    "SetSecurityDescriptorOwner": 3,
+    "SetSecurityDescriptorRMControl": 2,
+    "SetSecurityDescriptorSacl": 4,
+    "SetSecurityInfo": 7,
+    "SetSecurityInfoExA": 9,
+    "SetSecurityInfoExW": 9,
+    "SetServiceBits": 4,
+    "SetServiceObjectSecurity": 3,
+    "SetServiceStatus": 2,
+    "SetThreadToken": 2,
+    "SetTokenInformation": 4,
+    "SetTraceCallback": 2,
+    "SetUserFileEncryptionKey": 1,
+    "SetUserFileEncryptionKeyEx": 4,
+    "StartServiceA": 3,
+    "StartServiceCtrlDispatcherA": 1,
+    "StartServiceCtrlDispatcherW": 1,
+    "StartServiceW": 3,
+    "StartTraceA": 3,
+    "StartTraceW": 3,
+    "StopTraceA": 4,
+    "StopTraceW": 4,
+    "SystemFunction001": 3,
+    "SystemFunction002": 3,
+    "SystemFunction003": 2,
+    "SystemFunction004": 3,
+    "SystemFunction005": 3,
+    "SystemFunction006": 2,
+    "SystemFunction007": 2,
+    "SystemFunction008": 3,
+    "SystemFunction009": 3,
+    "SystemFunction010": 3,
+    "SystemFunction011": 3,
+    "SystemFunction012": 3,
+    "SystemFunction013": 3,
+    "SystemFunction014": 3,
+    "SystemFunction015": 3,
+    "SystemFunction016": 3,
+    "SystemFunction017": 3,
+    "SystemFunction018": 3,
+    "SystemFunction019": 3,
+    "SystemFunction020": 3,
+    "SystemFunction021": 3,
+    "SystemFunction022": 3,
+    "SystemFunction023": 3,
+    "SystemFunction024": 3,
+    "SystemFunction025": 3,
+    "SystemFunction026": 3,
+    "SystemFunction027": 3,
+    "SystemFunction028": 2,
+    "SystemFunction029": 2,
+    "SystemFunction030": 2,
+    "SystemFunction031": 2,
+    "SystemFunction032": 2,
+    "SystemFunction033": 2,
+    "SystemFunction034": 3,
+    "SystemFunction035": 1,
+    "SystemFunction036": 2,
+    "SystemFunction040": 3,
+    "SystemFunction041": 3,
+    "TraceEvent": 3,
+    "TraceEventInstance": 5,
+    "TraceMessage": 0,
+    "TraceMessageVa": 6,
+    "TraceSetInformation": 5,
+    "TreeResetNamedSecurityInfoA": 11,
+    "TreeResetNamedSecurityInfoW": 11,
+    "TreeSetNamedSecurityInfoA": 11,
+    "TreeSetNamedSecurityInfoW": 11,
+    "TrusteeAccessToObjectA": 6,
+    "TrusteeAccessToObjectW": 6,
+    "UninstallApplication": 2,
+    "UnlockServiceDatabase": 1,
+    "UnregisterIdleTask": 3,
+    "UnregisterTraceGuids": 2,
+    "UpdateTraceA": 4,
+    "UpdateTraceW": 4,
+    "UsePinForEncryptedFilesA": 3,
+    "UsePinForEncryptedFilesW": 3,
+    "WmiCloseBlock": 1,
+    "WmiDevInstToInstanceNameA": 4,
+    "WmiDevInstToInstanceNameW": 4,
+    "WmiEnumerateGuids": 2,
+    "WmiExecuteMethodA": 7,
+    "WmiExecuteMethodW": 7,
+    "WmiFileHandleToInstanceNameA": 4,
+    "WmiFileHandleToInstanceNameW": 4,
+    "WmiFreeBuffer": 1,
+    "WmiMofEnumerateResourcesA": 3,
+    "WmiMofEnumerateResourcesW": 3,
+    "WmiNotificationRegistrationA": 5,
+    "WmiNotificationRegistrationW": 5,
+    "WmiOpenBlock": 3,
+    "WmiQueryAllDataA": 3,
+    "WmiQueryAllDataMultipleA": 4,
+    "WmiQueryAllDataMultipleW": 4,
+    "WmiQueryAllDataW": 3,
+    "WmiQueryGuidInformation": 2,
+    "WmiQuerySingleInstanceA": 4,
+    "WmiQuerySingleInstanceMultipleA": 5,
+    "WmiQuerySingleInstanceMultipleW": 5,
+    "WmiQuerySingleInstanceW": 4,
+    "WmiReceiveNotificationsA": 4,
+    "WmiReceiveNotificationsW": 4,
+    "WmiSetSingleInstanceA": 5,
+    "WmiSetSingleInstanceW": 5,
+    "WmiSetSingleItemA": 6,
+    "WmiSetSingleItemW": 6,
+    "WriteEncryptedFileRaw": 3
 }
 
-lib.set_prototypes(prototypes)
+
+def _load_prototypes():
+    return {name: SimTypeFunction((SimTypeLong(),)*num_args, SimTypeLong())
+            for name, num_args in _prototype_num_args.items()}
+
+
+lib.set_prototype_loader(_load_prototypes)
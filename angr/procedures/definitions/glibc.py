@@ -33,7 +33,8 @@ libc.set_non_returning('exit_group', 'exit', 'abort', 'pthread_exit', '__assert_
 # parsed function prototypes
 #
 
-_libc_decls = \
+def _libc_decls():
+    return \
     {
         # char * strerror (int ERRNUM);
         "strerror": SimTypeFunction([SimTypeInt(signed=True)], SimTypePointer(SimTypeChar(), offset=0), arg_names=["errnum"]),
@@ -3060,18 +3061,22 @@ _libc_decls = \
     }
 
 
-proto_count = 0
-unsupported_count = 0
+def _load_prototypes():
+    prototypes = { }
+    unsupported_count = 0
 
-for name, proto in _libc_decls.items():
-    if proto is not None:
-        libc.set_prototype(name, proto)
-        proto_count += 1
-    else:
-        unsupported_count += 1
+    for name, proto in _libc_decls().items():
+        if proto is not None:
+            prototypes[name] = proto
+        else:
+            unsupported_count += 1
 
-_l.debug("Libc provides %d function prototypes, and has %d unsupported function prototypes.",
-         proto_count, unsupported_count)
+    _l.debug("Libc provides %d function prototypes, and has %d unsupported function prototypes.",
+             len(prototypes), unsupported_count)
+    return prototypes
+
+
+libc.set_prototype_loader(_load_prototypes)
 
 
 #
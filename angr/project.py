@@ -64,6 +64,15 @@ class Project:
     :param simos:                       a SimOS class to use for this project.
     :param engine:                      The SimEngine class to use for this project.
     :param bool translation_cache:      If True, cache translated basic blocks rather than re-translating them.
+    :param str persistent_translation_cache: Path to an SQLite database in which translated basic blocks are cached
+                                        across runs and processes. Only used if translation_cache is enabled.
+    :param int solver_cache_size:       If set, cache up to this many exact solver results, and share them between all
+                                        the states of the project. Hit and miss counts are available on the
+                                        ``solver_cache`` attribute.
+    :param bool unicorn_page_cache:     If True, pages that are copied into Unicorn unchanged from the loaded binaries
+                                        are cached once and shared between all the states of the project. Writes to
+                                        ``loader.memory`` are not tracked, so call
+                                        ``unicorn_page_cache.invalidate()`` after patching the loaded binaries.
     :param support_selfmodifying_code:  Whether we aggressively support self-modifying code. When enabled, emulation
                                         will try to read code from the current state instead of the original memory,
                                         regardless of the current memory protections.
@@ -97,6 +106,9 @@ class Project:
                  engine=None,
                  load_options=None,
                  translation_cache=True,
+                 persistent_translation_cache=None,
+                 solver_cache_size=None,
+                 unicorn_page_cache=False,
                  support_selfmodifying_code=False,
                  store_function=None,
                  load_function=None,
@@ -171,6 +183,9 @@ class Project:
         self._ignore_functions = ignore_functions
         self._support_selfmodifying_code = support_selfmodifying_code
         self._translation_cache = translation_cache
+        self._persistent_translation_cache = persistent_translation_cache
+        self.solver_cache = SolverResultCache(max_size=solver_cache_size) if solver_cache_size else None
+        self.unicorn_page_cache = UnicornPageCache(self.loader.memory) if unicorn_page_cache else None
         self._executing = False # this is a flag for the convenience API, exec() and terminate_execution() below
 
         if self._support_selfmodifying_code:
@@ -709,3 +724,5 @@ from angr.simos import SimOS, os_mapping
 from .analyses.analysis import AnalysesHub
 from .knowledge_base import KnowledgeBase
 from .procedures import SIM_PROCEDURES, SIM_LIBRARIES
+from .state_plugins.solver_cache import SolverResultCache
+from .state_plugins.unicorn_page_cache import UnicornPageCache
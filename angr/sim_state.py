@@ -96,6 +96,8 @@ class SimState(PluginHub):
         self.options = options
         self.mode = mode
         self.supports_inspect = False
+        # kept in sync by SimInspector, see SimState._inspect_armed
+        self._inspect_armed_events = 0
 
         # OS name
         self.os_name = os_name
@@ -205,6 +207,8 @@ class SimState(PluginHub):
     def __getstate__(self):
         s = { k:v for k,v in self.__dict__.items() if k not in ('inspect', 'regs', 'mem')}
         s['_active_plugins'] = { k:v for k,v in s['_active_plugins'].items() if k not in ('inspect', 'regs', 'mem') }
+        # breakpoints are not pickled
+        s['_inspect_armed_events'] = 0
         return s
 
     def __setstate__(self, s):
@@ -335,6 +339,16 @@ class SimState(PluginHub):
         if self.supports_inspect:
             self.inspect.action(*args, **kwargs)
 
+    def _inspect_armed(self, event_type):
+        """
+        Check whether any breakpoint is registered for an event type. Hot paths use this to skip building the event
+        arguments, calling _inspect() and reading the results back with _inspect_getattr() altogether.
+
+        :param str event_type:  The event type.
+        :rtype:                 bool
+        """
+        return self._inspect_armed_events & event_bits[event_type] != 0
+
     def _inspect_getattr(self, attr, default_value):
         if self.supports_inspect:
             if hasattr(self.inspect, attr):
@@ -914,7 +928,7 @@ default_state_plugin_preset = PluginPreset()
 SimState.register_preset('default', default_state_plugin_preset)
 
 from .state_plugins.history import SimStateHistory
-from .state_plugins.inspect import BP_AFTER, BP_BEFORE
+from .state_plugins.inspect import BP_AFTER, BP_BEFORE, event_bits
 from .state_plugins.sim_action import SimActionConstraint
 
 from . import sim_options as o
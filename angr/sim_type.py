@@ -1,6 +1,8 @@
 from collections import OrderedDict, defaultdict
 from .misc.ux import deprecated
 import copy
+import functools
+import itertools
 import re
 import logging
 from typing import Optional
@@ -1068,6 +1070,25 @@ def _make_scope():
     return [scope]
 
 
+_scope_names = None
+
+
+def _get_scope_names():
+    """
+    Get the names in the scope generated by _make_scope(), as a frozenset that parsed type expressions are cached by.
+    The set is built once, and built again after the global type store changes.
+    """
+    global _scope_names
+    if _scope_names is None:
+        _scope_names = frozenset(_make_scope()[0])
+    return _scope_names
+
+
+def _invalidate_scope_names():
+    global _scope_names
+    _scope_names = None
+
+
 @deprecated(replacement="register_types(parse_type(struct_expr))")
 def define_struct(defn):
     """
@@ -1078,6 +1099,7 @@ def define_struct(defn):
     struct = parse_type(defn)
     ALL_TYPES[struct.name] = struct
     ALL_TYPES['struct ' + struct.name] = struct
+    _invalidate_scope_names()
     return struct
 
 
@@ -1101,6 +1123,7 @@ def register_types(types):
         ALL_TYPES['union ' + types.name] = types
     else:
         ALL_TYPES.update(types)
+    _invalidate_scope_names()
 
 
 def do_preprocess(defn):
@@ -1138,18 +1161,14 @@ def parse_file(defn, preprocess=True):
     if pycparser is None:
         raise ImportError("Please install pycparser in order to parse C definitions")
 
-    defn = '\n'.join(x for x in defn.split('\n') if _include_re.match(x) is None)
-
-    if preprocess:
-        defn = do_preprocess(defn)
-
     preamble, ignoreme = make_preamble()
-    node = pycparser.c_parser.CParser().parse(preamble + defn)
-    if not isinstance(node, pycparser.c_ast.FileAST):
-        raise ValueError("Something went horribly wrong using pycparser")
+    preamble_node = _parse_preamble(preamble)
+    node = _parse_file_ast(defn, preprocess, preamble)
+
     out = {}
     extra_types = {}
-    for piece in node.ext:
+    # the preamble is parsed only once, but type objects are created for every call, since callers may modify them
+    for piece in itertools.chain(preamble_node.ext, node.ext):
         if isinstance(piece, pycparser.c_ast.FuncDef):
             out[piece.decl.name] = _decl_to_type(piece.decl.type, extra_types)
         elif isinstance(piece, pycparser.c_ast.Decl):
@@ -1174,17 +1193,9 @@ def parse_type(defn, preprocess=True):  # pylint:disable=unused-argument
     if pycparser is None:
         raise ImportError("Please install pycparser in order to parse C definitions")
 
-    defn = re.sub(r"/\*.*?\*/", r"", defn)
-
-    parser = pycparser.CParser()
-
-    parser.cparser = pycparser.ply.yacc.yacc(module=parser,
-                                             start='parameter_declaration',
-                                             debug=False,
-                                             optimize=False,
-                                             errorlog=errorlog)
+    defn = ' '.join(re.sub(r"/\*.*?\*/", r"", defn).split())
 
-    node = parser.parse(text=defn, scope_stack=_make_scope())
+    node = _parse_type_ast(defn, _get_scope_names())
     if not isinstance(node, pycparser.c_ast.Typename) and \
             not isinstance(node, pycparser.c_ast.Decl):
         raise ValueError("Something went horribly wrong using pycparser")
@@ -1193,6 +1204,80 @@ def parse_type(defn, preprocess=True):  # pylint:disable=unused-argument
     return _decl_to_type(decl)
 
 
+#
+# Parser caching
+#
+# Creating a CParser is expensive, especially for type expressions, where yacc tables have to be generated for a
+# different start symbol. Parsers are created once and kept in per-start-symbol pools. Syntax trees are memoized by
+# their source text. They are never modified, and SimType objects are created from them on every call.
+#
+
+_parser_pools = defaultdict(list)
+
+
+def _acquire_parser(start):
+    """
+    Get a parser from the pool, or create a new one if the pool is empty.
+
+    :param str start:   The start symbol of the grammar, or None for whole files.
+    :return:            A CParser instance.
+    """
+    try:
+        return _parser_pools[start].pop()
+    except IndexError:
+        pass
+
+    parser = pycparser.CParser()
+    if start is not None:
+        parser.cparser = pycparser.ply.yacc.yacc(module=parser,
+                                                 start=start,
+                                                 debug=False,
+                                                 optimize=False,
+                                                 errorlog=errorlog)
+    return parser
+
+
+def _release_parser(start, parser):
+    _parser_pools[start].append(parser)
+
+
+def _parse(text, start, scope_names):
+    parser = _acquire_parser(start)
+    try:
+        return parser.parse(text=text, scope_stack=[dict.fromkeys(scope_names, True)])
+    finally:
+        _release_parser(start, parser)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_preamble(preamble):
+    node = _parse(preamble, None, ())
+    if not isinstance(node, pycparser.c_ast.FileAST):
+        raise ValueError("Something went horribly wrong using pycparser")
+    return node
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_file_ast(defn, preprocess, preamble):
+    defn = '\n'.join(x for x in defn.split('\n') if _include_re.match(x) is None)
+
+    if preprocess:
+        defn = do_preprocess(defn)
+
+    # typedefs in the preamble must be known to the lexer
+    preamble_types = [ piece.name for piece in _parse_preamble(preamble).ext
+                       if isinstance(piece, pycparser.c_ast.Typedef) ]
+    node = _parse(defn, None, preamble_types)
+    if not isinstance(node, pycparser.c_ast.FileAST):
+        raise ValueError("Something went horribly wrong using pycparser")
+    return node
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_type_ast(defn, scope_names):
+    return _parse(defn, 'parameter_declaration', scope_names)
+
+
 def _accepts_scope_stack():
     """
     pycparser hack to include scope_stack as parameter in CParser parse method
@@ -197,22 +197,57 @@ class StateHierarchy(object):
 
     def most_mergeable(self, states):
         """
-        Find the "most mergeable" set of states from those provided.
+        Find the "most mergeable" set of states from those provided: the states whose histories descend from the
+        deepest history node that is a strict ancestor of at least two of them.
+
+        Ancestry is looked up with the jump pointers of the history nodes themselves, so this takes O(k log^2 n) for k
+        states with histories of depth n, regardless of the size of the hierarchy.
 
         :param states: a list of states
         :returns: a tuple of: (a list of states to merge, those states' common history, a list of states to not merge yet)
         """
 
-        histories = set(self.get_ref(s.history) for s in states)
-
-        for n in networkx.algorithms.dfs_postorder_nodes(self._graph):
-            intersection = histories.intersection(self.all_successors(n))
-            if len(intersection) > 1:
-                return (
-                    [ s for s in states if self.get_ref(s.history) in intersection ],
-                    n(),
-                    [ s for s in states if self.get_ref(s.history) not in intersection ]
-                )
+        histories = list({ id(s.history): s.history for s in states }.values())
+        max_depth = max((h._get_index()[1] for h in histories), default=0)
+
+        # having two histories with a common strict ancestor at some depth implies having one at every lower depth,
+        # so the deepest such depth can be found with a binary search
+        best = None
+        lo, hi = 0, max_depth - 1
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            groups = self._common_ancestors_at_depth(histories, mid)
+            if groups:
+                best = groups
+                lo = mid + 1
+            else:
+                hi = mid - 1
+
+        if best is None:
+            # didn't find any?
+            return set(), None, states
+
+        ancestor, members = max(best, key=lambda group: len(group[1]))
+        members = set(id(h) for h in members)
+        return (
+            [ s for s in states if id(s.history) in members ],
+            ancestor,
+            [ s for s in states if id(s.history) not in members ]
+        )
+
+    @staticmethod
+    def _common_ancestors_at_depth(histories, depth):
+        """
+        Group histories by their strict ancestor at a given depth.
 
-        # didn't find any?
-        return set(), None, states
+        :param histories:   A list of history nodes.
+        :param int depth:   The distance to the root of the ancestors.
+        :return:            A list of tuples of (ancestor, histories) for every ancestor shared by at least two of the
+                            histories, in the order of their first appearance.
+        """
+        groups = { }
+        for h in histories:
+            if h._get_index()[1] > depth:
+                ancestor = h._ancestor_at_depth(depth)
+                groups.setdefault(id(ancestor), (ancestor, [ ]))[1].append(h)
+        return [ group for group in groups.values() if len(group[1]) > 1 ]
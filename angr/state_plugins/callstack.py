@@ -2,17 +2,44 @@
 import collections
 from itertools import dropwhile
 import logging
+import weakref
 
 from .plugin import SimStatePlugin
 from ..errors import AngrError, SimEmptyCallStackError
 
 l = logging.getLogger(name=__name__)
 
+
+class _FrameChainKey:
+    """
+    The interned identity of a chain of call stack frames, as far as equality goes. Chains of frames with the same
+    function addresses, stack pointers and return addresses share the same key, so comparing two call stacks is an
+    identity check, and their depth and hash are computed only once.
+    """
+
+    __slots__ = ('depth', 'hash', '__weakref__')
+
+    def __init__(self, depth, hash_):
+        self.depth = depth
+        self.hash = hash_
+
+
+# (function address, stack pointer, return address, key of the next frame) -> key
+_frame_chain_keys = weakref.WeakValueDictionary()
+
+
 class CallStack(SimStatePlugin):
     """
     Stores the address of the function you're in and the value of SP
     at the VERY BOTTOM of the stack, i.e. points to the return address.
+
+    Frames are linked to the frames below them, which are shared between copies and must not be modified. The depth,
+    the hash and the stack suffixes of a frame are cached, and the caches are reset when the frame itself is modified.
     """
+
+    # attributes that the cached depth, hash and stack suffixes depend on
+    _IDENTITY_ATTRS = frozenset(('call_site_addr', 'func_addr', 'stack_ptr', 'ret_addr', 'next'))
+
     def __init__(self, call_site_addr=0, func_addr=0, stack_ptr=0, ret_addr=0, jumpkind='Ijk_Call', next_frame=None,
                  invoke_return_variable=None):
         super(CallStack, self).__init__()
@@ -29,6 +56,19 @@ class CallStack(SimStatePlugin):
         self.procedure_data = None
         self.locals = {}
 
+    def __setattr__(self, k, v):
+        if k in self._IDENTITY_ATTRS:
+            self.__dict__['_key'] = None
+            self.__dict__['_suffixes'] = None
+        super(CallStack, self).__setattr__(k, v)
+
+    def __getstate__(self):
+        d = super(CallStack, self).__getstate__()
+        # keys are only interned within a single process
+        d['_key'] = None
+        d['_suffixes'] = None
+        return d
+
     # deprecated as SHIT
     @property
     def call_target(self):
@@ -59,6 +99,10 @@ class CallStack(SimStatePlugin):
         n.block_counter = collections.Counter(self.block_counter)
         n.procedure_data = self.procedure_data
         n.locals = dict(self.locals)
+        if with_tail:
+            # same frame chain, same caches
+            n._key = self.__dict__.get('_key')
+            n._suffixes = self.__dict__.get('_suffixes')
         return n
 
     def set_state(self, state):
@@ -108,10 +152,7 @@ class CallStack(SimStatePlugin):
         :rtype: int
         """
 
-        o = 0
-        for _ in self:
-            o += 1
-        return o
+        return self._get_key().depth
 
     def __repr__(self):
         """
@@ -129,16 +170,46 @@ class CallStack(SimStatePlugin):
         if not isinstance(other, CallStack):
             return False
 
-        if self.func_addr != other.func_addr or self.stack_ptr != other.stack_ptr or self.ret_addr != other.ret_addr:
-            return False
-
-        return self.next == other.next
+        return self._get_key() is other._get_key()
 
     def __ne__(self, other):
         return not (self == other)
 
     def __hash__(self):
-        return hash(tuple((c.func_addr, c.stack_ptr, c.ret_addr) for c in self))
+        return self._get_key().hash
+
+    def _get_key(self):
+        """
+        Get the interned key of the chain of frames starting at this frame, computing it for all frames below that do
+        not have one yet.
+
+        :rtype: _FrameChainKey
+        """
+        key = self.__dict__.get('_key')
+        if key is not None:
+            return key
+
+        pending = [ ]
+        frame = self
+        while frame is not None and frame.__dict__.get('_key') is None:
+            pending.append(frame)
+            frame = frame.next
+        next_key = None if frame is None else frame._key
+
+        for frame in reversed(pending):
+            identity = (frame.func_addr, frame.stack_ptr, frame.ret_addr, next_key)
+            key = _frame_chain_keys.get(identity)
+            if key is None:
+                key = _FrameChainKey(
+                    1 if next_key is None else next_key.depth + 1,
+                    hash((frame.func_addr, frame.stack_ptr, frame.ret_addr,
+                          None if next_key is None else next_key.hash))
+                )
+                _frame_chain_keys[identity] = key
+            frame.__dict__['_key'] = key
+            next_key = key
+
+        return next_key
 
     #
     # Properties
@@ -338,16 +409,25 @@ class CallStack(SimStatePlugin):
         :rtype: tuple
         """
 
-        ret = ()
+        if context_sensitivity_level <= 0:
+            return ()
 
-        for frame in self:
-            if len(ret) >= context_sensitivity_level*2:
-                break
-            ret = (frame.call_site_addr, frame.func_addr) + ret
+        suffixes = self.__dict__.get('_suffixes')
+        if suffixes is None:
+            suffixes = self.__dict__['_suffixes'] = { }
+        else:
+            try:
+                return suffixes[context_sensitivity_level]
+            except KeyError:
+                pass
 
-        while len(ret) < context_sensitivity_level*2:
-            ret = (None, None) + ret
+        if self.next is None:
+            ret = (None, None) * (context_sensitivity_level - 1)
+        else:
+            ret = self.next.stack_suffix(context_sensitivity_level - 1)
+        ret += (self.call_site_addr, self.func_addr)
 
+        suffixes[context_sensitivity_level] = ret
         return ret
 
     #
@@ -1,3 +1,4 @@
+import array
 import operator
 import logging
 import itertools
@@ -60,6 +61,12 @@ class SimStateHistory(SimStatePlugin):
 
         self.strongref_state = None if clone is None else clone.strongref_state
 
+        # ancestry index: (parent, distance to the root, jump pointer), and the number of items per attribute in all
+        # ancestors. both are only valid while the parent stays the same, and the counts rely on ancestors not being
+        # modified once they have children (only the newest node of a chain is stepped).
+        self._index = None if clone is None else clone._index
+        self._cum_counts = { } if clone is None else dict(clone._cum_counts)
+
     def init_state(self):
         self.successor_ip = self.state._ip
 
@@ -90,9 +97,13 @@ class SimStateHistory(SimStatePlugin):
             child = parent
 
         d.pop('parent')
+        d.pop('_index', None)
+        d.pop('_cum_counts', None)
         return d
 
     def __setstate__(self, d):
+        self._index = None
+        self._cum_counts = { }
         child = self
         ancestry = list(reversed(d.pop('rev_ancestry')))
         for parent in ancestry:
@@ -366,31 +377,31 @@ class SimStateHistory(SimStatePlugin):
                 yield p
     @property
     def events(self):
-        return LambdaIterIter(self, operator.attrgetter('recent_events'))
+        return LambdaIterIter(self, operator.attrgetter('recent_events'), key='recent_events')
     @property
     def actions(self):
-        return LambdaIterIter(self, operator.attrgetter('recent_actions'))
+        return LambdaIterIter(self, operator.attrgetter('recent_actions'), key='recent_actions')
     @property
     def jumpkinds(self):
-        return LambdaAttrIter(self, operator.attrgetter('jumpkind'))
+        return LambdaAttrIter(self, operator.attrgetter('jumpkind'), key='jumpkind')
     @property
     def jump_guards(self):
-        return LambdaAttrIter(self, operator.attrgetter('jump_guard'))
+        return LambdaAttrIter(self, operator.attrgetter('jump_guard'), key='jump_guard')
     @property
     def jump_targets(self):
-        return LambdaAttrIter(self, operator.attrgetter('jump_target'))
+        return LambdaAttrIter(self, operator.attrgetter('jump_target'), key='jump_target')
     @property
     def descriptions(self):
-        return LambdaAttrIter(self, operator.attrgetter('recent_description'))
+        return LambdaAttrIter(self, operator.attrgetter('recent_description'), key='recent_description')
     @property
     def bbl_addrs(self):
-        return LambdaIterIter(self, operator.attrgetter('recent_bbl_addrs'))
+        return LambdaIterIter(self, operator.attrgetter('recent_bbl_addrs'), key='recent_bbl_addrs')
     @property
     def ins_addrs(self):
-        return LambdaIterIter(self, operator.attrgetter('recent_ins_addrs'))
+        return LambdaIterIter(self, operator.attrgetter('recent_ins_addrs'), key='recent_ins_addrs')
     @property
     def stack_actions(self):
-        return LambdaIterIter(self, operator.attrgetter('recent_stack_actions'))
+        return LambdaIterIter(self, operator.attrgetter('recent_stack_actions'), key='recent_stack_actions')
 
     #
     # Merging support
@@ -403,37 +414,22 @@ class SimStateHistory(SimStatePlugin):
         :param other:    the PathHistory to find a common ancestor with.
         :return:        the common ancestor SimStateHistory, or None if there isn't one
         """
-        our_history_iter = reversed(HistoryIter(self))
-        their_history_iter = reversed(HistoryIter(other))
-        sofar = set()
-
-        while True:
-            our_done = False
-            their_done = False
-
-            try:
-                our_next = next(our_history_iter)
-                if our_next in sofar:
-                    # we found it!
-                    return our_next
-                sofar.add(our_next)
-            except StopIteration:
-                # we ran out of items during iteration
-                our_done = True
-
-            try:
-                their_next = next(their_history_iter)
-                if their_next in sofar:
-                    # we found it!
-                    return their_next
-                sofar.add(their_next)
-            except StopIteration:
-                # we ran out of items during iteration
-                their_done = True
-
-            # if we ran out of both lists, there's no common ancestor
-            if our_done and their_done:
-                return None
+        a, b = self, other
+        depth_a, depth_b = a._get_index()[1], b._get_index()[1]
+        if depth_a > depth_b:
+            a = a._ancestor_at_depth(depth_b)
+        elif depth_b > depth_a:
+            b = b._ancestor_at_depth(depth_a)
+
+        # jump pointers of nodes at the same depth lead to the same depth, so both sides can follow them as long as
+        # they do not meet yet
+        while a is not b:
+            jump_a, jump_b = a._index[2], b._index[2]
+            if jump_a is not jump_b:
+                a, b = jump_a, jump_b
+            else:
+                a, b = a.parent, b.parent
+        return a
 
     def constraints_since(self, other):
         """
@@ -453,10 +449,109 @@ class SimStateHistory(SimStatePlugin):
     def make_child(self):
         return SimStateHistory(parent=self)
 
+    #
+    # Ancestry index
+    #
+
+    def _get_index(self):
+        """
+        Get the ancestry index entry of this history node, computing it for all ancestors that do not have one yet.
+
+        Each node has a jump pointer to one of its ancestors, chosen such that any ancestor satisfying a monotone
+        predicate can be found by following O(log n) pointers (see Myers, "An applicative random-access stack").
+
+        :return: A tuple of (parent, depth, jump pointer).
+        """
+        idx = self._index
+        if idx is not None and idx[0] is self.parent:
+            return idx
+
+        pending = [ ]
+        n = self
+        while n is not None:
+            idx = n._index
+            if idx is not None and idx[0] is n.parent:
+                break
+            pending.append(n)
+            n = n.parent
+
+        for n in reversed(pending):
+            p = n.parent
+            if p is None:
+                n._index = (None, 0, None)
+            else:
+                _, p_depth, p_jump = p._index
+                jump = p
+                if p_jump is not None:
+                    _, j_depth, j_jump = p_jump._index
+                    if j_jump is not None and p_depth - j_depth == j_depth - j_jump._index[1]:
+                        jump = j_jump
+                n._index = (p, p_depth + 1, jump)
+            n._cum_counts = { }
+
+        return self._index
+
+    def _ancestor_at_depth(self, depth):
+        """
+        Get the ancestor of this history node (or the node itself) at a given distance to the root, by following jump
+        pointers.
+
+        :param int depth:   The distance to the root.
+        :return:            The ancestor, or None if this node is not that deep.
+        """
+        _, d, jump = self._get_index()
+        if not 0 <= depth <= d:
+            return None
+
+        n = self
+        while d > depth:
+            if jump is not None and jump._index[1] >= depth:
+                n = jump
+            else:
+                n = n.parent
+            _, d, jump = n._index
+        return n
+
+    def _cumulative_count(self, key, count_func):
+        """
+        Get the number of items of a given kind that all ancestors of this node have together. The counts are cached in
+        each node, so the items of a node must not change after children were made from it.
+
+        :param str key:         The name of the kind of items.
+        :param count_func:      A function returning the number of items that a single history node has.
+        :return:                The number of items.
+        :rtype:                 int
+        """
+        self._get_index()
+        try:
+            return self._cum_counts[key]
+        except KeyError:
+            pass
+
+        pending = [ ]
+        n = self
+        while n is not None and key not in n._cum_counts:
+            pending.append(n)
+            n = n.parent
+
+        for n in reversed(pending):
+            p = n.parent
+            n._cum_counts[key] = 0 if p is None else p._cum_counts[key] + count_func(p)
+
+        return self._cum_counts[key]
+
 class TreeIter(object):
-    def __init__(self, start, end=None):
+    """
+    Iterates over a per-node attribute of a chain of history nodes, from the oldest to the newest node.
+
+    Iterators that are given a `key` cache the number of items in each history node's ancestry, which makes
+    `len()` and indexing take O(log n) time instead of walking the entire chain.
+    """
+
+    def __init__(self, start, end=None, key=None):
         self._start = start
         self._end = end
+        self._key = key
 
     def _iter_nodes(self):
         n = self._start
@@ -464,33 +559,99 @@ class TreeIter(object):
             yield n
             n = n.parent
 
+    def _node_items(self, n):
+        """
+        Get the items of history node `n`, in chronological order.
+        """
+        raise NotImplementedError()
+
+    def _node_count(self, n):
+        return len(self._node_items(n))
+
+    @property
+    def _indexed(self):
+        return self._key is not None and self._end is None and self._start is not None
+
     def __iter__(self):
         for i in self.hardcopy:
             yield i
 
     def __reversed__(self):
-        raise NotImplementedError("Why are you using this class")
+        for n in self._iter_nodes():
+            for item in reversed(self._node_items(n)):
+                yield item
 
     @property
     def hardcopy(self):
-        # lmao
-        return list(reversed(tuple(reversed(self))))
+        result = [ ]
+        for n in reversed(list(self._iter_nodes())):
+            result.extend(self._node_items(n))
+        return result
 
     def __len__(self):
-        # TODO: this is wrong
-        return self._start.depth
+        if self._indexed:
+            return self._start._cumulative_count(self._key, self._node_count) + self._node_count(self._start)
+        return sum(self._node_count(n) for n in self._iter_nodes())
+
+    def _find_node(self, i):
+        """
+        Find the history node holding the item at index `i`, by following jump pointers.
+
+        :return: A tuple of the node and the index of its first item.
+        """
+        n = self._start
+        cum = n._cumulative_count(self._key, self._node_count)
+        while cum > i:
+            _, _, jump = n._get_index()
+            if jump is not None:
+                jump_cum = jump._cumulative_count(self._key, self._node_count)
+                if jump_cum > i:
+                    n, cum = jump, jump_cum
+                    continue
+            n = n.parent
+            cum = n._cumulative_count(self._key, self._node_count)
+        return n, cum
 
     def __getitem__(self, k):
         if isinstance(k, slice):
             raise ValueError("Please use .hardcopy to use slices")
-        if k >= 0:
-            raise ValueError("Please use .hardcopy to use nonnegative indexes")
-        i = 0
-        for item in reversed(self):
-            i -= 1
-            if i == k:
-                return item
-        raise IndexError(k)
+
+        if not self._indexed:
+            if k >= 0:
+                raise ValueError("Please use .hardcopy to use nonnegative indexes")
+            i = 0
+            for item in reversed(self):
+                i -= 1
+                if i == k:
+                    return item
+            raise IndexError(k)
+
+        # fast path for the most recent items
+        if k < 0:
+            items = self._node_items(self._start)
+            if -k <= len(items):
+                return items[k]
+
+        length = len(self)
+        i = k + length if k < 0 else k
+        if not 0 <= i < length:
+            raise IndexError(k)
+
+        n, cum = self._find_node(i)
+        return self._node_items(n)[i - cum]
+
+    def to_array(self, typecode='Q'):
+        """
+        Export all items at once as a compact array, e.g. to wrap it with `numpy.frombuffer()`.
+
+        :param str typecode:    The type code of the array.
+        :return:                An array of all items in chronological order.
+        :rtype:                 array.array
+        """
+        result = array.array(typecode)
+        for n in reversed(list(self._iter_nodes())):
+            result.extend(self._node_items(n))
+        return result
 
     def count(self, v):
         """
@@ -508,6 +669,15 @@ class TreeIter(object):
 
 
 class HistoryIter(TreeIter):
+    def __init__(self, start, end=None, key='history'):
+        TreeIter.__init__(self, start, end=end, key=key)
+
+    def _node_items(self, n):
+        return (n, )
+
+    def _node_count(self, n):
+        return 1
+
     def __reversed__(self):
         for hist in self._iter_nodes():
             yield hist
@@ -518,6 +688,10 @@ class LambdaAttrIter(TreeIter):
         TreeIter.__init__(self, start, **kwargs)
         self._f = f
 
+    def _node_items(self, n):
+        a = self._f(n)
+        return () if a is None else (a, )
+
     def __reversed__(self):
         for hist in self._iter_nodes():
             a = self._f(hist)
@@ -531,6 +705,13 @@ class LambdaIterIter(LambdaAttrIter):
         self._f = f
         self._reverse = reverse
 
+    def _node_items(self, n):
+        items = self._f(n)
+        return items if self._reverse else list(reversed(items))
+
+    def _node_count(self, n):
+        return len(self._f(n))
+
     def __reversed__(self):
         for hist in self._iter_nodes():
             for a in reversed(self._f(hist)) if self._reverse else self._f(hist):
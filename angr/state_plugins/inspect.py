@@ -32,6 +32,9 @@ event_types = {
     'memory_page_map',
 }
 
+# every event type gets one bit in the armed-event mask of SimInspector (and SimState)
+event_bits = { t: 1 << i for i, t in enumerate(sorted(event_types)) }
+
 inspect_attributes = {
     # mem_read
     'mem_read_address',
@@ -243,6 +246,11 @@ class SimInspector(SimStatePlugin):
         for t in event_types:
             self._breakpoints[t] = [ ]
 
+        # a bitmask of the event types that have at least one breakpoint, see `event_bits`
+        self._armed = 0
+        # (event_type, when) -> a tuple of the breakpoints that could fire at that point
+        self._dispatch = { }
+
         for i in inspect_attributes:
             setattr(self, i, None)
 
@@ -262,7 +270,16 @@ class SimInspector(SimStatePlugin):
             l.debug("... setting %s", k)
             setattr(self, k, v)
 
-        for bp in self._breakpoints[event_type]:
+        if not self._armed & event_bits[event_type]:
+            return
+
+        try:
+            bps = self._dispatch[(event_type, when)]
+        except KeyError:
+            bps = tuple(bp for bp in self._breakpoints[event_type] if bp.when == when or bp.when == BP_BOTH)
+            self._dispatch[(event_type, when)] = bps
+
+        for bp in bps:
             l.debug("... checking bp %r", bp)
             if bp.check(self.state, when):
                 l.debug("... FIRE")
@@ -294,6 +311,7 @@ class SimInspector(SimStatePlugin):
                                                                                         ", ".join(event_types))
                              )
         self._breakpoints[event_type].append(bp)
+        self._update_armed(event_type)
 
     def remove_breakpoint(self, event_type, bp=None, filter_func=None):
         """
@@ -314,6 +332,35 @@ class SimInspector(SimStatePlugin):
         except ValueError:
             # the breakpoint is not found
             l.error('remove_breakpoint(): Breakpoint %s (type %s) is not found.', bp, event_type)
+        self._update_armed(event_type)
+
+    def is_armed(self, event_type):
+        """
+        Check whether any breakpoint is registered for an event type. Events of types that are not armed do not need to
+        be reported to the inspector at all.
+
+        :param str event_type:  The event type.
+        :return:                True if there is at least one breakpoint for `event_type`.
+        :rtype:                 bool
+        """
+        return bool(self._armed & event_bits[event_type])
+
+    def _update_armed(self, event_type):
+        """
+        Recompute the armed bit of an event type, and drop its compiled breakpoint dispatch.
+
+        :param str event_type:  The event type whose breakpoints were changed.
+        """
+        if self._breakpoints[event_type]:
+            self._armed |= event_bits[event_type]
+        else:
+            self._armed &= ~event_bits[event_type]
+        self._dispatch.pop((event_type, BP_BEFORE), None)
+        self._dispatch.pop((event_type, BP_AFTER), None)
+
+        # the engines check the armed mask on the state itself, so that unarmed events cost a single bitwise and
+        if self.state is not None:
+            self.state._inspect_armed_events = self._armed
 
     @SimStatePlugin.memo
     def copy(self, memo): # pylint: disable=unused-argument
@@ -323,6 +370,7 @@ class SimInspector(SimStatePlugin):
 
         for t,a in self._breakpoints.items():
             c._breakpoints[t].extend(a)
+        c._armed = self._armed
         return c
 
     def downsize(self):
@@ -350,6 +398,7 @@ class SimInspector(SimStatePlugin):
                     if id(b) not in seen:
                         self._breakpoints[t].append(b)
                         seen.add(id(b))
+            self._update_armed(t)
         return False
 
     def merge(self, others, merge_conditions, common_ancestor=None): # pylint: disable=unused-argument
@@ -361,6 +410,7 @@ class SimInspector(SimStatePlugin):
     def set_state(self, state):
         super().set_state(state)
         state.supports_inspect = True
+        state._inspect_armed_events = self._armed
 
 
 from angr.sim_state import SimState
@@ -90,7 +90,9 @@ class SimStateScratch(SimStatePlugin):
         :param simplify: simplify the tmp before returning it
         :returns: a Claripy expression of the tmp
         """
-        self.state._inspect('tmp_read', BP_BEFORE, tmp_read_num=tmp)
+        _inspect = self.state._inspect_armed('tmp_read')
+        if _inspect:
+            self.state._inspect('tmp_read', BP_BEFORE, tmp_read_num=tmp)
         try:
             v = self.temps[tmp]
             if v is None:
@@ -98,7 +100,8 @@ class SimStateScratch(SimStatePlugin):
                                     'slicing.' % tmp)
         except IndexError:
             raise SimValueError("Accessing a temp that is illegal in this tyenv")
-        self.state._inspect('tmp_read', BP_AFTER, tmp_read_expr=v)
+        if _inspect:
+            self.state._inspect('tmp_read', BP_AFTER, tmp_read_expr=v)
         return v
 
     def store_tmp(self, tmp, content, reg_deps=None, tmp_deps=None, deps=None, **kwargs):
@@ -111,9 +114,11 @@ class SimStateScratch(SimStatePlugin):
         :param reg_deps: the register dependencies of the content
         :param tmp_deps: the temporary value dependencies of the content
         """
-        self.state._inspect('tmp_write', BP_BEFORE, tmp_write_num=tmp, tmp_write_expr=content)
-        tmp = self.state._inspect_getattr('tmp_write_num', tmp)
-        content = self.state._inspect_getattr('tmp_write_expr', content)
+        _inspect = self.state._inspect_armed('tmp_write')
+        if _inspect:
+            self.state._inspect('tmp_write', BP_BEFORE, tmp_write_num=tmp, tmp_write_expr=content)
+            tmp = self.state._inspect_getattr('tmp_write_num', tmp)
+            content = self.state._inspect_getattr('tmp_write_expr', content)
 
         if o.SYMBOLIC_TEMPS not in self.state.options:
             # Non-symbolic
@@ -128,7 +133,8 @@ class SimStateScratch(SimStatePlugin):
             r = SimActionData(self.state, SimActionData.TMP, SimActionData.WRITE, tmp=tmp, data=data_ao, size=content.length)
             self.state.history.add_action(r)
 
-        self.state._inspect('tmp_write', BP_AFTER)
+        if _inspect:
+            self.state._inspect('tmp_write', BP_AFTER)
 
     @SimStatePlugin.memo
     def copy(self, memo): # pylint: disable=unused-argument
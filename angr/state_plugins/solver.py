@@ -2,6 +2,7 @@ import binascii
 import functools
 import time
 import logging
+from collections import defaultdict
 
 from claripy import backend_manager
 
@@ -17,6 +18,8 @@ l = logging.getLogger(name=__name__)
 #
 
 _timing_enabled = False
+# function name -> [number of calls, total seconds]
+_timing_counters = defaultdict(lambda: [0, 0.])
 
 lt = logging.getLogger("angr.state_plugins.solver_timing")
 def timed_function(f):
@@ -32,6 +35,10 @@ def timed_function(f):
             end = time.time()
             duration = end-start
 
+            counter = _timing_counters[f.__name__]
+            counter[0] += 1
+            counter[1] += duration
+
             try:
                 if s.scratch.sim_procedure is None and s.scratch.bbl_addr is not None:
                     location = "bbl %#x, stmt %s (inst %s)" % (
@@ -68,6 +75,21 @@ def disable_timing():
     global _timing_enabled
     _timing_enabled = False
 
+
+def get_timing_counters():
+    """
+    Get the number of calls and the total time spent in each timed solver function. Timing must be enabled before
+    angr is imported, e.g. with the SOLVER_TIMING environment variable.
+
+    :return:    A dict mapping function names to tuples of (number of calls, total seconds).
+    :rtype:     dict
+    """
+    return { name: tuple(counter) for name, counter in _timing_counters.items() }
+
+
+def reset_timing_counters():
+    _timing_counters.clear()
+
 import os
 if os.environ.get('SOLVER_TIMING', False):
     enable_timing()
@@ -465,6 +487,43 @@ class SimSolver(SimStatePlugin):
         else:
             return constraints.__class__((self._adjust_constraint(self.And(*constraints)),))
 
+    @property
+    def _result_cache(self):
+        """
+        The project-wide solver result cache, or None if it is not enabled.
+        """
+        project = self.state.project
+        return getattr(project, 'solver_cache', None) if project is not None else None
+
+    def _cached_query(self, query, compute, extra_constraints, exact, *args):
+        """
+        Answer a query from the project-wide solver result cache if possible. Otherwise, compute the result by calling
+        `compute` and cache it.
+
+        :param str query:           The kind of the query.
+        :param compute:             A function that computes the result.
+        :param extra_constraints:   The (adjusted) extra constraints of the query.
+        :param exact:               If False, the query is approximate, and it is never cached.
+        :param args:                Everything else that the result depends on.
+        :return:                    The result.
+
+        Results are only shared between states whose claripy frontends are of the same type, since e.g. SolverVSA
+        over-approximates. SolverReplacement answers depend on replacements that are not part of the constraints, so
+        they are never cached. Note that the key fingerprints all the constraints of the state, which takes time linear
+        in their number on every query, whether it hits or not.
+        """
+        cache = self._result_cache
+        if cache is None or exact is False or isinstance(self._solver, claripy.SolverReplacement):
+            return compute()
+
+        key = cache.make_key(self._solver.constraints, query, type(self._solver), cache.fingerprint(extra_constraints),
+                             *args)
+        found, r = cache.lookup(key)
+        if not found:
+            r = compute()
+            cache.store(key, r)
+        return r
+
     @timed_function
     @ast_stripping_decorator
     @error_converter
@@ -496,7 +555,26 @@ class SimSolver(SimStatePlugin):
         :return: a tuple of the solutions, in the form of Python primitives
         :rtype: tuple
         """
-        return self._solver.eval(e, n, extra_constraints=self._adjust_constraint_list(extra_constraints), exact=exact)
+        extra_constraints = self._adjust_constraint_list(extra_constraints)
+        return self._cached_query('eval', lambda: self._solver.eval(e, n, extra_constraints=extra_constraints, exact=exact),
+                                  extra_constraints, exact, hash(e), n)
+
+    @timed_function
+    @ast_stripping_decorator
+    @error_converter
+    def _batch_eval(self, exprs, n, extra_constraints=(), exact=None):
+        """
+        Evaluate several expressions together, using the solver. Returns primitives.
+
+        :param exprs: the expressions
+        :param n: the number of desired solutions
+        :param extra_constraints: extra constraints to apply to the solver
+        :param exact: if False, returns approximate solutions
+        :return: a list of the solutions, each of which is a tuple with one value per expression
+        :rtype: list
+        """
+        return self._solver.batch_eval(exprs, n, extra_constraints=self._adjust_constraint_list(extra_constraints),
+                                       exact=exact)
 
     @concrete_path_scalar
     @timed_function
@@ -516,7 +594,9 @@ class SimSolver(SimStatePlugin):
             er = self._solver.max(e, extra_constraints=self._adjust_constraint_list(extra_constraints))
             assert er <= ar
             return ar
-        return self._solver.max(e, extra_constraints=self._adjust_constraint_list(extra_constraints), exact=exact)
+        extra_constraints = self._adjust_constraint_list(extra_constraints)
+        return self._cached_query('max', lambda: self._solver.max(e, extra_constraints=extra_constraints, exact=exact),
+                                  extra_constraints, exact, hash(e))
 
     @concrete_path_scalar
     @timed_function
@@ -536,7 +616,9 @@ class SimSolver(SimStatePlugin):
             er = self._solver.min(e, extra_constraints=self._adjust_constraint_list(extra_constraints))
             assert ar <= er
             return ar
-        return self._solver.min(e, extra_constraints=self._adjust_constraint_list(extra_constraints), exact=exact)
+        extra_constraints = self._adjust_constraint_list(extra_constraints)
+        return self._cached_query('min', lambda: self._solver.min(e, extra_constraints=extra_constraints, exact=exact),
+                                  extra_constraints, exact, hash(e))
 
     @timed_function
     @ast_stripping_decorator
@@ -637,7 +719,36 @@ class SimSolver(SimStatePlugin):
             if er is True:
                 assert ar is True
             return ar
-        return self._solver.satisfiable(extra_constraints=self._adjust_constraint_list(extra_constraints), exact=exact)
+        extra_constraints = self._adjust_constraint_list(extra_constraints)
+        return self._cached_query('satisfiable',
+                                  lambda: self._solver.satisfiable(extra_constraints=extra_constraints, exact=exact),
+                                  extra_constraints, exact)
+
+    @timed_function
+    @ast_stripping_decorator
+    @error_converter
+    def satisfiable_many(self, extra_constraints_list, exact=None):
+        """
+        Check if the constraints of the state are satisfiable together with each of several sets of extra constraints.
+        All checks share the same solver, and its cached models are reused between them.
+
+        :param extra_constraints_list:  A list of extra constraints for each check. Each item is either a single
+                                        constraint (an AST) or a collection of constraints.
+        :param exact:                   If False, return approximate solutions.
+        :return:                        A list of booleans, True for each set of extra constraints that is sat.
+        :rtype:                         list
+        """
+        extra_constraints_list = [ (extra,) if isinstance(extra, (claripy.ast.Base, bool)) else tuple(extra)
+                                   for extra in extra_constraints_list ]
+        if not extra_constraints_list:
+            return [ ]
+
+        # if the state itself is unsat, so is every check
+        if not self._solver.satisfiable(extra_constraints=self._adjust_constraint_list(()), exact=exact):
+            return [ False ] * len(extra_constraints_list)
+
+        return [ self._solver.satisfiable(extra_constraints=self._adjust_constraint_list(extra), exact=exact)
+                 for extra in extra_constraints_list ]
 
     @timed_function
     @ast_stripping_decorator
@@ -723,6 +834,32 @@ class SimSolver(SimStatePlugin):
         # eval_upto already throws the UnsatError, no reason for us to worry about it
         return self.eval_upto(e, 1, **kwargs)[0]
 
+    def eval_many(self, exprs, cast_to=None, **kwargs):
+        """
+        Evaluate several expressions with a single solver query. The values come from the same solution, so they are
+        consistent with each other.
+
+        :param exprs: the expressions to get a solution for
+        :param cast_to: A type to cast the resulting values to
+        :param extra_constraints: extra constraints to apply to the solver
+        :param exact: if False, returns approximate solutions
+        :raise SimUnsatError: if no solution could be found satisfying the given constraints
+        :return: a list with one value for each expression
+        :rtype: list
+        """
+        exprs = list(exprs)
+        values = [ _concrete_value(e) for e in exprs ]
+
+        symbolic_indices = [ i for i, v in enumerate(values) if v is None ]
+        if symbolic_indices:
+            solutions = self._batch_eval([ exprs[i] for i in symbolic_indices ], 1, **kwargs)
+            if not solutions:
+                raise SimUnsatError('Not satisfiable: expected a solution for %d expressions' % len(symbolic_indices))
+            for i, v in zip(symbolic_indices, solutions[0]):
+                values[i] = v
+
+        return [ self._cast_to(e, v, cast_to) for e, v in zip(exprs, values) ]
+
     def eval_one(self, e, **kwargs):
         """
         Evaluate an expression to get the only possible solution. Errors if either no or more than one solution is
@@ -0,0 +1,111 @@
+from cachetools import LRUCache
+
+
+class SolverResultCache:
+    """
+    A bounded cache of solver results that is shared by all states of a project.
+
+    Sibling states produced by branching share most of their constraints, and they tend to ask the solver the same
+    questions over and over again (is this successor satisfiable, what is the maximum of this length, etc.). Every state
+    owns its own claripy solver though, so whatever one of them learns is lost to the others. This cache remembers the
+    answers across states: results are keyed by a fingerprint of the full constraint set of the asking state, together
+    with the query itself, so that any state with the very same constraints can reuse them. Computing the fingerprint
+    takes time linear in the number of constraints.
+
+    Only exact queries are cached. The least recently used results are evicted once `max_size` entries are stored.
+    """
+
+    def __init__(self, max_size=100000):
+        """
+        :param int max_size:    The maximum number of results to keep.
+        """
+        self.max_size = max_size
+        self._cache = LRUCache(maxsize=max_size)
+
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # the cached results are only valid within a single process, since they are keyed by AST hashes
+        return { 'max_size': self.max_size }
+
+    def __setstate__(self, s):
+        self.__init__(max_size=s['max_size'])
+
+    def __repr__(self):
+        return "<SolverResultCache %d/%d entries, hit rate %.2f>" % (len(self._cache), self.max_size, self.hit_rate)
+
+    def __len__(self):
+        return len(self._cache)
+
+    @staticmethod
+    def fingerprint(constraints):
+        """
+        Generate the fingerprint of a set of constraints. The order of the constraints does not matter.
+
+        :param constraints: An iterable of constraints (claripy ASTs).
+        :return:            The fingerprint.
+        :rtype:             frozenset
+        """
+        return frozenset(hash(c) for c in constraints)
+
+    def make_key(self, constraints, query, *args):
+        """
+        Generate the cache key of a query.
+
+        :param constraints: The constraints of the state that asks the query.
+        :param str query:   The kind of the query (e.g. "satisfiable" or "max").
+        :param args:        Everything else that the result depends on. Collections of constraints should be passed
+                            as fingerprints.
+        :return:            The key.
+        """
+        return (self.fingerprint(constraints), query) + args
+
+    def lookup(self, key):
+        """
+        Look up the result of a query.
+
+        :param key: The key of the query, as returned by `make_key`.
+        :return:    A tuple of (whether the result was found, the result).
+        :rtype:     tuple
+        """
+        try:
+            r = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, r
+
+    def store(self, key, result):
+        """
+        Store the result of a query.
+
+        :param key:     The key of the query, as returned by `make_key`.
+        :param result:  The result.
+        """
+        self._cache[key] = result
+
+    @property
+    def hit_rate(self):
+        """
+        The fraction of lookups that were answered from the cache.
+
+        :rtype: float
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.
+
+    def reset_stats(self):
+        """
+        Reset the hit and miss counters.
+        """
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """
+        Drop all cached results, and reset the hit and miss counters.
+        """
+        self._cache.clear()
+        self.reset_stats()
@@ -803,6 +803,12 @@ class Unicorn(SimStatePlugin):
             # give up
             raise MixedPermissonsError()
 
+        if perm & 1 or options.STRICT_PAGE_ACCESS not in self.state.options:
+            data = self._load_unchanged_pages(start, length)
+            if data is not None:
+                # nobody has touched these pages since they were loaded, no need to look at the state memory at all
+                return self._map_pages(uc, access, start, length, perm, data, None)
+
         try:
             ret_on_segv = True if best_effort_read else False
             items = self.state.memory.mem.load_objects(start, length, ret_on_segv=ret_on_segv)
@@ -856,20 +862,55 @@ class Unicorn(SimStatePlugin):
             #print "MISSING START: %x, %d" % (start, last_missing - start + 1)
             _missing(start, last_missing - start + 1)
 
-        # do the mapping
-        l.info('mmap [%#x, %#x], %d%s (because %d)', start, start + length - 1, perm, ' (symbolic)' if taint else '', access)
-        if not taint and not perm & 2:
+        return self._map_pages(uc, access, start, length, perm, bytes(data), taint[0] if taint else None)
+
+    def _load_unchanged_pages(self, start, length):
+        """
+        Load a memory range from the project-wide page cache, provided that all its pages still hold exactly what was
+        loaded from the memory backer.
+
+        :param int start:   The start address.
+        :param int length:  The length of the range.
+        :return:            The content of the range, or None if it has to be loaded from the state memory.
+        :rtype:             bytes
+        """
+        project = self.state.project
+        cache = getattr(project, 'unicorn_page_cache', None) if project is not None else None
+        if cache is None or self.state.arch.byte_width != 8:
+            return None
+
+        mem = self.state.memory.mem
+        if getattr(mem, '_memory_backer', None) is not cache.backer or not mem.unchanged_from_backer(start, length):
+            return None
+        return cache.load(start, length)
+
+    def _map_pages(self, uc, access, start, length, perm, data, taint):
+        """
+        Map a memory range into unicorn.
+
+        :param uc:          The unicorn object.
+        :param int access:  The kind of the access that triggered the mapping.
+        :param int start:   The start address.
+        :param int length:  The length of the range.
+        :param int perm:    The permissions of the range.
+        :param bytes data:  The content of the range.
+        :param taint:       A ctypes buffer marking the symbolic bytes of the range, or None if all bytes are concrete.
+        :return:            True if the range was mapped successfully.
+        :rtype:             bool
+        """
+        l.info('mmap [%#x, %#x], %d%s (because %d)', start, start + length - 1, perm, ' (symbolic)' if taint is not None else '', access)
+        if taint is None and not perm & 2:
             # page is non-writable, handle it with native code
             l.debug('caching non-writable page')
-            out = _UC_NATIVE.cache_page(self._uc_state, start, length, bytes(data), perm)
+            out = _UC_NATIVE.cache_page(self._uc_state, start, length, data, perm)
             return out
         else:
             # if the memory range has already been mapped, or it somehow fails sanity checks, mem_map() may fail with
             # a unicorn.UcError raised. THe exception will be caught outside.
             uc.mem_map(start, length, perm)
-            uc.mem_write(start, bytes(data))
+            uc.mem_write(start, data)
             self._mapped += 1
-            _UC_NATIVE.activate(self._uc_state, start, length, taint[0] if taint else None)
+            _UC_NATIVE.activate(self._uc_state, start, length, taint)
             return True
 
     def uncache_region(self, addr, length):
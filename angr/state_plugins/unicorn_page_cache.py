@@ -0,0 +1,123 @@
+class UnicornPageCache:
+    """
+    A read-only cache of the pages of a cle.Clemory memory backer, shared by all states of a project.
+
+    Whenever a state enters Unicorn, every page that Unicorn touches has to be copied out of the state memory. For pages
+    that still hold exactly what the loader put there (which is the case for most code and read-only data), the result
+    is the same for all states, so it is computed only once and kept here. Pages are content-addressed: identical pages
+    (e.g. zero-filled ones) share a single bytes object.
+
+    The cache must only be consulted for pages that were not changed since they were loaded from the memory backer (see
+    SimPagedMemory.unchanged_from_backer()), and not at all when the backer reads from a concrete target. It does not
+    notice writes to the backer itself: after patching the loaded binaries (e.g. with ``project.loader.memory.store()``),
+    invalidate() has to be called for the patched range, or Unicorn will keep mapping the old content.
+    """
+
+    def __init__(self, backer, page_size=0x1000):
+        """
+        :param cle.Clemory backer:  The memory backer whose pages are cached.
+        :param int page_size:       The size of a page.
+        """
+        self.backer = backer
+        self.page_size = page_size
+
+        # page number -> page content, or None if the backer does not cover the whole page
+        self._pages = { }
+        # page content -> page content
+        self._contents = { }
+
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # the pages are cheap to load again
+        return { 'backer': self.backer, 'page_size': self.page_size }
+
+    def __setstate__(self, s):
+        self.__init__(s['backer'], page_size=s['page_size'])
+
+    def __repr__(self):
+        return "<UnicornPageCache %d pages, %d distinct>" % (len(self._pages), len(self._contents))
+
+    def __len__(self):
+        return len(self._pages)
+
+    def invalidate(self, addr=None, length=None):
+        """
+        Drop cached pages, so that they are copied out of the backer again the next time they are loaded.
+
+        :param int addr:    The start address of the range that changed, or None to drop every page.
+        :param int length:  The length of the range that changed.
+        """
+        if addr is None:
+            self._pages.clear()
+            self._contents.clear()
+            return
+
+        first = addr // self.page_size
+        last = (addr + max(length, 1) - 1) // self.page_size
+        for n in range(first, last + 1):
+            self._pages.pop(n, None)
+
+    def load(self, addr, length):
+        """
+        Load a range of memory from the backer.
+
+        :param int addr:    The start address.
+        :param int length:  The number of bytes to load.
+        :return:            The content of the range, or None if the backer does not cover all the pages touching it.
+        :rtype:             bytes
+        """
+        if self.backer.is_concrete_target_set():
+            return None
+
+        first = addr // self.page_size
+        last = (addr + length - 1) // self.page_size
+
+        chunks = [ ]
+        for n in range(first, last + 1):
+            try:
+                content = self._pages[n]
+                self.hits += 1
+            except KeyError:
+                content = self._pages[n] = self._load_page(n)
+                self.misses += 1
+            if content is None:
+                return None
+            chunks.append(content)
+
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        offset = addr - first * self.page_size
+        if offset == 0 and len(data) == length:
+            return data
+        return data[offset:offset + length]
+
+    def _load_page(self, n):
+        """
+        Copy a page out of the backer.
+
+        :param int n:   The page number.
+        :return:        The content of the page, or None if the backer does not cover the whole page.
+        :rtype:         bytes
+        """
+        page_addr = n * self.page_size
+        page_end = page_addr + self.page_size
+
+        data = bytearray(self.page_size)
+        covered = 0
+        for backer_addr, backer in self.backer.backers(page_addr):
+            if backer_addr >= page_end:
+                break
+
+            start = max(page_addr, backer_addr)
+            end = min(page_end, backer_addr + len(backer))
+            if end <= start:
+                continue
+            data[start - page_addr:end - page_addr] = memoryview(backer)[start - backer_addr:end - backer_addr]
+            covered += end - start
+
+        if covered != self.page_size:
+            return None
+
+        content = bytes(data)
+        return self._contents.setdefault(content, content)
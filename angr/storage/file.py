@@ -154,7 +154,15 @@ class SimFile(SimFileBase, SimSymbolicMemory):
                         choose how to handle variable-length operations like fgets.
 
     :ivar has_end:      Whether this file has an EOF
+
+    Concrete content given as a bytestring is not stored in memory right away. It is kept as a flat concrete backing
+    instead, and reads that only touch untouched parts of it are served as direct slices of the backing. A chunk of the
+    backing is only moved into memory (symbolized) once it is written to, or when it has to be merged.
     """
+
+    # the granularity at which the concrete backing is moved into memory
+    _concrete_chunk_size = 0x1000
+
     def __init__(self, name, content=None, size=None, has_end=None, seekable=True, writable=True, ident=None, concrete=None, **kwargs):
         kwargs['memory_id'] = kwargs.get('memory_id', 'file')
         super(SimFile, self).__init__(name, writable=writable, ident=ident, **kwargs)
@@ -162,14 +170,20 @@ class SimFile(SimFileBase, SimSymbolicMemory):
         self.has_end = has_end
         self.seekable = seekable
 
+        # the concrete backing, and the numbers of the chunks of it that have been moved into memory
+        self._concrete_content = None
+        self._symbolized_chunks = set()
+
         # this is hacky because we need to work around not having a state yet
         content = _deps_unpack(content)[0]
         if type(content) is bytes:
             if concrete is None: concrete = True
-            content = claripy.BVV(content)
+            self._concrete_content = content
+            content = None
         elif type(content) is str:
             if concrete is None: concrete = True
-            content = claripy.BVV(content.encode())
+            self._concrete_content = content.encode()
+            content = None
         elif content is None:
             pass
         elif isinstance(content, claripy.Bits):
@@ -182,7 +196,10 @@ class SimFile(SimFileBase, SimSymbolicMemory):
             concrete = False
         self.concrete = concrete
 
-        if content is not None:
+        if self._concrete_content is not None:
+            if self._size is None:
+                self._size = len(self._concrete_content)
+        elif content is not None:
             mo = SimMemoryObject(content, 0, length=len(content)//8)
             self.mem.store_memory_object(mo)
 
@@ -212,6 +229,79 @@ class SimFile(SimFileBase, SimSymbolicMemory):
     def size(self):
         return self._size
 
+    #
+    # Concrete backing
+    #
+
+    def _symbolize(self, start, end):
+        """
+        Move the chunks of the concrete backing that overlap with [start, end) into memory, so that they can be written
+        to or merged like any other memory content.
+        """
+        if self._concrete_content is None:
+            return
+
+        start = max(start, 0)
+        end = min(end, len(self._concrete_content))
+        if end <= start:
+            return
+        for n in range(start // self._concrete_chunk_size, (end - 1) // self._concrete_chunk_size + 1):
+            self._symbolize_chunk(n)
+
+    def _symbolize_chunk(self, n):
+        if n in self._symbolized_chunks:
+            return
+        self._symbolized_chunks.add(n)
+
+        chunk_start = n * self._concrete_chunk_size
+        data = self._concrete_content[chunk_start:chunk_start + self._concrete_chunk_size]
+        if self.state.arch.byte_width == 8:
+            mo = SimMemoryObject(data, chunk_start)
+        else:
+            mo = SimMemoryObject(claripy.BVV(data), chunk_start, length=len(data), byte_width=self.state.arch.byte_width)
+        self.mem.store_memory_object(mo)
+
+    def _symbolize_access(self, addr, size):
+        """
+        Move the part of the concrete backing that may be touched by an access into memory. If the address is
+        symbolic, this is the whole backing. If the size is symbolic or unknown, this is everything after the address.
+        """
+        if self._concrete_content is None:
+            return
+
+        addr, size = _deps_unpack(addr)[0], _deps_unpack(size)[0]
+        if self.state.solver.symbolic(addr):
+            start = 0
+        else:
+            start = self.state.solver.eval(addr)
+        if size is None or self.state.solver.symbolic(size) or self.state.solver.symbolic(addr):
+            end = len(self._concrete_content)
+        else:
+            end = start + self.state.solver.eval(size)
+        self._symbolize(start, end)
+
+    def _read_from(self, addr, num_bytes, inspect=True, events=True, ret_on_segv=False):
+        content = self._concrete_content
+        if content is not None and num_bytes > 0:
+            end = addr + num_bytes
+            if 0 <= addr and end <= len(content) and self.state.arch.byte_width == 8 and \
+                    not any(n in self._symbolized_chunks
+                            for n in range(addr // self._concrete_chunk_size,
+                                           (end - 1) // self._concrete_chunk_size + 1)):
+                # the fast path: the read only covers untouched concrete data
+                return claripy.BVV(bytes(memoryview(content)[addr:end]))
+            self._symbolize(addr, end)
+
+        return super(SimFile, self)._read_from(addr, num_bytes, inspect=inspect, events=events, ret_on_segv=ret_on_segv)
+
+    def _store(self, req):
+        if self._concrete_content is not None:
+            size = req.size
+            if size is None and isinstance(req.data, claripy.ast.Base):
+                size = req.data.length // self.state.arch.byte_width
+            self._symbolize_access(req.addr, size)
+        return super(SimFile, self)._store(req)
+
     def concretize(self, **kwargs):
         """
         Return a concretization of the contents of the file, as a flat bytestring.
@@ -284,7 +374,7 @@ class SimFile(SimFileBase, SimSymbolicMemory):
     @SimStatePlugin.memo
     def copy(self, _):
         #l.debug("Copying %d bytes of memory with id %s." % (len(self.mem), self.id))
-        return type(self)(name=self.name, size=self._size, has_end=self.has_end, seekable=self.seekable, writable=self.writable, ident=self.ident, concrete=self.concrete,
+        c = type(self)(name=self.name, size=self._size, has_end=self.has_end, seekable=self.seekable, writable=self.writable, ident=self.ident, concrete=self.concrete,
             mem=self.mem.branch(),
             memory_id=self.id,
             endness=self.endness,
@@ -294,6 +384,9 @@ class SimFile(SimFileBase, SimSymbolicMemory):
             stack_region_map=self._stack_region_map,
             generic_region_map=self._generic_region_map
         )
+        c._concrete_content = self._concrete_content
+        c._symbolized_chunks = set(self._symbolized_chunks)
+        return c
 
     def merge(self, others, merge_conditions, common_ancestor=None): # pylint: disable=unused-argument
         if not all(type(o) is type(self) for o in others):
@@ -302,6 +395,19 @@ class SimFile(SimFileBase, SimSymbolicMemory):
         if any(o.has_end != self.has_end for o in others):
             raise SimMergeError("Cannot merge files where some have ends and some don't")
 
+        # the memory contents are compared byte by byte, so make sure that all files have the same parts of their
+        # concrete backings in memory
+        if any(o._concrete_content is not self._concrete_content for o in others):
+            for f in [ self ] + others:
+                f._symbolize(0, len(f._concrete_content or b''))
+        else:
+            symbolized_chunks = set(self._symbolized_chunks)
+            for o in others:
+                symbolized_chunks |= o._symbolized_chunks
+            for f in [ self ] + others:
+                for n in symbolized_chunks:
+                    f._symbolize_chunk(n)
+
         self._size = self.state.solver.ite_cases(zip(merge_conditions[1:], (o._size for o in others)), self._size)
 
         return super(SimFile, self).merge(others, merge_conditions, common_ancestor=common_ancestor)
@@ -447,6 +553,11 @@ class SimPackets(SimFileBase):
             raise SimFileError("SimPacket.read(%d): Packet number is past frontier of %d?" % (pos, len(self.content)))
         elif pos != len(self.content):
             _, realsize = self.content[pos]
+            if not self.state.solver.symbolic(realsize) and not self.state.solver.symbolic(size):
+                # fully concrete packets are checked without involving the solver
+                if self.state.solver.eval(realsize) > self.state.solver.eval(size):
+                    raise SimFileError("SimPackets could not fit the current packet into the read request of %s bytes: %s" % (size, self.content[pos]))
+                return self.content[pos] + (pos+1,)
             self.state.solver.add(realsize <= size)  # assert that the packet fits within the read request
             if not self.state.solver.satisfiable():
                 raise SimFileError("SimPackets could not fit the current packet into the read request of %s bytes: %s" % (size, self.content[pos]))
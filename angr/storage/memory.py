@@ -522,7 +522,11 @@ class SimMemory(SimStatePlugin):
         if not size_e.symbolic and (len(data_e) < size_e*self.state.arch.byte_width).is_true():
             raise SimMemoryError("Provided data is too short for this memory store")
 
-        if _inspect:
+        # only report the write if anybody is listening
+        _inspect_write = _inspect and self.category in ('reg', 'mem') and \
+                         self.state._inspect_armed(self.category + '_write')
+
+        if _inspect_write:
             if self.category == 'reg':
                 self.state._inspect(
                     'reg_write',
@@ -575,8 +579,8 @@ class SimMemory(SimStatePlugin):
             raise
 
         if _inspect:
-            if self.category == 'reg': self.state._inspect('reg_write', BP_AFTER)
-            elif self.category == 'mem': self.state._inspect('mem_write', BP_AFTER)
+            if _inspect_write:
+                self.state._inspect(self.category + '_write', BP_AFTER)
             # tracer uses address_concretization_add_constraints
             add_constraints = self.state._inspect_getattr('address_concretization_add_constraints', add_constraints)
 
@@ -757,7 +761,11 @@ class SimMemory(SimStatePlugin):
 
         endness = self.endness if endness is None else endness
 
-        if _inspect:
+        # only report the read if anybody is listening
+        _inspect_read = _inspect and self.category in ('reg', 'mem') and \
+                        self.state._inspect_armed(self.category + '_read')
+
+        if _inspect_read:
             if self.category == 'reg':
                 self.state._inspect('reg_read', BP_BEFORE, reg_read_offset=addr_e, reg_read_length=size_e,
                                     reg_read_condition=condition_e, reg_read_endness=endness,
@@ -816,7 +824,7 @@ class SimMemory(SimStatePlugin):
         if endness == "Iend_LE":
             r = r.reversed
 
-        if _inspect:
+        if _inspect_read:
             if self.category == 'mem':
                 self.state._inspect('mem_read', BP_AFTER, mem_read_expr=r)
                 r = self.state._inspect_getattr("mem_read_expr", r)
@@ -1,3 +1,4 @@
+import bisect
 import claripy
 import cle
 from sortedcontainers import SortedDict
@@ -6,6 +7,7 @@ import logging
 
 
 from ..errors import SimMemoryError, SimSegfaultError, SimMemoryMissingError, SimConcreteMemoryError
+from ..utils.cowdict import ChunkedCOWDict, ChunkedCOWSet
 
 from .. import sim_options as options
 from .memory_object import SimMemoryObject
@@ -40,6 +42,9 @@ class BasePage:
         self._page_addr = page_addr
         self._page_size = page_size
 
+        # whether the content of this page is exactly what was loaded from the cle.Clemory memory backer
+        self.from_backer = False
+
         if permissions is None:
             perms = Page.PROT_READ|Page.PROT_WRITE
             if executable:
@@ -80,11 +85,13 @@ class BasePage:
             self.store_underwrite(state, new_mo, start, end)
 
     def copy(self):
-        return Page(
+        p = Page(
             self._page_addr, self._page_size,
             permissions=self.permissions,
             **self._copy_args()
         )
+        p.from_backer = self.from_backer
+        return p
 
     #
     # Abstract functions
@@ -321,22 +328,72 @@ class ListPage(BasePage):
 
 Page = ListPage
 
+
+class PermissionMapIndex:
+    """
+    A sorted interval index over a permission map (a dict of `(start, end)` address ranges to permission bits).
+
+    Lookups are a bisection over the sorted range starts. Overlapping ranges are supported; when several ranges
+    contain an address, the one that comes first in the original map wins.
+    """
+
+    __slots__ = ('_starts', '_ends', '_max_ends', '_flags', '_order', )
+
+    def __init__(self, permission_map):
+        entries = sorted(((start, end, flags, order) for order, ((start, end), flags) in enumerate(permission_map.items())),
+                         key=lambda e: e[0])
+
+        self._starts = [ e[0] for e in entries ]
+        self._ends = [ e[1] for e in entries ]
+        self._flags = [ e[2] for e in entries ]
+        self._order = [ e[3] for e in entries ]
+
+        # running maximum of range ends, which bounds how far back an overlapping range can start
+        self._max_ends = [ ]
+        max_end = None
+        for end in self._ends:
+            max_end = end if max_end is None or end > max_end else max_end
+            self._max_ends.append(max_end)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def lookup(self, addr):
+        """
+        Get the permission bits of the range containing `addr`.
+
+        :param int addr: The address to look up.
+        :return:         The permission bits, or None if no range contains the address.
+        """
+
+        i = bisect.bisect_right(self._starts, addr) - 1
+        found = None
+        while i >= 0 and self._max_ends[i] > addr:
+            if self._ends[i] > addr and (found is None or self._order[i] < self._order[found]):
+                found = i
+            i -= 1
+
+        return None if found is None else self._flags[found]
+
+
 #pylint:disable=unidiomatic-typecheck
 
 class SimPagedMemory:
     """
     Represents paged memory.
     """
-    def __init__(self, memory_backer=None, permissions_backer=None, pages=None, initialized=None, name_mapping=None, hash_mapping=None, page_size=None, symbolic_addrs=None, check_permissions=False):
+    def __init__(self, memory_backer=None, permissions_backer=None, pages=None, initialized=None, name_mapping=None, hash_mapping=None, page_size=None, symbolic_addrs=None, check_permissions=False, permission_index=None):
         self._cowed = set()
         self._memory_backer = { } if memory_backer is None else memory_backer
         self._permissions_backer = permissions_backer # saved for copying
         self._executable_pages = False if permissions_backer is None else permissions_backer[0]
         self._permission_map = { } if permissions_backer is None else permissions_backer[1]
-        self._pages = { } if pages is None else pages
-        self._initialized = set() if initialized is None else initialized
+        self._permission_index = permission_index # built lazily and shared between branches
+        # page tables are branched in O(1) and copied chunk by chunk on write
+        self._pages = ChunkedCOWDict() if pages is None else pages
+        self._initialized = ChunkedCOWSet() if initialized is None else initialized
         self._page_size = 0x1000 if page_size is None else page_size
-        self._symbolic_addrs = dict() if symbolic_addrs is None else symbolic_addrs
+        self._symbolic_addrs = ChunkedCOWDict() if symbolic_addrs is None else symbolic_addrs
         self.state = None
         self._preapproved_stack = range(0)
         self._check_perms = check_permissions
@@ -390,23 +447,36 @@ class SimPagedMemory:
 
     def __setstate__(self, s):
         self._cowed = set()
+        self._permission_index = None
         self.__dict__.update(s)
 
+    @property
+    def permission_index(self):
+        """
+        The sorted interval index over the permission map of the memory backer.
+
+        :rtype: PermissionMapIndex
+        """
+        if self._permission_index is None:
+            self._permission_index = PermissionMapIndex(self._permission_map)
+        return self._permission_index
+
     def branch(self):
         new_name_mapping = self._name_mapping.new_child() if options.REVERSE_MEMORY_NAME_MAP in self.state.options else self._name_mapping
         new_hash_mapping = self._hash_mapping.new_child() if options.REVERSE_MEMORY_HASH_MAP in self.state.options else self._hash_mapping
 
-        new_pages = dict(self._pages)
+        new_pages = self._pages.branch()
         self._cowed = set()
         m = SimPagedMemory(memory_backer=self._memory_backer,
                            permissions_backer=self._permissions_backer,
                            pages=new_pages,
-                           initialized=set(self._initialized),
+                           initialized=self._initialized.branch(),
                            page_size=self._page_size,
                            name_mapping=new_name_mapping,
                            hash_mapping=new_hash_mapping,
-                           symbolic_addrs=dict(self._symbolic_addrs),
-                           check_permissions=self._check_perms)
+                           symbolic_addrs=self._symbolic_addrs.branch(),
+                           check_permissions=self._check_perms,
+                           permission_index=self._permission_index)
         m._preapproved_stack = self._preapproved_stack
         return m
 
@@ -460,6 +530,7 @@ class SimPagedMemory:
 
         result = [ ]
         end = addr + num_bytes
+        self._initialize_pages(self._page_id(addr), self._num_pages(addr, end))
         for page_addr in self._containing_pages(addr, end):
             try:
                 #print "Getting page %x" % (page_addr // self._page_size)
@@ -502,8 +573,23 @@ class SimPagedMemory:
             self.state._inspect_getattr('mapped_page', pg)
         return pg
 
+    def _apply_permission_map(self, n, new_page):
+        """
+        Set the permissions of a new page from the permission map of a cle.Clemory memory backer. Pages that are not
+        covered by the permission map keep their default (read-write-maybe-exec) permissions.
+
+        :param int n:       The page number.
+        :param new_page:    The new page.
+        """
+        flags = self.permission_index.lookup(n * self._page_size)
+        if flags is not None:
+            new_page.permissions = claripy.BVV(flags, 3)
+
     def _initialize_page(self, n, new_page):
         if n in self._initialized:
+            # the content was loaded before, but a page that is created again still needs its permissions
+            if isinstance(self._memory_backer, cle.Clemory) and not self._memory_backer.is_concrete_target_set():
+                self._apply_permission_map(n, new_page)
             return False
         self._initialized.add(n)
 
@@ -536,11 +622,7 @@ class SimPagedMemory:
         elif isinstance(self._memory_backer, cle.Clemory):
             # find permission backer associated with the address
             # fall back to default (read-write-maybe-exec) if can't find any
-            for start, end in self._permission_map:
-                if start <= new_page_addr < end:
-                    flags = self._permission_map[(start, end)]
-                    new_page.permissions = claripy.BVV(flags, 3)
-                    break
+            self._apply_permission_map(n, new_page)
 
             # for each clemory backer which intersects with the page, apply its relevant data
             for backer_addr, backer in self._memory_backer.backers(new_page_addr):
@@ -568,6 +650,8 @@ class SimPagedMemory:
 
                 initialized = True
 
+            new_page.from_backer = initialized
+
         elif len(self._memory_backer) <= self._page_size:
             for i in self._memory_backer:
                 if new_page_addr <= i <= new_page_addr + self._page_size:
@@ -604,6 +688,76 @@ class SimPagedMemory:
             self.state.scratch.pop_priv()
         return initialized
 
+    def _initialize_pages(self, page_num, num_pages):
+        """
+        Initialize a contiguous range of pages from a cle.Clemory memory backer, iterating over the backers only once
+        for the whole range instead of once per page. Pages that are already present or initialized are left alone.
+
+        :param int page_num:    The number of the first page.
+        :param int num_pages:   The number of pages.
+        """
+
+        if num_pages <= 1 or \
+                not isinstance(self._memory_backer, cle.Clemory) or \
+                self._memory_backer.is_concrete_target_set() or \
+                self.byte_width != 8:
+            return
+
+        # page number -> page, or None if no backer covers the page
+        new_pages = { }
+        for n in range(page_num, page_num + num_pages):
+            if n not in self._pages and n not in self._initialized:
+                new_pages[n] = None
+        if not new_pages:
+            return
+
+        range_start = page_num * self._page_size
+        range_end = (page_num + num_pages) * self._page_size
+
+        if self.state is not None:
+            self.state.scratch.push_priv(True)
+
+        for backer_addr, backer in self._memory_backer.backers(range_start):
+            if backer_addr >= range_end:
+                break
+
+            region_start = max(range_start, backer_addr)
+            region_end = min(range_end, backer_addr + len(backer))
+            if region_end <= region_start:
+                continue
+            data = memoryview(backer)
+
+            for n in range(region_start // self._page_size, (region_end - 1) // self._page_size + 1):
+                if n not in new_pages:
+                    continue
+
+                page_addr = n * self._page_size
+                page = new_pages[n]
+                if page is None:
+                    page = new_pages[n] = self._create_page(n)
+                    self._apply_permission_map(n, page)
+
+                relevant_region_start = max(page_addr, region_start)
+                relevant_region_end = min(page_addr + self._page_size, region_end)
+                mo = SimMemoryObject(
+                        bytes(data[relevant_region_start - backer_addr:relevant_region_end - backer_addr]),
+                        relevant_region_start,
+                        byte_width=self.byte_width)
+                self._apply_object_to_page(page_addr, mo, page=page)
+
+        if self.state is not None:
+            self.state.scratch.pop_priv()
+
+        for n, page in new_pages.items():
+            # pages that no backer covers are left to _initialize_page(), which still has to apply their permissions
+            # from the permission map once they get created
+            if page is not None:
+                self._initialized.add(n)
+                page.from_backer = True
+                self._pages[n] = page
+                self._symbolic_addrs[n] = set()
+                self._cowed.add(n)
+
     def _get_page(self, page_num, write=False, create=False, initialize=True):
         page_addr = page_num * self._page_size
         try:
@@ -621,6 +775,8 @@ class SimPagedMemory:
 
             self._pages[page_num] = page
             self._cowed.add(page_num)
+            if write:
+                page.from_backer = False
             return page
 
         if write and page_num not in self._cowed:
@@ -629,8 +785,27 @@ class SimPagedMemory:
             self._cowed.add(page_num)
             self._pages[page_num] = page
 
+        if write:
+            page.from_backer = False
+
         return page
 
+    def unchanged_from_backer(self, addr, length):
+        """
+        Check if a range of memory still holds exactly the content of the cle.Clemory memory backer, i.e., if every page
+        touching the range was initialized from the memory backer and has not been written to since.
+
+        :param int addr:    The start address.
+        :param int length:  The length of the range.
+        :return:            True if the range is unchanged, False otherwise.
+        :rtype:             bool
+        """
+        for n in range(self._page_id(addr), self._page_id(addr + length - 1) + 1):
+            page = self._pages.get(n, None)
+            if page is None or not page.from_backer:
+                return False
+        return True
+
     def __contains__(self, addr):
         try:
             return self.__getitem__(addr) is not None
@@ -779,6 +954,7 @@ class SimPagedMemory:
         :param mo: the memory object to store
         """
 
+        self._initialize_pages(self._page_id(mo.base), self._num_pages(mo.base, mo.base + mo.length))
         for p in self._containing_pages_mo(mo):
             self._apply_object_to_page(p, mo, overwrite=overwrite)
 
@@ -1129,7 +1305,7 @@ class SimPagedMemory:
             for page_addr in range(addr[0], addr[1], self._page_size):
                 white_list_page_number.append(self._page_id(page_addr))
 
-        new_page_dict = {}
+        new_page_dict = ChunkedCOWDict()
 
         flushed = []
         # cycle over all the keys ( the page number )
@@ -1142,7 +1318,7 @@ class SimPagedMemory:
                 flushed.append((p._page_addr, p._page_size))
 
         self._pages = new_page_dict
-        self._initialized = set()
+        self._initialized = ChunkedCOWSet()
         return flushed
 
 
@@ -0,0 +1,162 @@
+from collections.abc import MutableMapping, MutableSet
+
+
+class ChunkedCOWDict(MutableMapping):
+    """
+    A dict-like mapping from integer keys to arbitrary values that can be branched in constant time.
+
+    Keys are grouped into chunks of `2 ** chunk_bits` consecutive integers. The top-level table and every chunk are
+    shared between all branches of a mapping until one of them writes to it, at which point only the touched chunk
+    (and, once per branch, the top-level table of chunk references) is duplicated.
+    """
+
+    __slots__ = ('_chunk_bits', '_chunks', '_top_owned', '_owned', '_len', )
+
+    def __init__(self, items=None, chunk_bits=8):
+        self._chunk_bits = chunk_bits
+        self._chunks = { }
+        self._top_owned = True
+        self._owned = set()
+        self._len = 0
+
+        if items is not None:
+            self.update(items)
+
+    def branch(self):
+        """
+        Create a new mapping that shares all storage with this one. Both mappings copy-on-write from now on.
+
+        :return: The new mapping.
+        :rtype:  ChunkedCOWDict
+        """
+
+        o = ChunkedCOWDict.__new__(ChunkedCOWDict)
+        o._chunk_bits = self._chunk_bits
+        o._chunks = self._chunks
+        o._top_owned = False
+        o._owned = set()
+        o._len = self._len
+
+        self._top_owned = False
+        self._owned = set()
+        return o
+
+    copy = branch
+
+    def _writable_chunk(self, chunk_id, create):
+        if not self._top_owned:
+            self._chunks = dict(self._chunks)
+            self._top_owned = True
+
+        try:
+            chunk = self._chunks[chunk_id]
+        except KeyError:
+            if not create:
+                raise
+            chunk = self._chunks[chunk_id] = { }
+            self._owned.add(chunk_id)
+            return chunk
+
+        if chunk_id not in self._owned:
+            chunk = self._chunks[chunk_id] = dict(chunk)
+            self._owned.add(chunk_id)
+        return chunk
+
+    def __getitem__(self, key):
+        try:
+            return self._chunks[key >> self._chunk_bits][key]
+        except KeyError:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        chunk = self._chunks.get(key >> self._chunk_bits, None)
+        if chunk is None:
+            return default
+        return chunk.get(key, default)
+
+    def __contains__(self, key):
+        chunk = self._chunks.get(key >> self._chunk_bits, None)
+        return chunk is not None and key in chunk
+
+    def __setitem__(self, key, value):
+        chunk = self._writable_chunk(key >> self._chunk_bits, True)
+        if key not in chunk:
+            self._len += 1
+        chunk[key] = value
+
+    def __delitem__(self, key):
+        chunk_id = key >> self._chunk_bits
+        try:
+            chunk = self._writable_chunk(chunk_id, False)
+            del chunk[key]
+        except KeyError:
+            raise KeyError(key)
+
+        self._len -= 1
+        if not chunk:
+            del self._chunks[chunk_id]
+            self._owned.discard(chunk_id)
+
+    def __iter__(self):
+        for chunk in self._chunks.values():
+            yield from chunk
+
+    def __len__(self):
+        return self._len
+
+    def __repr__(self):
+        return "<ChunkedCOWDict with %d entries in %d chunks>" % (self._len, len(self._chunks))
+
+    def __reduce__(self):
+        return ChunkedCOWDict, (dict(self.items()), self._chunk_bits)
+
+
+class ChunkedCOWSet(MutableSet):
+    """
+    A set of integers that can be branched in constant time. See :class:`ChunkedCOWDict`.
+    """
+
+    __slots__ = ('_map', )
+
+    def __init__(self, items=None, chunk_bits=8):
+        self._map = ChunkedCOWDict(chunk_bits=chunk_bits)
+        if items is not None:
+            for item in items:
+                self._map[item] = None
+
+    def branch(self):
+        """
+        Create a new set that shares all storage with this one. Both sets copy-on-write from now on.
+
+        :return: The new set.
+        :rtype:  ChunkedCOWSet
+        """
+
+        o = ChunkedCOWSet.__new__(ChunkedCOWSet)
+        o._map = self._map.branch()
+        return o
+
+    copy = branch
+
+    def __contains__(self, item):
+        return item in self._map
+
+    def add(self, item):
+        if item not in self._map:
+            self._map[item] = None
+
+    def discard(self, item):
+        if item in self._map:
+            del self._map[item]
+
+    def __iter__(self):
+        return iter(self._map)
+
+    def __len__(self):
+        return len(self._map)
+
+    def __repr__(self):
+        return "<ChunkedCOWSet with %d entries>" % len(self._map)
+
+    def __reduce__(self):
+        return ChunkedCOWSet, (list(self._map), self._map._chunk_bits)
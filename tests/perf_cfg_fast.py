@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+
+import angr
+
+test_location = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'binaries', 'tests')
+
+
+def perf_cfg_fast_workers(binary_path=os.path.join(test_location, 'x86_64', 'libc.so.6')):
+    p = angr.Project(binary_path, auto_load_libs=False)
+
+    for workers in (None, 2, 4, 8):
+        start = time.time()
+        cfg = p.analyses.CFGFast(kb=angr.KnowledgeBase(p), workers=workers)
+        elapsed = time.time() - start
+        print("%s workers: %f sec, %d nodes, %d functions" % (workers or 'No', elapsed, len(cfg.graph),
+                                                               len(cfg.kb.functions)))
+
+
+def perf_prologue_scanning(binary_path=os.path.join(test_location, 'x86_64', 'libc.so.6')):
+    p = angr.Project(binary_path, auto_load_libs=False)
+    cfg = p.analyses.CFGFast(kb=angr.KnowledgeBase(p), regions=[ (p.entry, p.entry + 0x10) ])
+
+    start = time.time()
+    for _ in range(10):
+        addrs = cfg._func_addrs_from_prologues()
+    elapsed = time.time() - start
+    print("Found %d prologues, %f sec per scan" % (len(addrs), elapsed / 10))
+
+
+def perf_exec_region_lookups(binary_path=os.path.join(test_location, 'x86_64', 'libc.so.6')):
+    p = angr.Project(binary_path, auto_load_libs=False)
+    cfg = p.analyses.CFGFast(kb=angr.KnowledgeBase(p), regions=[ (p.entry, p.entry + 0x10) ])
+
+    addrs = list(range(p.loader.min_addr, p.loader.max_addr, 0x10))
+
+    start = time.time()
+    for addr in addrs:
+        cfg._addr_in_exec_memory_regions(addr)
+    elapsed = time.time() - start
+    print("_addr_in_exec_memory_regions: %f usec per call" % (elapsed * 1000000 / len(addrs)))
+
+    start = time.time()
+    cfg._addrs_in_exec_memory_regions(addrs)
+    elapsed = time.time() - start
+    print("_addrs_in_exec_memory_regions: %f usec per address" % (elapsed * 1000000 / len(addrs)))
+
+    start = time.time()
+    for addr in addrs:
+        cfg._addrs_belong_to_same_section(addr, addr + 0x10)
+    elapsed = time.time() - start
+    print("_addrs_belong_to_same_section: %f usec per call" % (elapsed * 1000000 / len(addrs)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+import angr
+
+test_location = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'binaries', 'tests')
+
+
+def _measure(binary_path):
+    p = angr.Project(binary_path, auto_load_libs=False)
+
+    tracemalloc.start()
+    cfg = p.analyses.CFGFast()
+    model = cfg.model
+    model_size = tracemalloc.get_traced_memory()[0]
+
+    before = tracemalloc.get_traced_memory()[0]
+    compact = model.compact()
+    compact_size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # the CFG size includes the functions, too, but CFGModel takes the majority
+    print("CFGModel (and function manager): %d nodes, %.2f MB" % (len(model.graph), model_size / 1048576.0))
+    print("CompactCFGModel: %.2f MB" % (compact_size / 1048576.0))
+
+    random.seed(1)
+    addrs = [ random.choice(list(model.nodes())).addr for _ in range(100000) ]
+    for m in (model, compact):
+        start = time.time()
+        for addr in addrs:
+            node = m.get_any_node(addr)
+            m.get_successors(node)
+            m.get_predecessors(node)
+        elapsed = time.time() - start
+        print("%s: %f us per lookup" % (type(m).__name__, elapsed * 1e6 / len(addrs)))
+
+
+def perf_cfg_model_libc():
+    _measure(os.path.join(test_location, 'x86_64', 'libc.so.6'))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
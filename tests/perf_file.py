@@ -0,0 +1,33 @@
+import sys
+import time
+
+import angr
+from angr.state_plugins.posix import SimSystemPosix
+
+
+def perf_read_10mb_stdin():
+    data = bytes(range(256)) * (10 * 1024 * 1024 // 256)
+    s = angr.SimState(arch='AMD64')
+    s.register_plugin('posix', SimSystemPosix(stdin=angr.SimFileStream(name='stdin', content=data, has_end=True)))
+    stdin = s.posix.get_fd(0)
+
+    start = time.time()
+    total = 0
+    while total < len(data):
+        _, size = stdin.read_data(0x1000)
+        total += s.solver.eval(size)
+    elapsed = time.time() - start
+    print("read_data: %f sec for %d bytes" % (elapsed, total))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
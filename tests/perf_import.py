@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import time
+
+
+def _time_python(code, repeat=5):
+    elapsed = [ ]
+    for _ in range(repeat):
+        start = time.time()
+        subprocess.check_call([ sys.executable, '-c', code ])
+        elapsed.append(time.time() - start)
+    return min(elapsed)
+
+
+def perf_import_angr():
+    print("import angr: %f sec" % _time_python("import angr"))
+
+
+def perf_import_angr_and_load_libc():
+    print("import angr, SIM_LIBRARIES['libc.so.6'].prototypes['strcpy']: %f sec" %
+          _time_python("import angr; angr.SIM_LIBRARIES['libc.so.6'].prototypes['strcpy']"))
+
+
+def perf_import_angr_and_load_all_definitions():
+    print("import angr, load_all_definitions(): %f sec" %
+          _time_python("import angr; angr.procedures.definitions.load_all_definitions()"))
+
+
+def perf_import_angr_and_load_project():
+    binary = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'binaries', 'tests', 'x86_64',
+                          'fauxware')
+    print("import angr, Project(fauxware): %f sec" %
+          _time_python("import angr; angr.Project(%r)" % binary))
+
+
+def perf_import_angr_and_load_project_without_libs():
+    binary = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'binaries', 'tests', 'x86_64',
+                          'fauxware')
+    print("import angr, Project(fauxware, auto_load_libs=False): %f sec" %
+          _time_python("import angr; angr.Project(%r, auto_load_libs=False)" % binary))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
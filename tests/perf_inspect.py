@@ -0,0 +1,52 @@
+import sys
+import os
+import time
+
+import angr
+from angr import BP_BEFORE
+
+test_location = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..')
+
+
+def _step_blocks(breakpoints, n_blocks=2000):
+    p = angr.Project(os.path.join(test_location, 'binaries', 'tests', 'x86_64', 'fauxware'), auto_load_libs=False)
+    state = p.factory.entry_state(addr=p.loader.find_symbol('main').rebased_addr)
+    for event_type in breakpoints:
+        state.inspect.b(event_type, when=BP_BEFORE, action=lambda s: None)
+
+    # execute the very same block over and over again, so that only the instrumentation overhead differs
+    elapsed = 0.
+    for _ in range(n_blocks):
+        s = state.copy()
+        start = time.time()
+        p.factory.successors(s)
+        elapsed += time.time() - start
+    return elapsed / n_blocks
+
+
+def perf_block_no_breakpoints():
+    t = _step_blocks(())
+    print("no breakpoints: %f ms per block" % (t * 1000))
+
+
+def perf_block_one_breakpoint():
+    t = _step_blocks(('mem_read',))
+    print("one mem_read breakpoint: %f ms per block" % (t * 1000))
+
+
+def perf_block_expr_breakpoint():
+    t = _step_blocks(('expr',))
+    print("one expr breakpoint: %f ms per block" % (t * 1000))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
@@ -0,0 +1,42 @@
+
+import sys
+import time
+import random
+
+from angr.analyses.forward_analysis import ListJobQueue, HeapJobQueue
+from angr.analyses.forward_analysis.job_info import JobInfo
+
+
+def _queue_ops(queue_type, num_jobs=100000):
+    random.seed(1)
+    queue = queue_type(key=lambda job_info: job_info.job)
+    job_infos = [ JobInfo(i, random.randrange(num_jobs)) for i in range(num_jobs) ]
+
+    start = time.time()
+    for job_info in job_infos:
+        queue.add(job_info)
+    # merging removes and re-inserts existing jobs
+    for job_info in random.sample(job_infos, num_jobs // 10):
+        queue.remove(job_info)
+        queue.add(job_info)
+    while queue:
+        queue.popleft()
+    return time.time() - start
+
+
+def perf_job_queue_100k():
+    for queue_type in (ListJobQueue, HeapJobQueue):
+        print("%s: %f sec" % (queue_type.__name__, _queue_ops(queue_type)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
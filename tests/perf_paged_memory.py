@@ -0,0 +1,32 @@
+
+import sys
+import time
+
+from angr import SimState
+
+
+def perf_branch_10k_pages():
+    s = SimState(arch='AMD64')
+    for i in range(10000):
+        s.memory.store(0x10000000 + i * 0x1000, b'A')
+
+    start = time.time()
+    for i in range(1000):
+        s2 = s.copy()
+        s2.memory.store(0x10000000 + (i % 10000) * 0x1000, b'B')
+    elapsed = time.time() - start
+
+    print("Elapsed %f sec for 1000 forks (%f ms per fork)" % (elapsed, elapsed))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
@@ -0,0 +1,73 @@
+
+import sys
+import os
+import time
+import multiprocessing
+
+import angr
+
+test_location = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..')
+
+
+def _run(workers, steps=40):
+    p = angr.Project(os.path.join(test_location, 'binaries', 'tests', 'x86_64', 'veritesting_a'), auto_load_libs=False)
+    simgr = p.factory.simulation_manager()
+    if workers is not None:
+        tech = simgr.use_technique(angr.exploration_techniques.ProcessPool(workers=workers))
+
+    start = time.time()
+    simgr.run(n=steps)
+    elapsed = time.time() - start
+
+    if workers is not None:
+        tech.shutdown()
+    return elapsed, simgr
+
+
+def perf_process_pool_scaling():
+    baseline, simgr = _run(None)
+    print("sequential: %f sec, %s" % (baseline, simgr))
+
+    workers = 1
+    while workers <= multiprocessing.cpu_count():
+        elapsed, simgr = _run(workers)
+        print("%d workers: %f sec (%.2fx), %s" % (workers, elapsed, baseline / elapsed, simgr))
+        workers *= 2
+
+
+def perf_process_pool_history_depth():
+    # shipping a state to a worker pickles its whole history ancestry, so it gets slower the deeper the path is
+    from angr.exploration_techniques.process_pool import _dumps
+
+    p = angr.Project(os.path.join(test_location, 'binaries', 'tests', 'x86_64', 'veritesting_a'), auto_load_libs=False)
+    simgr = p.factory.simulation_manager()
+
+    depth = 0
+    for checkpoint in (50, 100, 200, 400, 800):
+        while depth < checkpoint and simgr.active:
+            # follow a single path
+            keep = simgr.active[0]
+            simgr.drop(filter_func=lambda s: s is not keep)  # pylint:disable=cell-var-from-loop
+            simgr.step()
+            depth += 1
+        if not simgr.active:
+            break
+
+        start = time.time()
+        for _ in range(10):
+            data = _dumps(simgr.active, p)
+        elapsed = (time.time() - start) / 10
+        print("depth %d: %d bytes, %f ms per state shipped" % (depth, len(data), elapsed * 1000))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
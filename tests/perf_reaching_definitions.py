@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+
+import angr
+
+test_location = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'binaries', 'tests')
+
+
+def perf_rda_largest_function():
+    p = angr.Project(os.path.join(test_location, 'x86_64', 'true'), auto_load_libs=False)
+    cfg = p.analyses.CFGFast(normalize=True)
+
+    func = max((f for f in cfg.kb.functions.values() if not f.is_simprocedure and not f.is_plt),
+               key=lambda f: len(f.block_addrs_set))
+
+    start = time.time()
+    p.analyses.ReachingDefinitions(subject=func, kb=angr.KnowledgeBase(p), observe_all=True)
+    elapsed = time.time() - start
+
+    print("Elapsed %f sec for function %s (%d blocks)" % (elapsed, func.name, len(func.block_addrs_set)))
+
+
+def perf_live_definitions_copy():
+    p = angr.Project(os.path.join(test_location, 'x86_64', 'true'), auto_load_libs=False)
+    cfg = p.analyses.CFGFast(normalize=True)
+
+    func = max((f for f in cfg.kb.functions.values() if not f.is_simprocedure and not f.is_plt),
+               key=lambda f: len(f.block_addrs_set))
+    rda = p.analyses.ReachingDefinitions(subject=func, kb=angr.KnowledgeBase(p), observe_all=True)
+    live_defs = max(rda.observed_results.values(),
+                    key=lambda ld: len(ld.register_definitions) + len(ld.memory_definitions))
+
+    start = time.time()
+    for _ in range(10000):
+        live_defs.copy()
+    elapsed = time.time() - start
+
+    print("Elapsed %f sec for 10000 copies of %s" % (elapsed, live_defs))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
@@ -0,0 +1,44 @@
+import sys
+import time
+
+import angr
+
+
+def _prototypes(count):
+    base_types = [ 'int', 'char *', 'unsigned long', 'void *', 'size_t', 'double', 'FILE *', 'pid_t' ]
+    for i in range(count):
+        args = ", ".join("%s a%d" % (base_types[(i + j) % len(base_types)], j) for j in range(i % 5))
+        yield "%s f%d(%s)" % (base_types[i % len(base_types)], i % 1000, args or "void")
+
+
+def perf_parse_type_10k():
+    protos = list(_prototypes(10000))
+
+    start = time.time()
+    for proto in protos:
+        angr.types.parse_type(proto)
+    elapsed = time.time() - start
+    print("parse_type: %f sec for %d prototypes" % (elapsed, len(protos)))
+
+
+def perf_parse_file_10k():
+    protos = [ proto + ";" for proto in _prototypes(10000) ]
+
+    start = time.time()
+    for proto in protos:
+        angr.types.parse_file(proto)
+    elapsed = time.time() - start
+    print("parse_file: %f sec for %d prototypes" % (elapsed, len(protos)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
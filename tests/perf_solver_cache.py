@@ -0,0 +1,46 @@
+import sys
+import os
+import time
+
+import angr
+from angr import options as so
+
+test_location = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..')
+
+
+def _explore(solver_cache_size, steps=60):
+    p = angr.Project(os.path.join(test_location, 'binaries', 'tests', 'x86_64', 'veritesting_a'),
+                     auto_load_libs=False, solver_cache_size=solver_cache_size)
+    # check the satisfiability of every successor, so that sibling states keep asking the solver similar questions
+    state = p.factory.entry_state(remove_options={so.LAZY_SOLVES})
+    simgr = p.factory.simulation_manager(state)
+
+    start = time.time()
+    simgr.run(n=steps)
+    elapsed = time.time() - start
+    return p, simgr, elapsed
+
+
+def perf_branching_no_cache():
+    _, simgr, elapsed = _explore(None)
+    print("without cache: %f sec, %d active states" % (elapsed, len(simgr.active)))
+
+
+def perf_branching_cache():
+    p, simgr, elapsed = _explore(100000)
+    cache = p.solver_cache
+    print("with cache: %f sec, %d active states, %d hits, %d misses, hit rate %.2f" %
+          (elapsed, len(simgr.active), cache.hits, cache.misses, cache.hit_rate))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
@@ -0,0 +1,63 @@
+import sys
+import time
+import random
+from collections import namedtuple
+
+from angr.state_hierarchy import StateHierarchy
+from angr.state_plugins.history import SimStateHistory
+
+# most_mergeable() only looks at the histories of the states
+_State = namedtuple('_State', ('history',))
+
+
+def _history_tree(size, seed=0):
+    rand = random.Random(seed)
+    nodes = [ SimStateHistory() ]
+    for _ in range(size - 1):
+        # mostly deep paths, with some branches off older nodes
+        parent = rand.choice(nodes[-200:]) if rand.random() < 0.95 else rand.choice(nodes)
+        nodes.append(SimStateHistory(parent=parent))
+    return nodes
+
+
+def perf_merge_1000_states():
+    nodes = _history_tree(100000)
+    states = [ _State(h) for h in random.Random(1).sample(nodes[len(nodes)//2:], 1000) ]
+    hierarchy = StateHierarchy()
+
+    start = time.time()
+    rounds = 0
+    # what SimulationManager._merge_states does, minus the merging itself
+    while len(states) > 1:
+        optimal, common_history, others = hierarchy.most_mergeable(states)
+        if common_history is None:
+            break
+        states = others + [ _State(SimStateHistory(parent=optimal[0].history)) ]
+        rounds += 1
+    elapsed = time.time() - start
+    print("most_mergeable: %f sec for %d rounds" % (elapsed, rounds))
+
+
+def perf_closest_common_ancestor():
+    nodes = _history_tree(100000)
+    rand = random.Random(2)
+    pairs = [ (rand.choice(nodes), rand.choice(nodes)) for _ in range(10000) ]
+
+    start = time.time()
+    for a, b in pairs:
+        a.closest_common_ancestor(b)
+    elapsed = time.time() - start
+    print("closest_common_ancestor: %f sec for %d pairs" % (elapsed, len(pairs)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for arg in sys.argv[1:]:
+            print('perf_' + arg)
+            globals()['perf_' + arg]()
+
+    else:
+        for fk, fv in list(globals().items()):
+            if fk.startswith('perf_') and callable(fv):
+                print(fk)
+                fv()
@@ -36,6 +36,27 @@ def perf_unicorn_1():
     print("Elapsed %f sec" % elapsed)
     print(sm_unicorn.one_deadended)
 
+def _unicorn_entries(unicorn_page_cache, n_states=200):
+    p = angr.Project(os.path.join(test_location, 'binaries', 'tests', 'x86_64', 'fauxware'),
+                     unicorn_page_cache=unicorn_page_cache)
+    state = p.factory.entry_state(add_options=so.unicorn)
+
+    # every fresh state has to copy the pages it touches into unicorn again
+    start = time.time()
+    for _ in range(n_states):
+        p.factory.successors(state.copy())
+    elapsed = time.time() - start
+    return p, elapsed
+
+def perf_unicorn_no_page_cache():
+    _, elapsed = _unicorn_entries(False)
+    print("Elapsed %f sec" % elapsed)
+
+def perf_unicorn_page_cache():
+    p, elapsed = _unicorn_entries(True)
+    print("Elapsed %f sec" % elapsed)
+    print(p.unicorn_page_cache, "%d hits, %d misses" % (p.unicorn_page_cache.hits, p.unicorn_page_cache.misses))
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         for arg in sys.argv[1:]:
@@ -4,6 +4,8 @@ import logging
 l = logging.getLogger("angr.tests")
 
 import os
+import shutil
+import tempfile
 test_location = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'binaries', 'tests')
 
 def test_block_cache():
@@ -15,5 +17,29 @@ def test_block_cache():
     b = p.factory.block(p.entry)
     assert p.factory.block(p.entry).vex is not b.vex
 
+def test_persistent_block_cache():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        cache_path = os.path.join(tmpdir, "irsbs.sqlite")
+
+        p = angr.Project(os.path.join(test_location, "x86_64", "fauxware"), persistent_translation_cache=cache_path)
+        b = p.factory.block(p.entry)
+        assert p.factory.default_engine._persistent_cache_misses == 1
+        assert p.factory.default_engine._persistent_cache_hits == 0
+
+        # a new project lifts the block from the persistent cache
+        p = angr.Project(os.path.join(test_location, "x86_64", "fauxware"), persistent_translation_cache=cache_path)
+        b2 = p.factory.block(p.entry)
+        assert p.factory.default_engine._persistent_cache_hits == 1
+        assert b2.vex.instructions == b.vex.instructions
+        assert str(b2.vex) == str(b.vex)
+
+        # a block with different content must not hit
+        b3 = p.factory.block(p.entry, insn_bytes=b"\x90\x90\xc3")
+        assert b3.vex.instructions == 3
+    finally:
+        shutil.rmtree(tmpdir)
+
 if __name__ == "__main__":
     test_block_cache()
+    test_persistent_block_cache()
@@ -1,5 +1,6 @@
 
 import logging
+import pickle
 
 import nose
 
@@ -49,5 +50,43 @@ def test_empty_stack():
     nose.tools.assert_equal(cs.current_function_address, 0)
     nose.tools.assert_equal(cs.current_stack_pointer, 0)
 
+def _make_stack(depth, call_site_base=0x400000):
+    cs = CallStack()
+    for i in range(depth):
+        cs = cs.call(call_site_base + i * 0x10, 0x500000 + i * 0x100, 0x400000 + i * 0x10 + 4, 0xfffff000 - i * 0x80)
+    return cs
+
+
+def test_stack_identity():
+    cs0, cs1 = _make_stack(100), _make_stack(100)
+    nose.tools.assert_equal(len(cs0), 101)
+    nose.tools.assert_equal(cs0, cs1)
+    nose.tools.assert_equal(hash(cs0), hash(cs1))
+    nose.tools.assert_not_equal(cs0, cs0.next)
+    nose.tools.assert_equal(len(cs0.ret(None)), 100)
+
+    # call sites do not matter for equality, but they do for stack suffixes
+    cs2 = _make_stack(100, call_site_base=0x600000)
+    nose.tools.assert_equal(cs0, cs2)
+    nose.tools.assert_equal(cs0.stack_suffix(2), (0x400620, 0x506200, 0x400630, 0x506300))
+    nose.tools.assert_equal(cs2.stack_suffix(2), (0x600620, 0x506200, 0x600630, 0x506300))
+    nose.tools.assert_equal(cs0.stack_suffix(0), ())
+    nose.tools.assert_equal(_make_stack(0).stack_suffix(3), (None, None, None, None, 0, 0))
+
+    # modifying the top frame resets its caches
+    cs3 = cs0.copy({})
+    nose.tools.assert_equal(cs3, cs0)
+    cs3.current_function_address = 0x123456
+    nose.tools.assert_not_equal(cs3, cs0)
+    nose.tools.assert_equal(len(cs3), 101)
+    nose.tools.assert_equal(cs3.stack_suffix(1), (0x400630, 0x123456))
+    nose.tools.assert_equal(cs0.stack_suffix(1), (0x400630, 0x506300))
+
+    cs4 = pickle.loads(pickle.dumps(cs0, -1))
+    nose.tools.assert_equal(cs4, cs0)
+    nose.tools.assert_equal(cs4.stack_suffix(2), cs0.stack_suffix(2))
+
+
 if __name__ == "__main__":
     test_empty_stack()
+    test_stack_identity()
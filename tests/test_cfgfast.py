@@ -800,6 +800,75 @@ def test_indirect_jump_to_outside():
     nose.tools.assert_equal(set(ep.addr for ep in cfg.functions[0x404ee4].endpoints), { 0x404f00, 0x404f08 })
 
 
+def test_cfg_with_workers():
+
+    path = os.path.join(test_location, 'x86_64', 'fauxware')
+    proj = angr.Project(path, auto_load_libs=False)
+
+    cfg = proj.analyses.CFGFast(data_references=True, kb=angr.KnowledgeBase(proj))
+    cfg_workers = proj.analyses.CFGFast(data_references=True, kb=angr.KnowledgeBase(proj), workers=2)
+
+    # blocks lifted by workers must not change the result
+    nose.tools.assert_equal(set((n.addr, n.size) for n in cfg.graph.nodes()),
+                            set((n.addr, n.size) for n in cfg_workers.graph.nodes()))
+    nose.tools.assert_equal(set((src.addr, dst.addr) for src, dst in cfg.graph.edges()),
+                            set((src.addr, dst.addr) for src, dst in cfg_workers.graph.edges()))
+    nose.tools.assert_equal(set(cfg.kb.functions), set(cfg_workers.kb.functions))
+    for func_addr, func in cfg.kb.functions.items():
+        nose.tools.assert_equal(func.block_addrs_set, cfg_workers.kb.functions[func_addr].block_addrs_set)
+    nose.tools.assert_equal(set((addr, d.sort, d.size) for addr, d in cfg.memory_data.items()),
+                            set((addr, d.sort, d.size) for addr, d in cfg_workers.memory_data.items()))
+
+
+def test_compact_cfg_model():
+
+    path = os.path.join(test_location, 'x86_64', 'fauxware')
+    proj = angr.Project(path, auto_load_libs=False)
+
+    cfg = proj.analyses.CFGFast()
+    model = cfg.model
+    compact = model.compact()
+
+    nose.tools.assert_equal(len(compact), len(model.graph))
+    for node in model.nodes():
+        nose.tools.assert_equal(compact.get_any_node(node.addr), model.get_any_node(node.addr))
+        nose.tools.assert_equal(compact.get_successors(node), model.get_successors(node))
+        nose.tools.assert_equal(compact.get_predecessors(node, excluding_fakeret=False),
+                                model.get_predecessors(node, excluding_fakeret=False))
+        nose.tools.assert_equal(compact.get_successors_and_jumpkind(node, excluding_fakeret=False),
+                                model.get_successors_and_jumpkind(node, excluding_fakeret=False))
+
+    main = cfg.functions['main']
+    node = compact.get_any_node(main.addr + 1, anyaddr=True)
+    nose.tools.assert_equal(node, model.get_any_node(main.addr))
+    nose.tools.assert_equal(node.instruction_addrs, model.get_any_node(main.addr).instruction_addrs)
+    nose.tools.assert_equal(set(compact.get_all_successors(node)), set(model.get_all_successors(node)))
+    nose.tools.assert_equal(set(compact.graph.edges()), set(model.graph.edges()))
+
+
+def test_exec_memory_region_lookups():
+
+    path = os.path.join(test_location, 'x86_64', 'fauxware')
+    proj = angr.Project(path, auto_load_libs=False)
+
+    cfg = proj.analyses.CFGFast()
+
+    # compare against a linear scan over the regions
+    addrs = [ ]
+    for start, end in cfg._exec_mem_regions:
+        addrs.extend([ start - 1, start, start + 1, end - 1, end ])
+    for addr in addrs:
+        expected = any(start <= addr < end for start, end in cfg._exec_mem_regions)
+        nose.tools.assert_equal(cfg._addr_in_exec_memory_regions(addr), expected)
+        nose.tools.assert_equal(cfg._inside_regions(addr), any(start <= addr < end for start, end in cfg._regions.items()))
+    nose.tools.assert_equal(cfg._addrs_in_exec_memory_regions(addrs),
+                            [ cfg._addr_in_exec_memory_regions(addr) for addr in addrs ])
+
+    main = cfg.functions['main']
+    nose.tools.assert_true(cfg._addrs_belong_to_same_section(main.addr, main.addr + 4))
+    nose.tools.assert_false(cfg._addrs_belong_to_same_section(main.addr, proj.loader.main_object.sections_map['.data'].vaddr))
+
+
 def run_all():
 
     g = globals()
@@ -840,6 +909,9 @@ def run_all():
     test_function_leading_blocks_merging()
     test_cfg_with_patches()
     test_indirect_jump_to_outside()
+    test_cfg_with_workers()
+    test_compact_cfg_model()
+    test_exec_memory_region_lookups()
 
 
 def main():
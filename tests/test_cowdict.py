@@ -0,0 +1,61 @@
+import pickle
+
+from angr.utils.cowdict import ChunkedCOWDict, ChunkedCOWSet
+
+
+def test_cowdict_branch():
+    d = ChunkedCOWDict({ i * 3: i for i in range(1000) })
+    b = d.branch()
+
+    b[3] = 'b'
+    b[100000] = 'new'
+    del b[6]
+    d[9] = 'd'
+
+    assert d[3] == 1 and d[6] == 2 and d[9] == 'd' and 100000 not in d
+    assert b[3] == 'b' and 6 not in b and b[9] == 3 and b[100000] == 'new'
+    assert len(d) == 1000
+    assert len(b) == 1000
+    assert sorted(d) == [ i * 3 for i in range(1000) ]
+
+
+def test_cowdict_delete_chunk():
+    d = ChunkedCOWDict({ 1: 'a', 0x1000: 'b' })
+    b = d.branch()
+    del b[1]
+
+    assert list(b.items()) == [ (0x1000, 'b') ]
+    assert list(d.items()) == [ (1, 'a'), (0x1000, 'b') ]
+
+    try:
+        del b[1]
+    except KeyError:
+        pass
+    else:
+        assert False, "deleting a missing key should raise KeyError"
+
+
+def test_cowset_branch():
+    s = ChunkedCOWSet([ 1, 2, 0x1000 ])
+    t = s.branch()
+    t.add(3)
+    s.discard(1)
+
+    assert set(s) == { 2, 0x1000 }
+    assert set(t) == { 1, 2, 3, 0x1000 }
+
+
+def test_cowdict_pickle():
+    d = ChunkedCOWDict({ 1: 'a', 0x1000: 'b' })
+    b = d.branch()
+    b[2] = 'c'
+
+    assert dict(pickle.loads(pickle.dumps(b)).items()) == { 1: 'a', 2: 'c', 0x1000: 'b' }
+    assert set(pickle.loads(pickle.dumps(ChunkedCOWSet([ 5, 6 ])))) == { 5, 6 }
+
+
+if __name__ == '__main__':
+    test_cowdict_branch()
+    test_cowdict_delete_chunk()
+    test_cowset_branch()
+    test_cowdict_pickle()
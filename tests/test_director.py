@@ -3,6 +3,7 @@ import os
 import sys
 import logging
 
+import networkx
 import nose.tools
 
 import angr
@@ -57,6 +58,39 @@ def test_call_function_brancher():
     nose.tools.assert_is_not(NonLocal.the_state, None)
     nose.tools.assert_is(NonLocal.the_goal, goal)
 
+def test_goal_distances():
+
+    class Node(object):
+        def __init__(self, addr):
+            self.addr = addr
+
+    class CFG(object):
+        def __init__(self):
+            self.graph = networkx.DiGraph()
+
+    a, b, c, d, e = [ Node(addr) for addr in (0x10, 0x20, 0x30, 0x40, 0x50) ]
+    cfg = CFG()
+    # e reaches d only through a
+    cfg.graph.add_edges_from([ (a, b), (b, c), (c, d), (a, e), (e, a) ])
+
+    goal = angr.exploration_techniques.ExecuteAddressGoal(0x40)
+    distances = goal._get_distances(cfg)
+    nose.tools.assert_equal(distances, { d: 0, c: 1, b: 2, a: 3, e: 4 })
+    # cached until they are invalidated
+    nose.tools.assert_is(goal._get_distances(cfg), distances)
+
+    # the graph keeps its size, but e now reaches d directly
+    cfg.graph.remove_edge(e, a)
+    cfg.graph.add_edge(e, d)
+    goal.invalidate_distances()
+    nose.tools.assert_equal(goal._get_distances(cfg)[e], 1)
+
+    # a different graph is never served from the cache
+    cfg.graph = cfg.graph.copy()
+    f = Node(0x60)
+    cfg.graph.add_edge(f, d)
+    nose.tools.assert_equal(goal._get_distances(cfg)[f], 1)
+
 if __name__ == "__main__":
 
     logging.getLogger('angr.exploration_techniques.director').setLevel(logging.DEBUG)
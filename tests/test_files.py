@@ -32,6 +32,43 @@ def test_file_read_missing_content():
     nose.tools.assert_in("oops", next(iter(data.variables)))  # file name should be part of the variable name
 
 
+def test_file_concrete_backing():
+    data = bytes(range(256)) * 40
+    s = angr.SimState(arch='AMD64')
+    f = angr.SimFile('backed', content=data)
+    s.fs.insert('/tmp/backed', f)
+
+    # reads of untouched content are served straight from the concrete backing
+    fd = s.posix.open(b'/tmp/backed', Flags.O_RDONLY)
+    content, size = s.posix.get_fd(fd).read_data(0x100)
+    nose.tools.assert_equal(s.solver.eval(content, cast_to=bytes), data[:0x100])
+    nose.tools.assert_equal(s.solver.eval(size), 0x100)
+    nose.tools.assert_equal(f._symbolized_chunks, set())
+
+    # writes move the chunks they touch into memory
+    f.write(0xffe, b'XYZW')
+    nose.tools.assert_equal(f._symbolized_chunks, { 0, 1 })
+    nose.tools.assert_equal(s.solver.eval(f.load(0xff0, 0x20), cast_to=bytes),
+                            data[0xff0:0xffe] + b'XYZW' + data[0x1002:0x1010])
+    nose.tools.assert_equal(s.solver.eval(f.load(0x2000, 0x10), cast_to=bytes), data[0x2000:0x2010])
+    nose.tools.assert_equal(f._symbolized_chunks, { 0, 1 })
+
+    s2 = s.copy()
+    f2 = s2.fs.get('/tmp/backed')
+    f2.write(0x2000, b'Q')
+    nose.tools.assert_equal(f._symbolized_chunks, { 0, 1 })
+    nose.tools.assert_equal(f2._symbolized_chunks, { 0, 1, 2 })
+    nose.tools.assert_equal(f.concretize(), data[:0xffe] + b'XYZW' + data[0x1002:])
+    nose.tools.assert_equal(f2.concretize(), data[:0xffe] + b'XYZW' + data[0x1002:0x2000] + b'Q' + data[0x2001:])
+
+    # a write to a symbolic position may touch anything
+    x = s.solver.BVS('x', s.arch.bits)
+    s.add_constraints(x < 0x10)
+    f.write(x, b'A')
+    nose.tools.assert_equal(f._symbolized_chunks, { 0, 1, 2 })
+
+
 if __name__ == '__main__':
     test_files()
     test_file_read_missing_content()
+    test_file_concrete_backing()
@@ -299,8 +299,48 @@ def test_inspect_engine_process():
                     condition=second_symbolic_fork)
     pg.run()
 
+def test_inspect_armed():
+    s = SimState(arch="AMD64", mode="symbolic")
+    nose.tools.assert_false(s.inspect.is_armed('mem_write'))
+    nose.tools.assert_false(s._inspect_armed('mem_write'))
+
+    def replace_data(state):
+        state.inspect.mem_write_expr = state.solver.BVV(0x41414141, 32)
+
+    bp = s.inspect.b('mem_write', when=BP_BEFORE, action=replace_data)
+    nose.tools.assert_true(s.inspect.is_armed('mem_write'))
+    nose.tools.assert_true(s._inspect_armed('mem_write'))
+    nose.tools.assert_false(s._inspect_armed('mem_read'))
+
+    # the armed events are carried over to copies
+    c = s.copy()
+    nose.tools.assert_true(c._inspect_armed('mem_write'))
+
+    s.memory.store(0x100, s.solver.BVV(10, 32))
+    nose.tools.assert_equal(s.solver.eval(s.memory.load(0x100, 4)), 0x41414141)
+
+    # once the breakpoint is gone, stale inspect attributes must not leak into later writes
+    s.inspect.remove_breakpoint('mem_write', bp=bp)
+    nose.tools.assert_false(s._inspect_armed('mem_write'))
+    s.memory.store(0x100, s.solver.BVV(10, 32))
+    nose.tools.assert_equal(s.solver.eval(s.memory.load(0x100, 4)), 10)
+    nose.tools.assert_true(c._inspect_armed('mem_write'))
+
+    # breakpoints only fire at the time they were registered for
+    fired = [ ]
+    s.inspect.b('reg_write', when=BP_AFTER, action=lambda state: fired.append(BP_AFTER))
+    s.inspect.b('reg_write', when=BP_BEFORE, action=lambda state: fired.append(BP_BEFORE))
+    s.regs.rax = 1
+    nose.tools.assert_equal(fired, [ BP_BEFORE, BP_AFTER ])
+
+    # merging combines the armed events
+    m, _, _ = c.merge(s)
+    nose.tools.assert_true(m._inspect_armed('mem_write'))
+    nose.tools.assert_true(m._inspect_armed('reg_write'))
+
 if __name__ == '__main__':
     test_inspect()
+    test_inspect_armed()
     test_inspect_concretization()
     test_inspect_exit()
     test_inspect_syscall()
@@ -0,0 +1,48 @@
+import random
+
+import nose
+
+from angr.analyses.forward_analysis import ListJobQueue, HeapJobQueue
+from angr.analyses.forward_analysis.job_info import JobInfo
+
+
+def _run_queue_ops(key):
+    random.seed(0x1337)
+
+    list_queue = ListJobQueue(key=key)
+    heap_queue = HeapJobQueue(key=key)
+
+    for _ in range(2000):
+        r = random.random()
+        if r < 0.5:
+            job_info = JobInfo(random.randrange(50), random.randrange(1000))
+            list_queue.add(job_info)
+            heap_queue.add(job_info)
+        elif r < 0.7 and list_queue:
+            nose.tools.assert_is(list_queue.popleft(), heap_queue.popleft())
+        elif r < 0.9:
+            job_info = JobInfo(random.randrange(50), 0)
+            nose.tools.assert_equal(job_info in list_queue, job_info in heap_queue)
+            if job_info in list_queue:
+                list_queue.remove(job_info)
+                heap_queue.remove(job_info)
+        else:
+            k = random.randrange(50)
+            nose.tools.assert_equal(list_queue.remove_if(lambda j: j.key == k),
+                                    heap_queue.remove_if(lambda j: j.key == k))
+
+        nose.tools.assert_equal(len(list_queue), len(heap_queue))
+        nose.tools.assert_equal([ id(j) for j in list_queue ], [ id(j) for j in heap_queue ])
+
+
+def test_heap_job_queue_ordered():
+    _run_queue_ops(lambda job_info: job_info.job % 10)
+
+
+def test_heap_job_queue_fifo():
+    _run_queue_ops(None)
+
+
+if __name__ == "__main__":
+    test_heap_job_queue_ordered()
+    test_heap_job_queue_fifo()
@@ -1,10 +1,12 @@
 import time
 import os
 
+import archinfo
 import claripy
+import cle
 import nose
 
-from angr.storage.paged_memory import SimPagedMemory
+from angr.storage.paged_memory import SimPagedMemory, PermissionMapIndex
 from angr import SimState, SIM_PROCEDURES
 from angr import options as o
 from angr.state_plugins import SimSystemPosix, SimLightRegisters
@@ -603,6 +605,55 @@ def test_paged_memory_membacker_equal_size():
     simmem = SimPagedMemory(memory_backer=membacker, page_size=len(membacker))
     simmem[0] #pylint:disable=pointless-statement
 
+def test_paged_memory_branch():
+    s = SimState(arch='AMD64')
+    for i in range(0x400):
+        s.memory.store(0x10000000 + i * 0x1000, b'A')
+
+    s2 = s.copy()
+    s2.memory.store(0x10000000, b'B')
+    s2.memory.store(0x20000000, b'C')
+    s.memory.store(0x10001000, b'D')
+
+    assert s.solver.eval(s.memory.load(0x10000000, 1), cast_to=bytes) == b'A'
+    assert s.solver.eval(s.memory.load(0x10001000, 1), cast_to=bytes) == b'D'
+    assert s2.solver.eval(s2.memory.load(0x10000000, 1), cast_to=bytes) == b'B'
+    assert s2.solver.eval(s2.memory.load(0x10001000, 1), cast_to=bytes) == b'A'
+    assert s2.solver.eval(s2.memory.load(0x20000000, 1), cast_to=bytes) == b'C'
+    assert 0x20000000 // 0x1000 not in s.memory.mem._pages
+    assert len(s2.memory.mem._pages) == len(s.memory.mem._pages) + 1
+
+def test_permission_map_index():
+    permission_map = {
+        (0x1000, 0x3000): 5,
+        (0x8000, 0x9000): 3,
+        (0x2000, 0x10000): 1,
+    }
+    index = PermissionMapIndex(permission_map)
+
+    assert index.lookup(0xfff) is None
+    assert index.lookup(0x1000) == 5
+    assert index.lookup(0x2fff) == 5
+    assert index.lookup(0x3000) == 1
+    assert index.lookup(0x8800) == 3
+    assert index.lookup(0xffff) == 1
+    assert index.lookup(0x10000) is None
+
+def test_permission_map_unbacked_pages():
+    backer = cle.Clemory(archinfo.ArchAMD64(), root=True)
+    backer.add_backer(0x10000, bytearray(b'A' * 0x1000))
+    # like .bss, [0x11000, 0x13000) has a permission entry but no backer bytes
+    s = SimState(arch='AMD64', memory_backer=backer, permissions_backer=(False, { (0x10000, 0x13000): 1 }))
+
+    # initialize all the pages at once, then create the unbacked ones
+    s.memory.load(0x10000, 0x3000)
+    s.memory.store(0x11000, b'B')
+    s.memory.store(0x12000, b'C')
+
+    for addr in (0x10000, 0x11000, 0x12000):
+        nose.tools.assert_equal(s.solver.eval(s.memory.permissions(addr)), 1)
+    nose.tools.assert_equal(s.solver.eval(s.memory.load(0x10000, 1), cast_to=bytes), b'A')
+
 def test_load_bytes():
     s = SimState(arch='AMD64')
     asdf = s.solver.BVS('asdf', 0x1000*8)
@@ -740,5 +791,8 @@ if __name__ == '__main__':
     test_registers()
     test_concrete_memset()
     test_paged_memory_membacker_equal_size()
+    test_paged_memory_branch()
+    test_permission_map_index()
+    test_permission_map_unbacked_pages()
     test_underconstrained()
     test_hex_dump()
@@ -0,0 +1,54 @@
+import os
+
+import nose
+
+import angr
+
+location = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'binaries', 'tests')
+
+
+def test_process_pool():
+    p = angr.Project(os.path.join(location, 'x86_64', 'fauxware'), auto_load_libs=False)
+
+    sequential = p.factory.simulation_manager()
+    sequential.run()
+
+    parallel = p.factory.simulation_manager()
+    tech = parallel.use_technique(angr.exploration_techniques.ProcessPool(workers=2))
+    parallel.run()
+    tech.shutdown()
+
+    nose.tools.assert_equal(len(parallel.deadended), len(sequential.deadended))
+    nose.tools.assert_equal(sorted(s.posix.dumps(1) for s in parallel.deadended),
+                            sorted(s.posix.dumps(1) for s in sequential.deadended))
+
+    # successors stay linked to the histories of their parents in this process
+    for s in parallel.deadended:
+        nose.tools.assert_equal(s.history.depth, len(list(s.history.parents)))
+
+
+def _broken_project_factory():
+    raise Exception("no project for you")
+
+
+def test_process_pool_worker_failure():
+    p = angr.Project(os.path.join(location, 'x86_64', 'fauxware'), auto_load_libs=False)
+
+    sequential = p.factory.simulation_manager()
+    sequential.run()
+
+    # all workers die while starting up, the states are stepped in this process instead of getting lost
+    parallel = p.factory.simulation_manager()
+    tech = parallel.use_technique(angr.exploration_techniques.ProcessPool(workers=2, min_states=1,
+                                                                          project_factory=_broken_project_factory))
+    parallel.run()
+    tech.shutdown()
+
+    nose.tools.assert_is_none(tech.executor)
+    nose.tools.assert_equal(sorted(s.posix.dumps(1) for s in parallel.deadended),
+                            sorted(s.posix.dumps(1) for s in sequential.deadended))
+
+
+if __name__ == "__main__":
+    test_process_pool()
+    test_process_pool_worker_failure()
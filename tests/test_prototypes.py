@@ -41,9 +41,39 @@ def test_find_prototype():
     nose.tools.assert_equal(arg_locs[1].reg_name, 'rsi')
 
 
+def test_lazy_library_definitions():
+    libc = angr.SIM_LIBRARIES['libc.so.6']
+    nose.tools.assert_is_instance(libc.prototypes['strcpy'], angr.sim_type.SimTypeFunction)
+    nose.tools.assert_true(libc.has_prototype('strcmp'))
+    nose.tools.assert_is(angr.SIM_LIBRARIES['libc.so'], libc)
+
+    kernel32 = angr.SIM_LIBRARIES['kernel32.dll']
+    nose.tools.assert_equal(len(kernel32.prototypes['CreateFileA'].args), 7)
+    nose.tools.assert_is_instance(kernel32.prototypes['GetTickCount64'].returnty, angr.sim_type.SimTypeLongLong)
+
+    # copies build their own prototypes
+    lib = angr.procedures.definitions.SimLibrary()
+    lib.set_prototype_loader(lambda: { 'foo': angr.sim_type.SimTypeFunction((), angr.sim_type.SimTypeInt()) })
+    other = lib.copy()
+    nose.tools.assert_in('foo', other.prototypes)
+    nose.tools.assert_is_not(other.prototypes['foo'], lib.prototypes['foo'])
+
+    # unknown names are a miss that does not load any definitions
+    libraries = angr.procedures.definitions._SimLibraries(os.path.dirname(angr.procedures.definitions.__file__))
+    nose.tools.assert_not_in('no_such_library.so', libraries)
+    nose.tools.assert_false(libraries._all_loaded)
+    nose.tools.assert_equal(libraries._library_modules['msvcr120.dll'], 'msvcr')
+    nose.tools.assert_equal(libraries._library_modules['ld-linux-x86-64.so.2'], 'linux_loader')
+    nose.tools.assert_not_in('no_such_library.so', angr.SIM_LIBRARIES)
+
+    # iterating loads all definitions
+    nose.tools.assert_in('cgcabi_tracer', set(angr.SIM_LIBRARIES))
+
+
 def main():
     test_find_prototype()
     test_function_prototype()
+    test_lazy_library_definitions()
 
 if __name__ == "__main__":
     main()
@@ -9,11 +9,15 @@ import random
 from unittest import TestCase
 import nose
 
+import networkx
+
 import ailment
 import angr
 import archinfo
+from angr.analyses.code_location import CodeLocation
 from angr.analyses.reaching_definitions.atoms import GuardUse, Tmp, Register
 from angr.analyses.reaching_definitions.constants import OP_BEFORE, OP_AFTER
+from angr.analyses.reaching_definitions.dataset import DataSet
 from angr.analyses.reaching_definitions.live_definitions import LiveDefinitions
 from angr.analyses.reaching_definitions.subject import Subject, SubjectType
 from angr.block import Block
@@ -287,6 +291,41 @@ class LiveDefinitionsTest(TestCase):
         nose.tools.assert_equals(rtoc_definition_value, rtoc_value)
 
 
+    def test_copied_live_definitions_are_independent(self):
+        class _MockAnalysis:
+            def __init__(self):
+                self.current_codeloc = None
+                self.codeloc_uses = set()
+                self.def_use_graph = networkx.DiGraph()
+
+        arch = archinfo.ArchAMD64()
+        live_definition = LiveDefinitions(
+            arch=arch, subject=self._MockFunctionSubject(), analysis=_MockAnalysis()
+        )
+        rax = Register(arch.registers['rax'][0], arch.bytes)
+        rbx = Register(arch.registers['rbx'][0], arch.bytes)
+        first_def = live_definition.kill_and_add_definition(rax, CodeLocation(0x42, 0), DataSet(1, arch.bits))
+        live_definition.add_use(rax, CodeLocation(0x42, 1))
+
+        copied = live_definition.copy()
+        # the initial definitions are carried over instead of being recomputed
+        nose.tools.assert_equal(copied.get_sp(), arch.initial_sp)
+
+        second_def = copied.kill_and_add_definition(rax, CodeLocation(0x43, 0), DataSet(2, arch.bits))
+        copied.kill_and_add_definition(rbx, CodeLocation(0x43, 1), DataSet(3, arch.bits))
+        copied.add_use(rax, CodeLocation(0x43, 2))
+        live_definition.add_use(rax, CodeLocation(0x42, 2))
+
+        nose.tools.assert_equal(live_definition.register_definitions.get_objects_by_offset(rax.reg_offset),
+                                {first_def})
+        nose.tools.assert_equal(live_definition.register_definitions.get_objects_by_offset(rbx.reg_offset), set())
+        nose.tools.assert_equal(copied.register_definitions.get_objects_by_offset(rax.reg_offset), {second_def})
+        nose.tools.assert_equal(live_definition.register_uses.get_uses(first_def),
+                                {CodeLocation(0x42, 1), CodeLocation(0x42, 2)})
+        nose.tools.assert_equal(copied.register_uses.get_uses(first_def), {CodeLocation(0x42, 1)})
+        nose.tools.assert_equal(copied.register_uses.get_uses(second_def), {CodeLocation(0x43, 2)})
+
+
     def test_get_the_sp_from_a_reaching_definition(self):
         binary = os.path.join(TESTS_LOCATION, 'x86_64', 'all')
         project = angr.Project(binary, auto_load_libs=False)
@@ -298,6 +298,74 @@ def test_bypass_errored_irstmt():
     nose.tools.assert_equal(len(simgr.errored), 0)
     nose.tools.assert_equal(len(simgr.active), 1)
 
+def test_solver_batch_api():
+    s = SimState(arch="AMD64")
+
+    x = s.solver.BVS('x', 32)
+    y = s.solver.BVS('y', 32)
+    s.add_constraints(x + y == 10, x > 3, x < 6)
+
+    values = s.solver.eval_many([ x, y, s.solver.BVV(7, 32), x + y ])
+    nose.tools.assert_in(values[0], (4, 5))
+    nose.tools.assert_equal(values[0] + values[1], 10)
+    nose.tools.assert_equal(values[2:], [ 7, 10 ])
+    nose.tools.assert_equal(s.solver.eval_many([ x ], cast_to=bytes, extra_constraints=(x == 4,)),
+                            [ b'\x00\x00\x00\x04' ])
+    nose.tools.assert_raises(angr.errors.SimUnsatError, s.solver.eval_many, [ x ], extra_constraints=(x == 7,))
+
+    nose.tools.assert_equal(s.solver.satisfiable_many([ x == 4, (x == 5, y == 5), x == 6, [ ] ]),
+                            [ True, True, False, True ])
+    nose.tools.assert_equal(s.solver.satisfiable_many([ ]), [ ])
+
+    s.add_constraints(x == 7)
+    nose.tools.assert_equal(s.solver.satisfiable_many([ x == 7, y == 3 ]), [ False, False ])
+
+def test_solver_result_cache():
+    p = angr.Project(os.path.join(binaries_base, "tests", "x86_64", "fauxware"), auto_load_libs=False,
+                     solver_cache_size=2)
+    cache = p.solver_cache
+    s1 = p.factory.blank_state()
+    s2 = p.factory.blank_state()
+
+    x = s1.solver.BVS('x', 32)
+    for s in (s1, s2):
+        s.add_constraints(x > 3, x < 6)
+
+    # the second state asks the same question, with the same constraints
+    nose.tools.assert_equal(s1.solver.max(x), 5)
+    nose.tools.assert_equal(s2.solver.max(x), 5)
+    nose.tools.assert_equal((cache.hits, cache.misses), (1, 1))
+
+    # the order of the constraints does not matter, but their content does
+    s3 = p.factory.blank_state()
+    s3.add_constraints(x < 6, x > 3)
+    nose.tools.assert_equal(s3.solver.max(x), 5)
+    s2.add_constraints(x != 5)
+    nose.tools.assert_equal(s2.solver.max(x), 4)
+    nose.tools.assert_equal((cache.hits, cache.misses), (2, 2))
+
+    # so do the query and its extra constraints
+    nose.tools.assert_false(s1.solver.satisfiable(extra_constraints=(x == 6,)))
+    nose.tools.assert_true(s1.solver.satisfiable(extra_constraints=(x == 5,)))
+    nose.tools.assert_equal(s1.solver.eval_upto(x, 3), s3.solver.eval_upto(x, 3))
+    nose.tools.assert_equal((cache.hits, cache.misses), (3, 5))
+    nose.tools.assert_equal(len(cache), 2)
+
+    # approximate queries are never cached
+    s1.solver.satisfiable(exact=False)
+    nose.tools.assert_equal((cache.hits, cache.misses), (3, 5))
+
+    # results are not shared with states that use a different kind of solver
+    s4 = p.factory.blank_state(add_options={angr.options.REPLACEMENT_SOLVER})
+    s4.add_constraints(x > 3, x < 6)
+    nose.tools.assert_equal(s4.solver.max(x), 5)
+    nose.tools.assert_equal((cache.hits, cache.misses), (3, 5))
+
+    cache.clear()
+    nose.tools.assert_equal((len(cache), cache.hit_rate), (0, 0.))
+    nose.tools.assert_is_none(angr.Project(os.path.join(binaries_base, "tests", "x86_64", "fauxware"),
+                                           auto_load_libs=False).solver_cache)
+
 
 if __name__ == '__main__':
     test_state()
@@ -310,3 +378,5 @@ if __name__ == '__main__':
     test_global_condition()
     test_successors_catch_arbitrary_interrupts()
     test_bypass_errored_irstmt()
+    test_solver_batch_api()
+    test_solver_result_cache()
@@ -0,0 +1,92 @@
+import pickle
+
+import nose
+
+from angr import SimState
+
+
+def _make_chain(depth):
+    s = SimState(arch='AMD64')
+    for i in range(depth):
+        h = s.history.make_child()
+        h.recent_bbl_addrs = [ 0x400000 + i * 0x10, 0x400000 + i * 0x10 + 4 ]
+        h.recent_ins_addrs = [ 0x400000 + i * 0x10 ]
+        s.register_plugin('history', h)
+    return s
+
+
+def test_history_len_and_indexing():
+    s = _make_chain(100)
+    bbl_addrs = s.history.bbl_addrs.hardcopy
+
+    nose.tools.assert_equal(len(bbl_addrs), 200)
+    nose.tools.assert_equal(len(s.history.bbl_addrs), 200)
+    nose.tools.assert_equal(len(s.history.ins_addrs), 100)
+    nose.tools.assert_equal(len(s.history.lineage), 101)
+
+    for i in (0, 1, 57, 198, 199, -1, -2, -3, -200):
+        nose.tools.assert_equal(s.history.bbl_addrs[i], bbl_addrs[i])
+    nose.tools.assert_raises(IndexError, lambda: s.history.bbl_addrs[200])
+    nose.tools.assert_raises(IndexError, lambda: s.history.bbl_addrs[-201])
+
+    # copies cache their counts separately
+    h = s.history.copy({})
+    nose.tools.assert_is_not(h._cum_counts, s.history._cum_counts)
+    nose.tools.assert_equal(h._cum_counts, s.history._cum_counts)
+    nose.tools.assert_equal(len(h.bbl_addrs), 200)
+
+
+def test_history_to_array():
+    s = _make_chain(50)
+    arr = s.history.bbl_addrs.to_array()
+
+    nose.tools.assert_equal(arr.typecode, 'Q')
+    nose.tools.assert_equal(list(arr), s.history.bbl_addrs.hardcopy)
+
+
+def test_history_index_after_trim_and_pickle():
+    s = _make_chain(20)
+    nose.tools.assert_equal(len(s.history.bbl_addrs), 40)
+
+    s2 = pickle.loads(pickle.dumps(s, -1))
+    nose.tools.assert_equal(len(s2.history.bbl_addrs), 40)
+    nose.tools.assert_equal(s2.history.bbl_addrs[5], s.history.bbl_addrs[5])
+
+    s.history.trim()
+    nose.tools.assert_equal(len(s.history.bbl_addrs), 2)
+    nose.tools.assert_equal(s.history.bbl_addrs[0], 0x400000 + 19 * 0x10)
+
+
+def _step(s):
+    c = s.copy()
+    c.register_plugin('history', s.history.make_child())
+    return c
+
+
+def test_common_ancestors():
+    from angr.state_hierarchy import StateHierarchy
+
+    root = SimState(arch='AMD64')
+    x = _step(root)
+    x1, x2 = _step(x), _step(x)
+    y = _step(root)
+    y1 = _step(y)
+    y11 = _step(y1)
+
+    nose.tools.assert_is(x1.history.closest_common_ancestor(x2.history), x.history)
+    nose.tools.assert_is(x1.history.closest_common_ancestor(y11.history), root.history)
+    nose.tools.assert_is(y11.history.closest_common_ancestor(y1.history), y1.history)
+    nose.tools.assert_is_none(x1.history.closest_common_ancestor(SimState(arch='AMD64').history))
+
+    hierarchy = StateHierarchy()
+    nose.tools.assert_equal(hierarchy.most_mergeable([ x1, y11, x2, y ]), ([ x1, x2 ], x.history, [ y11, y ]))
+    # the common history must be a strict ancestor of all merged states
+    nose.tools.assert_equal(hierarchy.most_mergeable([ y, y11 ]), ([ y, y11 ], root.history, [ ]))
+    nose.tools.assert_equal(hierarchy.most_mergeable([ x1, SimState(arch='AMD64') ])[1], None)
+
+
+if __name__ == '__main__':
+    test_history_len_and_indexing()
+    test_history_to_array()
+    test_history_index_after_trim_and_pickle()
+    test_common_ancestors()
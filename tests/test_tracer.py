@@ -1,6 +1,8 @@
+import array
 import os
 import sys
 import logging
+import tempfile
 
 import nose
 import angr
@@ -169,6 +171,25 @@ def test_fauxware():
     nose.tools.assert_true('traced' in simgr.stashes)
 
 
+def test_trace_index():
+    trace = [ 0x400000, 0x400010, 0x400020, 0x400010, 0x400030 ]
+    t = angr.exploration_techniques.Tracer(trace=trace)
+
+    nose.tools.assert_equal(list(t._trace), trace)
+    nose.tools.assert_equal(t._trace_index(0x400010, 0), 1)
+    nose.tools.assert_equal(t._trace_index(0x400010, 2), 3)
+    nose.tools.assert_raises(ValueError, t._trace_index, 0x400010, 4)
+    nose.tools.assert_raises(ValueError, t._trace_index, 0x500000, 0)
+    nose.tools.assert_equal(t._trace_positions[0x400010], array.array('Q', [ 1, 3 ]))
+
+    with tempfile.NamedTemporaryFile(suffix='.trace') as f:
+        f.write(array.array('Q', trace).tobytes())
+        f.flush()
+        t = angr.exploration_techniques.Tracer(trace=f.name)
+        nose.tools.assert_equal(list(t._trace), trace)
+        nose.tools.assert_equal(t._trace_index(0x400030, 0), 4)
+
+
 def run_all():
     def print_test_name(name):
         print('#' * (len(name) + 8))
@@ -188,6 +188,29 @@ def test_varargs():
     nose.tools.assert_equal(len(sig.arg_names), 1)
     nose.tools.assert_not_in('...', sig._init_str())
 
+def test_parse_type_returns_fresh_objects():
+    # parsed syntax trees are cached, but every call must still return its own types
+    a = angr.types.parse_type('struct cached_s { int x; }')
+    b = angr.types.parse_type('struct   cached_s {  int x; }')
+    nose.tools.assert_is_not(a, b)
+    nose.tools.assert_is_not(a.fields, b.fields)
+    a.fields['y'] = SimTypeChar()
+    nose.tools.assert_equal(len(b.fields), 1)
+
+    defns, _ = angr.types.parse_file('int cached_f(int x);')
+    defns_again, _ = angr.types.parse_file('int cached_f(int x);')
+    nose.tools.assert_is_not(defns['cached_f'], defns_again['cached_f'])
+    nose.tools.assert_equal(defns['cached_f'].arg_names, defns_again['cached_f'].arg_names)
+
+
+def test_parse_type_after_register_types():
+    # the scope that type expressions are parsed in must pick up newly registered typedefs
+    nose.tools.assert_is_instance(angr.types.parse_type('int'), SimTypeInt)
+    angr.types.register_types({'registered_late_t': SimTypeChar()})
+    ty = angr.types.parse_type('registered_late_t *')
+    nose.tools.assert_is_instance(ty, SimTypePointer)
+    nose.tools.assert_is_instance(ty.pts_to, SimTypeChar)
+
 
 if __name__ == '__main__':
     test_type_annotation()
@@ -199,3 +222,5 @@ if __name__ == '__main__':
     test_union_struct_referencing_each_other()
     test_top_type()
     test_arg_names()
+    test_parse_type_returns_fresh_objects()
+    test_parse_type_after_register_types()
@@ -114,6 +114,46 @@ def test_fauxware():
         b'Username: \nPassword: \nWelcome to the admin console, trusted user!\n'
     )))
 
+def test_page_cache():
+    p = angr.Project(os.path.join(test_location, 'binaries', 'tests', 'i386', 'fauxware'), unicorn_page_cache=True)
+    main = p.loader.find_symbol('main').rebased_addr
+
+    # pages stay backed by the loader until they are written to
+    s = p.factory.entry_state()
+    s.memory.load(main, 4)
+    nose.tools.assert_true(s.memory.mem.unchanged_from_backer(main, 4))
+    s2 = s.copy()
+    s2.memory.store(main, b'\xcc')
+    nose.tools.assert_false(s2.memory.mem.unchanged_from_backer(main, 4))
+    nose.tools.assert_true(s.memory.mem.unchanged_from_backer(main, 4))
+
+    cache = p.unicorn_page_cache
+    nose.tools.assert_equal(cache.load(main, 4), p.loader.memory.load(main, 4))
+
+    pg = p.factory.simulation_manager(p.factory.entry_state(add_options=so.unicorn))
+    pg.explore()
+    nose.tools.assert_greater(len(cache), 0)
+    nose.tools.assert_greater(cache.hits, 0)
+
+    # patching the loaded binary needs an explicit invalidation
+    original = p.loader.memory.load(main, 4)
+    p.loader.memory.store(main, b'\xcc')
+    nose.tools.assert_equal(cache.load(main, 4), original)
+    cache.invalidate(main, 1)
+    nose.tools.assert_equal(cache.load(main, 4), b'\xcc' + original[1:])
+    p.loader.memory.store(main, original[:1])
+    cache.invalidate()
+    nose.tools.assert_equal(len(cache), 0)
+    nose.tools.assert_equal(cache.load(main, 4), original)
+
+    # the results are the same as without the cache, which is off by default
+    p_nocache = angr.Project(os.path.join(test_location, 'binaries', 'tests', 'i386', 'fauxware'))
+    nose.tools.assert_is_none(p_nocache.unicorn_page_cache)
+    pg_nocache = p_nocache.factory.simulation_manager(p_nocache.factory.entry_state(add_options=so.unicorn))
+    pg_nocache.explore()
+    nose.tools.assert_equal(sorted(pg.mp_deadended.posix.dumps(1).mp_items),
+                            sorted(pg_nocache.mp_deadended.posix.dumps(1).mp_items))
+
 def test_fauxware_aggressive():
     p = angr.Project(os.path.join(test_location, 'binaries', 'tests', 'i386', 'fauxware'))
     s_unicorn = p.factory.entry_state(
@@ -31,6 +31,20 @@ def run_unique(binary, arch):
     input_found = simgr.active[0].posix.dumps(0)
     nose.tools.assert_true(criteria[binary](input_found))
 
+def test_incremental_similarity():
+    proj = angr.Project(os.path.join(location, 'x86_64', 'veritesting_a'), auto_load_libs=False)
+    simgr = proj.factory.simulation_manager()
+    technique = angr.exploration_techniques.UniqueSearch()
+    simgr.use_technique(technique)
+    simgr.run(n=20)
+
+    states = simgr.deferred + simgr.active
+    nose.tools.assert_greater(len(states), 1)
+    for state_a in states:
+        for state_b in states:
+            nose.tools.assert_almost_equal(technique._incremental_similarity(state_a, state_b),
+                                           angr.exploration_techniques.UniqueSearch.similarity(state_a, state_b))
+
 def test_unique():
     for binary in find:
         for arch in find[binary]:
@@ -39,3 +53,4 @@ def test_unique():
 if __name__ == "__main__":
     for test_func, test_binary, test_arch in test_unique():
         test_func(test_binary, test_arch)
+    test_incremental_similarity()
@@ -63,6 +63,20 @@ def test_veritesting_b():
     for arch in addresses_veritesting_b:
         yield run_veritesting_b, arch
 
+def test_merge_point_order():
+    import networkx
+    from angr.analyses.veritesting import Veritesting
+
+    # two diamonds in a row
+    graph = networkx.DiGraph([ (1, 2), (1, 3), (2, 4), (3, 4), (4, 5), (4, 6), (5, 7), (6, 7) ])
+    order = Veritesting._post_dominance_order(graph, list(networkx.topological_sort(graph)))
+
+    # every node comes before its post-dominators
+    for n in (1, 2, 3):
+        nose.tools.assert_less(order[n], order[4])
+    for n in (4, 5, 6):
+        nose.tools.assert_less(order[n], order[7])
+
 if __name__ == "__main__":
     #logging.getLogger('angr.analyses.veritesting').setLevel(logging.DEBUG)
 
@@ -75,3 +89,4 @@ if __name__ == "__main__":
             test_func(arch_name)
         for test_func, arch_name in test_veritesting_b():
             test_func(arch_name)
+        test_merge_point_order()
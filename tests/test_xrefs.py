@@ -4,7 +4,7 @@ import os
 import nose.tools
 
 import angr
-from angr.knowledge_plugins.xrefs import XRef, XRefType
+from angr.knowledge_plugins.xrefs import XRef, XRefType, XRefManager
 
 test_location = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', 'binaries', 'tests')
 
@@ -55,5 +55,34 @@ def test_lwip_udpecho_bm_the_better_way():
     nose.tools.assert_equal(len(timenow_xrefs), 5)
 
 
+def test_xref_manager_regions_and_copy():
+    xm = XRefManager(None)
+    xm.add_xrefs([
+        XRef(ins_addr=0x400010, dst=0x601000, xref_type=XRefType.Offset),
+        XRef(ins_addr=0x400020, dst=0x601008, xref_type=XRefType.Read),
+        XRef(ins_addr=0x400030, dst=0x602000, xref_type=XRefType.Write),
+    ])
+    # the Read xref replaces the Offset xref with the same instruction address and destination
+    xm.add_xref(XRef(ins_addr=0x400010, dst=0x601000, xref_type=XRefType.Read))
+
+    nose.tools.assert_equal(xm.get_xrefs_by_ins_addr(0x400010),
+                            {XRef(ins_addr=0x400010, dst=0x601000, xref_type=XRefType.Read)})
+    nose.tools.assert_equal({x.ins_addr for x in xm.get_xrefs_by_ins_addr_region(0x400010, 0x400020)},
+                            {0x400010, 0x400020})
+    nose.tools.assert_equal({x.dst for x in xm.get_xrefs_by_dst_region(0x601000, 0x601fff)}, {0x601000, 0x601008})
+    nose.tools.assert_equal(xm.get_xrefs_by_dst_region(0x603000, 0x604000), set())
+
+    # modifying a copy must not affect the original, and vice versa
+    xm_copy = xm.copy()
+    xm_copy.add_xref(XRef(ins_addr=0x400020, dst=0x601010, xref_type=XRefType.Read))
+    xm.add_xref(XRef(ins_addr=0x400040, dst=0x601000, xref_type=XRefType.Write))
+
+    nose.tools.assert_equal(len(xm.get_xrefs_by_ins_addr(0x400020)), 1)
+    nose.tools.assert_equal(len(xm_copy.get_xrefs_by_ins_addr(0x400020)), 2)
+    nose.tools.assert_equal(len(xm.get_xrefs_by_dst_region(0x601000, 0x601fff)), 3)
+    nose.tools.assert_equal(len(xm_copy.get_xrefs_by_dst_region(0x601000, 0x601fff)), 3)
+    nose.tools.assert_equal(xm_copy.get_xrefs_by_ins_addr_region(0x400040, 0x400040), set())
+
+
 if __name__ == "__main__":
     test_lwip_udpecho_bm()